@@ -1,4 +1,5 @@
-from collections import defaultdict
+from collections import defaultdict, namedtuple, OrderedDict
+from collections.abc import Mapping
 import numbers
 import warnings
 
@@ -139,4 +140,105 @@ class Variable(Argument):
     """ Variable type."""
     # Variable index to be assigned to generated nameless variables
     _argument_name = 'var'
-    __slots__ = ()
\ No newline at end of file
+    __slots__ = ()
+
+ParameterSettings = namedtuple('ParameterSettings', ['value', 'min', 'max', 'fixed'])
+
+
+class ParameterState(Mapping):
+    """
+    Immutable snapshot of the ``value``, ``min``, ``max`` and ``fixed``
+    attributes of parameters, as a mapping from each
+    :class:`~symfit.core.argument.Parameter` to its
+    :class:`~symfit.core.argument.ParameterSettings`.
+
+    :class:`~symfit.core.argument.Parameter` objects are shared by every fit
+    of the model they are part of. A fit given a state uses that instead, so
+    several fits of the same model can have different initial guesses and
+    bounds, and can run concurrently::
+
+        state = ParameterState(model.params).replace(a, value=2.0, min=0)
+        fit = Fit(model, x=xdata, y=ydata, parameter_state=state)
+    """
+    def __init__(self, params):
+        """
+        :param params: iterable of :class:`~symfit.core.argument.Parameter`
+            whose current settings are recorded, or a mapping from
+            parameters to their :class:`~symfit.core.argument.ParameterSettings`.
+        """
+        if isinstance(params, Mapping):
+            settings = ((param, ParameterSettings(*setting))
+                        for param, setting in params.items())
+        else:
+            settings = ((param, parameter_settings(param)) for param in params)
+        self._settings = OrderedDict(settings)
+
+    def __getitem__(self, param):
+        return self._settings[param]
+
+    def __iter__(self):
+        return iter(self._settings)
+
+    def __len__(self):
+        return len(self._settings)
+
+    def __repr__(self):
+        return '{}({})'.format(
+            self.__class__.__name__,
+            ', '.join('{}={}'.format(param.name, tuple(setting))
+                      for param, setting in self._settings.items())
+        )
+
+    def replace(self, param, **settings):
+        """
+        :param param: :class:`~symfit.core.argument.Parameter` to change.
+        :param settings: new ``value``, ``min``, ``max`` or ``fixed``.
+        :return: new :class:`~symfit.core.argument.ParameterState` with the
+            settings of ``param`` changed.
+        """
+        new_settings = OrderedDict(self._settings)
+        new_settings[param] = new_settings[param]._replace(**settings)
+        return self.__class__(new_settings)
+
+    @property
+    def params(self):
+        """
+        :return: list of all parameters.
+        """
+        return list(self._settings)
+
+    @property
+    def free_params(self):
+        """
+        :return: list of the parameters which are not fixed.
+        """
+        return [param for param, setting in self._settings.items()
+                if not setting.fixed]
+
+    @property
+    def initial_guesses(self):
+        """
+        :return: list of the values of the free parameters.
+        """
+        return [self._settings[param].value for param in self.free_params]
+
+    @property
+    def bounds(self):
+        """
+        :return: list of ``(min, max)`` for the free parameters.
+        """
+        return [(self._settings[param].min, self._settings[param].max)
+                for param in self.free_params]
+
+
+def parameter_settings(param, state=None):
+    """
+    :param param: :class:`~symfit.core.argument.Parameter`.
+    :param state: Optionally, a
+        :class:`~symfit.core.argument.ParameterState`.
+    :return: :class:`~symfit.core.argument.ParameterSettings` of ``param`` in
+        ``state``, or its current settings if ``state`` does not include it.
+    """
+    if state is not None and param in state:
+        return state[param]
+    return ParameterSettings(param.value, param.min, param.max, param.fixed)
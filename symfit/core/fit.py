@@ -1,21 +1,29 @@
-from collections import OrderedDict
+from collections import OrderedDict, namedtuple
 from collections.abc import Sequence
+from itertools import repeat
+import copy
 import sys
 
 import sympy
 import numpy as np
+from scipy.linalg import cho_factor, cho_solve
+import scipy.stats
 
-from symfit.core.argument import Variable
-from .support import keywordonly, key2str
+from symfit.core.argument import Variable, ParameterState, parameter_settings
+from .support import keywordonly, key2str, partial
 from .minimizers import (
     BFGS, SLSQP, LBFGSB, BaseMinimizer, GradientMinimizer, HessianMinimizer,
-    ConstrainedMinimizer, MINPACK, ChainedMinimizer, BasinHopping
+    ConstrainedMinimizer, MINPACK, ChainedMinimizer, BasinHopping,
+    ScipyMinimize, LinearLeastSquares, VariableProjection,
+    HessianProductMinimizer, MultiStart, RecursiveLeastSquares,
+    _objective_value
 )
 from .objectives import (
     LeastSquares, BaseObjective, MinimizeModel, VectorLeastSquares,
     LogLikelihood, HessianObjectiveJacApprox
 )
 from .models import BaseModel, Model, BaseNumericalModel, CallableModel
+from .instrumentation import Progress, _nested_minimizers
 
 if sys.version_info >= (3,0):
     import inspect as inspect_sig
@@ -28,6 +36,10 @@ class TakesData(object):
     of linking the provided data to variables. The allowed variables are extracted
     from the model.
     """
+    # Optionally, a ParameterState to use instead of the settings of the
+    # parameters of the model.
+    parameter_state = None
+
     @keywordonly(absolute_sigma=None)
     def __init__(self, model, *ordered_data, **named_data):
         """
@@ -54,7 +66,32 @@ class TakesData(object):
             self.model = Model(model)
 
         # Handle ordered_data and named_data according to the allowed names.
-        signature = self._make_signature()
+        self._data_signature = self._make_signature()
+        self.data, original_data = self._bind_data(*ordered_data, **named_data)
+
+        # If user gives a preference, use that. Otherwise, use True if at least one sigma is
+        # given, False if no sigma is given.
+        if absolute_sigma is not None:
+            self.absolute_sigma = absolute_sigma
+        else:
+            for sigma in self.sigma_data:
+                # Check if the user provided sigmas in the original data.
+                # If so, interpret sigmas as measurement errors
+                if original_data[sigma.name] is not None:
+                    self.absolute_sigma = True
+                    break
+            else:
+                self.absolute_sigma = False
+
+    def _bind_data(self, *ordered_data, **named_data):
+        """
+        Assign the data to the variables of the model, see :meth:`__init__`.
+        Also sets ``self.sigmas_provided``.
+
+        :return: the data as a dict with variables as keys, and the data as
+            provided by name.
+        """
+        signature = self._data_signature
         try:
             bound_arguments = signature.bind(*ordered_data, **named_data)
         except TypeError as err:
@@ -75,46 +112,36 @@ class TakesData(object):
                 bound_arguments.arguments[param.name] = param.default
 
         original_data = bound_arguments.arguments   # ordereddict of the data
-        self.data = original_data.copy()
+        data = original_data.copy()
         for var in self.model.vars:
             # Identify data by their Variable, not their variable names.
             # But anything that is not a part of model should not be thrown away
-            if var.name in self.data:
-                self.data[var] = self.data.pop(var.name)
+            if var.name in data:
+                data[var] = data.pop(var.name)
 
         # Change the type to array if no array operations are supported.
         # We don't want to break duck-typing, hence the try-except.
-        for var, dataset in self.data.items():
+        for var, dataset in data.items():
             try:
                 dataset**2
             except TypeError:
                 if dataset is not None:
-                    self.data[var] = np.array(dataset)
-        self.sigmas_provided = any(value is not None for value in self.sigma_data.values())
+                    data[var] = np.array(dataset)
+        sigma_vars = [self.model.sigmas[var] for var in self.model.dependent_vars
+                      if self.model.sigmas[var] in data]
+        self.sigmas_provided = any(data[sigma] is not None for sigma in sigma_vars)
 
         # Replace sigmas that are constant by an array of that constant
-        for var, sigma in zip(self.dependent_data, self.sigma_data):
+        dependent_vars = [var for var in self.model.dependent_vars if var in data]
+        for var, sigma in zip(dependent_vars, sigma_vars):
             try:
-                iter(self.data[sigma])
+                iter(data[sigma])
             except TypeError:  # not iterable
-                if self.data[var] is not None and self.data[sigma] is None:
-                    self.data[sigma] = np.ones(self.data[var].shape)
-                elif self.data[var] is not None:
-                    self.data[sigma] *= np.ones(self.data[var].shape)
-
-        # If user gives a preference, use that. Otherwise, use True if at least one sigma is
-        # given, False if no sigma is given.
-        if absolute_sigma is not None:
-            self.absolute_sigma = absolute_sigma
-        else:
-            for sigma in self.sigma_data:
-                # Check if the user provided sigmas in the original data.
-                # If so, interpret sigmas as measurement errors
-                if original_data[sigma.name] is not None:
-                    self.absolute_sigma = True
-                    break
-            else:
-                self.absolute_sigma = False
+                if data[var] is not None and data[sigma] is None:
+                    data[sigma] = np.ones(data[var].shape)
+                elif data[var] is not None:
+                    data[sigma] *= np.ones(data[var].shape)
+        return data, original_data
 
     def _make_signature(self):
         """
@@ -219,7 +246,8 @@ class TakesData(object):
         """
         :return: Initial guesses for every parameter.
         """
-        return np.array([param.value for param in self.model.params])
+        return np.array([parameter_settings(param, self.parameter_state).value
+                         for param in self.model.params])
 
 
 class HasCovarianceMatrix(TakesData):
@@ -243,69 +271,300 @@ class HasCovarianceMatrix(TakesData):
             if hess is None:
                 return hess
 
-        try:
-            # The squeezing to a matrix is required for MinimizeModel objectives
-            hess_inv = np.linalg.inv(np.atleast_2d(np.squeeze(hess)))
-        except np.linalg.LinAlgError:
+        # The squeezing to a matrix is required for MinimizeModel objectives
+        hess_inv = _inverse_hessian(np.atleast_2d(np.squeeze(hess)))
+        if hess_inv is None:
             return None
+        return self._scale_covariance_matrix(hess_inv, best_fit_params,
+                                             objective)
+
+    def _scale_covariance_matrix(self, hess_inv, best_fit_params, objective):
+        """
+        Turn the inverse Hessian of ``objective`` into a covariance matrix.
 
+        :param hess_inv: Inverse Hessian of ``objective``.
+        :param best_fit_params: ``dict`` of best fit parameters.
+        :param objective: Objective that was minimized.
+        :return: covariance matrix.
+        """
         if isinstance(objective, LeastSquares):
             # Calculate the covariance for a least squares method.
             # https://www8.cs.umu.se/kurser/5DA001/HT07/lectures/lsq-handouts.pdf
-            # Residual sum of squares
-            rss = 2 * objective(**key2str(best_fit_params))
-            # Degrees of freedom
-            raw_dof = np.sum([np.product(shape) for shape in self.data_shapes[1]])
-            dof = raw_dof - len(self.model.params)
-            if self.absolute_sigma:
-                # When interpreting as measurement error, we do not rescale.
-                s2 = 1
-            else:
-                s2 = rss / dof
-            cov_mat = s2 * hess_inv
-            return cov_mat
+            minimum = objective(**key2str(best_fit_params))
+            return self._likelihood_scale(objective, minimum) * hess_inv
         else:
             # The inverse hessian is the covariance matrix for Loglikelihood and
             # also for objectives in general.
             return hess_inv
 
-    def covariance_matrix(self, best_fit_params):
+    def _likelihood_scale(self, objective, minimum):
+        """
+        :param objective: Objective that was minimized.
+        :param minimum: minimum of ``objective``, on the scale of
+            :class:`~symfit.core.objectives.LeastSquares`.
+        :return: the factor by which the objective has to be divided to be a
+            negative log-likelihood. For least squares with relative sigma,
+            this is the reduced :math:`\\chi^2` used to scale the covariance
+            matrix. Otherwise it is 1.
+        """
+        if (isinstance(objective, (LeastSquares, VectorLeastSquares))
+                and not self.absolute_sigma):
+            # Residual sum of squares over the degrees of freedom.
+            raw_dof = np.sum([np.prod(shape) for shape in self.data_shapes[1]])
+            return 2 * minimum / (raw_dof - len(self.model.params))
+        # When interpreting sigma as measurement error, we do not rescale.
+        return 1
+
+    def _gauss_newton_covariance_matrix(self, best_fit_params):
+        """
+        Covariance matrix from the Hessian of the objective with the Hessian of
+        the model set to zero, e.g. :math:`J^T W J` for least squares. Only the
+        Jacobian of the model is evaluated.
+        """
+        # VectorLeastSquares should be turned into a LeastSquares for
+        # cov matrix calculation
+        if self.objective.__class__ is VectorLeastSquares:
+            base = LeastSquares
+        else:
+            base = self.objective.__class__
+        objective = _hessian_approximation(base)(self.objective.model,
+                                                 self.objective.data)
+        objective.parameter_state = self.objective.parameter_state
+        return self._covariance_matrix(best_fit_params, objective=objective)
+
+    def _minimizer_covariance_matrix(self, best_fit_params, hess_inv):
+        """
+        Covariance matrix from the inverse Hessian as found by the minimizer.
+
+        :param hess_inv: inverse Hessian in the free parameters, as a matrix or
+            as a :class:`~scipy.sparse.linalg.LinearOperator`.
+        :return: covariance matrix, with zero (co)variance for fixed
+            parameters. ``None`` if ``hess_inv`` is not usable.
+        """
+        if hasattr(hess_inv, 'todense'):
+            hess_inv = hess_inv.todense()
+        free_params = self.objective.free_params
+        free = [p in free_params for p in self.model.params]
+        try:
+            hess_inv = np.asarray(hess_inv, dtype=float).reshape(
+                (np.sum(free), np.sum(free))
+            )
+        except (TypeError, ValueError):
+            return None
+
+        full_hess_inv = np.zeros((len(free), len(free)))
+        full_hess_inv[np.ix_(free, free)] = hess_inv
+        # The VectorLeastSquares used by MINPACK represents the same problem.
+        objective = self.objective
+        if objective.__class__ is VectorLeastSquares:
+            objective = LeastSquares(objective.model, objective.data)
+            objective.parameter_state = self.objective.parameter_state
+        return self._scale_covariance_matrix(full_hess_inv, best_fit_params,
+                                             objective)
+
+    @keywordonly(strategy='exact', hess_inv=None)
+    def covariance_matrix(self, best_fit_params, **kwargs):
         """
         Given best fit parameters, this function finds the covariance matrix.
         This matrix gives the (co)variance in the parameters.
 
         :param best_fit_params: ``dict`` of best fit parameters as given by .best_fit_params()
+        :param strategy: How to obtain the Hessian of the objective. One of:
+
+            - ``'exact'`` (default): evaluate the full Hessian. If it cannot
+              be computed or inverted, fall back to ``'gauss-newton'``.
+            - ``'gauss-newton'``: approximate the Hessian of the model by zero,
+              such that only the Jacobian of the model is needed. E.g.
+              :math:`J^T W J` for least squares.
+            - ``'from-minimizer'``: use ``hess_inv``, the inverse Hessian
+              found by the minimizer, falling back to ``'gauss-newton'`` if
+              it is not available. Depending on the minimizer this can be
+              a rough approximation.
+        :param hess_inv: inverse Hessian with respect to the free parameters,
+            as found by the minimizer. Used by ``'from-minimizer'``.
         :return: covariance matrix.
         """
-        cov_matrix = self._covariance_matrix(best_fit_params,
-                                             objective=self.objective)
+        strategy = kwargs.pop('strategy')
+        hess_inv = kwargs.pop('hess_inv')
+        if strategy not in ('exact', 'gauss-newton', 'from-minimizer'):
+            raise ValueError('Unknown covariance strategy {!r}, choose from '
+                             '\'exact\', \'gauss-newton\' or '
+                             '\'from-minimizer\'.'.format(strategy))
+
+        cov_matrix = None
+        if strategy == 'exact':
+            cov_matrix = self._covariance_matrix(best_fit_params,
+                                                 objective=self.objective)
+        elif strategy == 'from-minimizer' and hess_inv is not None:
+            cov_matrix = self._minimizer_covariance_matrix(best_fit_params,
+                                                           hess_inv)
         if cov_matrix is None:
             # If the covariance matrix could not be computed we try again by
             # approximating the hessian with the jacobian.
-
-            # VectorLeastSquares should be turned into a LeastSquares for
-            # cov matrix calculation
-            if self.objective.__class__ is VectorLeastSquares:
-                base = LeastSquares
-            else:
-                base = self.objective.__class__
-
-            class HessApproximation(base, HessianObjectiveJacApprox):
-                """
-                Class which impersonates ``base``, but which returns zeros
-                for the models Hessian. This will effectively result in the
-                calculation of the approximate Hessian by calculating
-                outer(J.T, J) when calling ``base.eval_hessian``.
-                """
-
-            objective = HessApproximation(self.objective.model,
-                                          self.objective.data)
-            cov_matrix = self._covariance_matrix(best_fit_params,
-                                                 objective=objective)
+            cov_matrix = self._gauss_newton_covariance_matrix(best_fit_params)
 
         return cov_matrix
 
 
+class IncrementalFit(object):
+    """
+    Fit to data which keeps growing, such as a stream of measurements. New
+    samples are added with :meth:`append`, and every :meth:`execute` starts
+    from the result of the previous one::
+
+        fit = IncrementalFit(model, x=xdata, y=ydata)
+        fit_result = fit.execute()
+        for xdata, ydata in stream:
+            fit_result = fit.append(x=xdata, y=ydata).execute()
+
+    The data is kept in buffers which grow geometrically, so appending only
+    copies the new samples. Least-squares problems which are linear in their
+    parameters, see :attr:`~symfit.core.models.GradientModel.is_linear`, are
+    solved with :class:`~symfit.core.minimizers.RecursiveLeastSquares`, which
+    updates its factorization with every append. The cost of such a refit is
+    then linear in the number of new samples, apart from evaluating the model
+    once for the goodness of fit qualifiers.
+    """
+    def __init__(self, model, *ordered_data, **named_data):
+        """
+        :param model: (dict of) sympy expression(s) or ``Model`` object.
+        :param ordered_data: initial data, see :class:`~symfit.core.fit.Fit`.
+        :param named_data: initial data by name, and any other keyword
+            arguments to :class:`~symfit.core.fit.Fit`.
+        """
+        self.fit = Fit(model, *ordered_data, **named_data)
+        #: :class:`~symfit.core.fit_results.FitResults` of the last
+        #: :meth:`execute`.
+        self.fit_result = None
+        if type(self.fit.minimizer) is LinearLeastSquares:
+            self.fit.minimizer = self.fit._init_minimizer(RecursiveLeastSquares)
+        if isinstance(self.fit.minimizer, RecursiveLeastSquares):
+            self.fit.minimizer.update(self.fit.objective)
+
+        self._buffers = {}
+        self._sizes = {}
+        for var, dataset in self.fit.data.items():
+            if dataset is not None and np.ndim(dataset) > 0:
+                self._buffers[var] = np.array(dataset)
+                self._sizes[var] = len(dataset)
+        self.fit._set_data(self._views())
+
+    def append(self, *ordered_data, **named_data):
+        """
+        Append new samples to the data, given in the same way as to
+        :class:`~symfit.core.fit.Fit`.
+
+        :return: this fit.
+        """
+        new_data = self.fit._bind_new_data(*ordered_data, **named_data)
+        for var, dataset in new_data.items():
+            if dataset is None:
+                continue
+            elif var not in self._buffers:
+                raise ValueError('Only data with a first dimension can be '
+                                 'appended to, which {} has not.'.format(var))
+            self._append(var, dataset)
+        self.fit._set_data(self._views())
+
+        if isinstance(self.fit.minimizer, RecursiveLeastSquares):
+            objective = LeastSquares(self.fit.model, new_data)
+            objective.parameter_state = self.fit.objective.parameter_state
+            self.fit.minimizer.update(objective)
+        return self
+
+    def execute(self, **minimize_options):
+        """
+        Fit to all the data appended so far, starting from the previous
+        result.
+
+        :param minimize_options: passed on to
+            :meth:`~symfit.core.fit.Fit.execute`.
+        :return: :class:`~symfit.core.fit_results.FitResults`
+        """
+        minimizer = self.fit.minimizer
+        if self.fit_result is not None:
+            minimizer.initial_guesses = [self.fit_result.value(p)
+                                         for p in minimizer.params]
+        if isinstance(minimizer, RecursiveLeastSquares):
+            # Its inverse Hessian is exact, and needs no model evaluations.
+            minimize_options.setdefault('covariance', 'from-minimizer')
+        self.fit_result = self.fit.execute(**minimize_options)
+        return self.fit_result
+
+    def _append(self, var, dataset):
+        """
+        Copy ``dataset`` to the end of the buffer of ``var``, growing it if
+        needed.
+        """
+        buffer, size = self._buffers[var], self._sizes[var]
+        dataset = np.asarray(dataset)
+        if dataset.shape[1:] != buffer.shape[1:]:
+            raise ValueError('The data for {} should have shape (n, {}), not '
+                             '{}.'.format(var, ', '.join(map(str, buffer.shape[1:])),
+                                          dataset.shape))
+        new_size = size + len(dataset)
+        if new_size > len(buffer):
+            new_buffer = np.empty((max(2 * len(buffer), new_size),) + buffer.shape[1:],
+                                  dtype=np.result_type(buffer, dataset))
+            new_buffer[:size] = buffer[:size]
+            self._buffers[var] = buffer = new_buffer
+        buffer[size:new_size] = dataset
+        self._sizes[var] = new_size
+
+    def _views(self):
+        data = OrderedDict(self.fit.data)
+        for var, buffer in self._buffers.items():
+            data[var] = buffer[:self._sizes[var]]
+        return data
+
+
+def _hessian_approximation(base):
+    """
+    :param base: Objective class.
+    :return: Subclass of ``base`` and
+        :class:`~symfit.core.objectives.HessianObjectiveJacApprox`, created
+        only once for every ``base``.
+    """
+    try:
+        return _hessian_approximations[base]
+    except KeyError:
+        class HessApproximation(base, HessianObjectiveJacApprox):
+            """
+            Class which impersonates ``base``, but which returns zeros
+            for the models Hessian. This will effectively result in the
+            calculation of the approximate Hessian by calculating
+            outer(J.T, J) when calling ``base.eval_hessian``.
+            """
+        _hessian_approximations[base] = HessApproximation
+        return HessApproximation
+
+_hessian_approximations = {}
+
+
+def _inverse_hessian(hess):
+    """
+    Invert a Hessian matrix. A Cholesky decomposition is used when it is
+    positive definite, as it should be at a minimum, and otherwise a singular
+    value decomposition.
+
+    :param hess: Symmetric matrix.
+    :return: Inverse of ``hess``, or ``None`` if it is (numerically) singular.
+    """
+    if not np.all(np.isfinite(hess)):
+        return None
+    try:
+        factor = cho_factor(hess)
+    except np.linalg.LinAlgError:
+        pass
+    else:
+        return cho_solve(factor, np.eye(len(hess)))
+
+    U, s, Vt = np.linalg.svd(hess)
+    if not s.size or s[-1] <= np.finfo(float).eps * len(s) * s[0]:
+        return None
+    return (Vt.T / s).dot(U.T)
+
+
 class Fit(HasCovarianceMatrix):
     """
     Your one stop fitting solution! Based on the nature of the input, this
@@ -335,7 +594,7 @@ class Fit(HasCovarianceMatrix):
     """
 
     @keywordonly(objective=None, minimizer=None, constraints=None,
-                 absolute_sigma=None)
+                 absolute_sigma=None, parameter_state=None)
     def __init__(self, model, *ordered_data, **named_data):
         """
 
@@ -359,11 +618,18 @@ class Fit(HasCovarianceMatrix):
             vars. Within each group they are assigned in alphabetical order.
         :param named_data: assign dependent, independent and sigma variables
             data by name.
+        :param parameter_state: Optionally, a
+            :class:`~symfit.core.argument.ParameterState` with the initial
+            guesses, bounds and fixed parameters of this fit. By default,
+            these are read from the parameters of the model when needed.
+            Since the parameters are shared by all fits of a model, fits
+            running concurrently should each be given a state.
         """
         objective = named_data.pop('objective')
         minimizer = named_data.pop('minimizer')
         constraints = named_data.pop('constraints')
         absolute_sigma = named_data.pop('absolute_sigma')
+        self.parameter_state = named_data.pop('parameter_state')
         # Should be a list of Constraint objects
         constraints = [] if constraints is None else constraints
 
@@ -390,29 +656,82 @@ class Fit(HasCovarianceMatrix):
         super(Fit, self).__init__(self.model, absolute_sigma=absolute_sigma,
                                   **bound_arguments.arguments)
 
+        # Initialise the objective with data if it's not initialised already
+        if not isinstance(self.objective, BaseObjective):
+            self.objective = self.objective(self.model, self.data)
+        if self.parameter_state is not None:
+            self.objective.parameter_state = self.parameter_state
+
+        # Select the minimizer on the basis of the provided information.
+        if minimizer is None:
+            minimizer = self._determine_minimizer()
+        self.minimizer = self._init_minimizers(minimizer)
+
+    def _bind_data(self, *ordered_data, **named_data):
+        data, original_data = super(Fit, self)._bind_data(*ordered_data,
+                                                          **named_data)
         # Update the data belonging to the constraints. We do this by checking
         # for the presence of data with the same name as one of the independent
         # variables of the constraint. If present, we start addressing them by
         # their Variable instead.
         for constraint in self.constraints:
             for var in constraint.vars:
-                if var.name in self.data:
-                    self.data[var] = self.data.pop(var.name)
+                if var.name in data:
+                    data[var] = data.pop(var.name)
+        return data, original_data
 
-        # Initialise the objective with data if it's not initialised already
-        if not isinstance(self.objective, BaseObjective):
-            self.objective = self.objective(self.model, self.data)
+    def rebind(self, *ordered_data, **named_data):
+        """
+        Replace the data of this fit, given in the same way as to
+        :class:`~symfit.core.fit.Fit`. The objective, constraints, minimizer
+        and compiled model are reused, which makes this much cheaper than
+        making a new :class:`~symfit.core.fit.Fit`::
 
-        # Select the minimizer on the basis of the provided information.
-        if minimizer is None:
-            minimizer = self._determine_minimizer()
+            fit = Fit(model, x=xdata, y=ydata)
+            for ydata in stream:
+                fit_result = fit.rebind(x=xdata, y=ydata).execute()
 
-        # Initialise the minimizer
-        if isinstance(minimizer, Sequence):
-            minimizers = [self._init_minimizer(mini) for mini in minimizer]
-            self.minimizer = self._init_minimizer(ChainedMinimizer, minimizers=minimizers)
-        else:
-            self.minimizer = self._init_minimizer(minimizer)
+        Whether sigmas are interpreted as absolute does not change. The data
+        is swapped in place, so a fit should not be rebound while it is being
+        executed.
+
+        :param ordered_data: data for dependent, independent and sigma
+            variables, see :class:`~symfit.core.fit.Fit`.
+        :param named_data: data by name.
+        :return: this fit.
+        """
+        self._set_data(self._bind_new_data(*ordered_data, **named_data))
+        return self
+
+    def _bind_new_data(self, *ordered_data, **named_data):
+        """
+        :return: new data for this fit as a dict with variables as keys, see
+            :meth:`rebind`.
+        """
+        bound_arguments = self._data_signature.bind_partial(*ordered_data,
+                                                            **named_data)
+        self._determine_objective(self.model, objective=self.objective,
+                                  minimizer=self.minimizer,
+                                  bound_arguments=bound_arguments)
+        data, _ = self._bind_data(**bound_arguments.arguments)
+        return data
+
+    def _set_data(self, data):
+        """
+        Replace the data of this fit by ``data``, and let the objectives know.
+        """
+        # The objectives share self.data, so update it in place.
+        self.data.clear()
+        self.data.update(data)
+
+        objectives = [self.objective]
+        for minimizer in _nested_minimizers(self.minimizer):
+            objectives.append(minimizer.objective)
+            objectives.extend(getattr(minimizer, 'constraints', []))
+        for objective in objectives:
+            if isinstance(objective, BaseObjective):
+                objective._clear_cache()
+                objective._sanity_checking()
 
     def _make_signature(self):
         parameters = self._make_parameters(self.model)
@@ -440,14 +759,26 @@ class Fit(HasCovarianceMatrix):
     def _determine_minimizer(self):
         """
         Determine the most suitable minimizer by the presence of bounds or
-        constraints.
+        constraints, and by the linearity of least-squares problems.
         :return: a subclass of `BaseMinimizer`.
         """
+        if self.parameter_state is None:
+            bounds = self.model.bounds
+        else:
+            # Like in Model.bounds, fixed parameters count as bounded.
+            settings = [parameter_settings(p, self.parameter_state)
+                        for p in self.model.params]
+            bounds = [(s.value, s.value) if s.fixed else (s.min, s.max)
+                      for s in settings]
         if self.constraints:
             return SLSQP
-        elif any([bound is not None for pair in self.model.bounds for bound in pair]):
+        elif any([bound is not None for pair in bounds for bound in pair]):
             # If any bound is set
             return LBFGSB
+        elif (self.objective.__class__ is LeastSquares and
+                getattr(self.model, 'is_linear', False)):
+            # Linear least-squares problems can be solved in closed form.
+            return LinearLeastSquares
         else:
             return BFGS
 
@@ -493,6 +824,17 @@ class Fit(HasCovarianceMatrix):
                     )
         return objective
 
+    def _init_minimizers(self, minimizer):
+        """
+        :param minimizer: :class:`~symfit.core.minimizers.BaseMinimizer`, or
+            a :class:`~collections.abc.Sequence` of them to be chained.
+        :returns: instance of :class:`~symfit.core.minimizers.BaseMinimizer`.
+        """
+        if isinstance(minimizer, Sequence):
+            minimizers = [self._init_minimizer(mini) for mini in minimizer]
+            return self._init_minimizer(ChainedMinimizer, minimizers=minimizers)
+        return self._init_minimizer(minimizer)
+
     def _init_minimizer(self, minimizer, **minimizer_options):
         """
         Takes a :class:`~symfit.core.minimizers.BaseMinimizer` and instantiates
@@ -509,9 +851,26 @@ class Fit(HasCovarianceMatrix):
         if isinstance(minimizer, BaseMinimizer):
             return minimizer
         if issubclass(minimizer, BasinHopping):
+            local_minimizer = self._determine_minimizer()
+            if not issubclass(local_minimizer, ScipyMinimize):
+                # BasinHopping can only hop with scipy's local minimizers.
+                local_minimizer = BFGS
+            minimizer_options['local_minimizer'] = self._init_minimizer(
+                local_minimizer
+            )
+        if issubclass(minimizer, MultiStart):
+            local_minimizer = self._determine_minimizer()
+            if local_minimizer is LinearLeastSquares:
+                # Its closed-form solution does not depend on the start.
+                local_minimizer = BFGS
             minimizer_options['local_minimizer'] = self._init_minimizer(
-                self._determine_minimizer()
+                local_minimizer
             )
+        if issubclass(minimizer, VariableProjection):
+            local_minimizer = self._determine_minimizer()
+            if local_minimizer is LinearLeastSquares:
+                local_minimizer = BFGS
+            minimizer_options['local_minimizer'] = local_minimizer
         if issubclass(minimizer, GradientMinimizer):
             # If an analytical version of the Jacobian exists we should use
             # that, otherwise we let the minimizer estimate it itself.
@@ -526,6 +885,10 @@ class Fit(HasCovarianceMatrix):
             # py function version of the analytical hessian.
             if hasattr(self.model, 'eval_hessian') and hasattr(self.objective, 'eval_hessian'):
                 minimizer_options['hessian'] = self.objective.eval_hessian
+        if issubclass(minimizer, HessianProductMinimizer):
+            # Hessian-vector products only need the analytical Jacobian.
+            if hasattr(self.model, 'eval_jacobian') and hasattr(self.objective, 'eval_hessp'):
+                minimizer_options['hessp'] = self.objective.eval_hessp
 
         if issubclass(minimizer, ConstrainedMinimizer):
             # set the constraints as MinimizeModel. The dependent vars of the
@@ -533,9 +896,14 @@ class Fit(HasCovarianceMatrix):
             constraint_objectives = []
             for constraint in self.constraints:
                 data = self.data  # No copy, share state
-                constraint_objectives.append(MinimizeModel(constraint, data))
+                constraint_objective = MinimizeModel(constraint, data)
+                if self.parameter_state is not None:
+                    constraint_objective.parameter_state = self.parameter_state
+                constraint_objectives.append(constraint_objective)
             minimizer_options['constraints'] = constraint_objectives
-        return minimizer(self.objective, self.model.params, **minimizer_options)
+        return minimizer(self.objective, self.model.params,
+                         parameter_state=self.parameter_state,
+                         **minimizer_options)
 
     def _init_constraints(self, constraints, model):
         """
@@ -569,19 +937,552 @@ class Fit(HasCovarianceMatrix):
                     )
         return con_models
 
+    @keywordonly(covariance='exact', instrumentation=None, budget=None)
     def execute(self, **minimize_options):
         """
         Execute the fit.
 
+        :param covariance: strategy used to compute the covariance matrix,
+            ``'exact'``, ``'gauss-newton'`` or ``'from-minimizer'``. See
+            :meth:`~symfit.core.fit.HasCovarianceMatrix.covariance_matrix`.
+        :param instrumentation: Optionally, an
+            :class:`~symfit.core.instrumentation.Instrumentation` to monitor
+            the minimization with. It is available afterwards as
+            ``fit_result.instrumentation``.
+        :param budget: Optionally, a
+            :class:`~symfit.core.instrumentation.Budget` limiting the time and
+            number of evaluations of the minimization.
         :param minimize_options: keyword arguments to be passed to the specified
             minimizer.
         :return: FitResults instance
         """
-        minimizer_ans = self.minimizer.execute(**minimize_options)
+        covariance = minimize_options.pop('covariance')
+        instrumentation = minimize_options.pop('instrumentation')
+        budget = minimize_options.pop('budget')
+        if budget is None:
+            execute = self.minimizer.execute
+        else:
+            execute = partial(budget.execute, self.minimizer)
+        if instrumentation is None:
+            minimizer_ans = execute(**minimize_options)
+        else:
+            with instrumentation.attach(self.minimizer):
+                minimizer_ans = execute(**minimize_options)
+            minimizer_ans.instrumentation = instrumentation
         minimizer_ans.covariance_matrix = self.covariance_matrix(
-            dict(zip(self.model.params, minimizer_ans._popt))
+            dict(zip(self.model.params, minimizer_ans._popt)),
+            strategy=covariance,
+            hess_inv=minimizer_ans.minimizer_output.get('hess_inv')
         )
         # Overwrite the DummyModel with the current model
         minimizer_ans.model = self.model
         minimizer_ans.minimizer = self.minimizer
         return minimizer_ans
+
+    async def execute_async(self, executor=None, progress=None,
+                            **minimize_options):
+        """
+        Coroutine which executes the fit in an executor, such that an
+        :mod:`asyncio` event loop is not blocked by it::
+
+            fit_result = await fit.execute_async(executor=executor)
+
+        Cancelling the task awaiting the fit stops the minimization at the
+        next evaluation of the objective or its derivatives. Since a fit
+        instruments its minimizer, concurrent fits should each have their own
+        :class:`~symfit.core.fit.Fit`.
+
+        :param executor: :class:`~concurrent.futures.Executor` to run the fit
+            in, the default executor of the loop by default. A
+            :class:`~concurrent.futures.ThreadPoolExecutor` limits the number
+            of fits running at the same time.
+        :param progress: Optionally, a
+            :class:`~symfit.core.instrumentation.Progress` to follow or cancel
+            the minimization with. It is available afterwards as
+            ``fit_result.instrumentation``.
+        :param minimize_options: passed on to :meth:`execute`.
+        :return: FitResults instance
+        """
+        if progress is None:
+            progress = Progress()
+        execute = partial(self.execute, instrumentation=progress,
+                          **minimize_options)
+        return await progress.run(execute, executor)
+
+    @keywordonly(parameters=None, confidence=0.6827, step=0.5, max_steps=20,
+                 executor=None)
+    def profile_likelihood(self, fit_result, **minimize_options):
+        """
+        Profile the objective around ``fit_result`` to find confidence
+        intervals, which unlike :meth:`~symfit.core.fit_results.FitResults.stdev`
+        do not assume the objective to be quadratic and can be asymmetric.
+
+        Each parameter is fixed at values stepping away from its best fit
+        value in both directions, and the other parameters are fitted again,
+        starting from their values at the previous point. Once the objective
+        has risen by more than the amount corresponding to ``confidence``, the
+        bound of the interval is interpolated. The profiles are independent,
+        and can be computed in parallel by providing a
+        :class:`concurrent.futures.Executor`::
+
+            fit_result = fit.execute()
+            with ProcessPoolExecutor() as executor:
+                profiles = fit.profile_likelihood(fit_result, executor=executor)
+            lower, upper = profiles[a].lower, profiles[a].upper
+
+        :param fit_result: :class:`~symfit.core.fit_results.FitResults` of
+            this fit to profile around.
+        :param parameters: list of parameters to profile, all free parameters
+            by default.
+        :param confidence: confidence level of the intervals.
+        :param step: step between the points of a profile, in units of the
+            standard deviation of the parameter in ``fit_result``.
+        :param max_steps: maximum number of points on either side of the best
+            fit value.
+        :param executor: If given, a :class:`concurrent.futures.Executor` used
+            to compute the profiles in parallel.
+        :param minimize_options: options to be passed on to the ``execute`` of
+            the minimizer.
+        :return: :class:`~collections.OrderedDict` of
+            :class:`~symfit.core.fit.Profile` per parameter. Bounds which are
+            not reached within the parameter's bounds and ``max_steps`` are
+            ``nan``.
+        """
+        params = minimize_options.pop('parameters')
+        confidence = minimize_options.pop('confidence')
+        step = minimize_options.pop('step')
+        max_steps = minimize_options.pop('max_steps')
+        executor = minimize_options.pop('executor')
+        if params is None:
+            params = self.objective.free_params
+
+        minimum = _scalar_objective_value(self.objective, fit_result)
+        threshold = (scipy.stats.chi2.ppf(confidence, 1) / 2 *
+                     self._likelihood_scale(self.objective, minimum))
+
+        chains = []
+        for param in params:
+            stdev = fit_result.stdev(param)
+            if not stdev or not np.isfinite(stdev):
+                stdev = 0.1 * (abs(fit_result.value(param)) or 1)
+            chains.extend([(param, - step * stdev), (param, step * stdev)])
+        args = (repeat(self), [param for param, _ in chains],
+                [param_step for _, param_step in chains], repeat(fit_result),
+                repeat(minimum + threshold), repeat(max_steps),
+                repeat(minimize_options))
+        if executor is None:
+            walks = list(map(_profile_walk, *args))
+        else:
+            walks = list(executor.map(_profile_walk, *args))
+
+        profiles = OrderedDict()
+        for param, lower_walk, upper_walk in zip(params, walks[::2], walks[1::2]):
+            best = fit_result.value(param)
+            values = lower_walk[0][::-1] + [best] + upper_walk[0]
+            objective_values = lower_walk[1][::-1] + [minimum] + upper_walk[1]
+            bounds = [
+                _profile_crossing([best] + walk[0], [minimum] + walk[1],
+                                  minimum + threshold)
+                for walk in (lower_walk, upper_walk)
+            ]
+            profiles[param] = Profile(bounds[0], bounds[1], np.array(values),
+                                      np.array(objective_values))
+        return profiles
+
+    @keywordonly(n_replicas=200, confidence=0.6827, seed=None, executor=None)
+    def bootstrap(self, fit_result, **minimize_options):
+        """
+        Estimate the uncertainty in the parameters by fitting to data
+        resampled with replacement. Rather than copying the data, every
+        replica gives its objective
+        :attr:`~symfit.core.objectives.BaseObjective.sample_weights` counting
+        how often each data point was drawn. Data points are drawn along the
+        first axis of the data. The replicas are independent, and can be
+        fitted in parallel by providing a
+        :class:`concurrent.futures.Executor`::
+
+            fit_result = fit.execute()
+            with ProcessPoolExecutor() as executor:
+                resampling = fit.bootstrap(fit_result, executor=executor)
+            lower, upper = resampling.intervals[a]
+
+        :param fit_result: :class:`~symfit.core.fit_results.FitResults` of
+            this fit, from which every replica starts.
+        :param n_replicas: number of resampled fits.
+        :param confidence: confidence level of the percentile intervals.
+        :param seed: seed for the random number generator.
+        :param executor: If given, a :class:`concurrent.futures.Executor` used
+            to fit the replicas in parallel.
+        :param minimize_options: options to be passed on to the ``execute`` of
+            the minimizer.
+        :return: :class:`~symfit.core.fit.Resampling`.
+        """
+        n_replicas = minimize_options.pop('n_replicas')
+        confidence = minimize_options.pop('confidence')
+        seed = minimize_options.pop('seed')
+        executor = minimize_options.pop('executor')
+
+        seeds = np.random.RandomState(seed).randint(2**31 - 1, size=n_replicas)
+        replicas = self._resample(fit_result, _bootstrap_weights, seeds,
+                                  executor, minimize_options)
+        tail = 50 * (1 - confidence)
+        lower, upper = np.percentile(replicas, [tail, 100 - tail], axis=0)
+        return Resampling(replicas, OrderedDict(
+            (param, (param_lower, param_upper)) for param, param_lower, param_upper
+            in zip(self.model.params, lower, upper)
+        ))
+
+    @keywordonly(confidence=0.6827, executor=None)
+    def jackknife(self, fit_result, **minimize_options):
+        """
+        Estimate the uncertainty in the parameters by fitting again with each
+        data point along the first axis of the data left out in turn, by
+        giving it a zero
+        :attr:`~symfit.core.objectives.BaseObjective.sample_weights`. The
+        intervals are those of a normal distribution with the jackknife
+        estimate of the standard deviation.
+
+        :param fit_result: :class:`~symfit.core.fit_results.FitResults` of
+            this fit, from which every replica starts.
+        :param confidence: confidence level of the intervals.
+        :param executor: If given, a :class:`concurrent.futures.Executor` used
+            to fit the replicas in parallel.
+        :param minimize_options: options to be passed on to the ``execute`` of
+            the minimizer.
+        :return: :class:`~symfit.core.fit.Resampling`.
+        """
+        confidence = minimize_options.pop('confidence')
+        executor = minimize_options.pop('executor')
+
+        n_samples = self._n_samples()
+        replicas = self._resample(fit_result, _jackknife_weights,
+                                  range(n_samples), executor, minimize_options)
+        deviations = replicas - np.mean(replicas, axis=0)
+        stdev = np.sqrt((n_samples - 1) * np.mean(deviations ** 2, axis=0))
+        width = scipy.stats.norm.ppf(0.5 + confidence / 2) * stdev
+        return Resampling(replicas, OrderedDict(
+            (param, (value - param_width, value + param_width)) for
+            param, value, param_width in zip(self.model.params,
+                                             fit_result._popt, width)
+        ))
+
+    @keywordonly(n_steps=1000, n_walkers=None, stretch=2.0, seed=None,
+                 filename=None, chunk_size=None)
+    def sample(self, fit_result, **options):
+        """
+        Sample the posterior distribution of the free parameters with the
+        affine invariant ensemble sampler of Goodman and Weare, starting from
+        a small ball around ``fit_result``::
+
+            fit_result = fit.execute()
+            sampling = fit.sample(fit_result, n_steps=5000)
+            burned_in = sampling.chain[1000:].reshape(-1, len(fit.objective.free_params))
+
+        The log-likelihood is minus the objective, scaled by the reduced
+        :math:`\\chi^2` like the covariance matrix for least squares with
+        relative sigma. The prior is uniform between the ``min`` and ``max``
+        of every parameter.
+
+        The walkers are split in two halves, and each half is moved using
+        the other. Each half is evaluated in a single call to
+        :meth:`~symfit.core.objectives.BaseObjective.evaluate_points`, which
+        broadcasts the walkers through the model as an extra axis.
+
+        :param fit_result: :class:`~symfit.core.fit_results.FitResults` of
+            this fit to start from.
+        :param n_steps: number of steps of every walker.
+        :param n_walkers: even number of walkers, at least twice the number of
+            free parameters. Four times the number of free parameters, but at
+            least eight, by default.
+        :param stretch: scale of the stretch moves, which are drawn between
+            ``1 / stretch`` and ``stretch``.
+        :param seed: seed for the random number generator.
+        :param filename: Optionally, a ``.npy`` file to store the chain in as
+            a memory-mapped array, for chains which do not fit in memory. It
+            can be opened afterwards with ``np.load(filename, mmap_mode='r')``.
+        :param chunk_size: passed on to
+            :meth:`~symfit.core.objectives.BaseObjective.evaluate_points`.
+        :return: :class:`~symfit.core.fit.Sampling`.
+        """
+        n_steps = options.pop('n_steps')
+        n_walkers = options.pop('n_walkers')
+        stretch = options.pop('stretch')
+        seed = options.pop('seed')
+        filename = options.pop('filename')
+        chunk_size = options.pop('chunk_size')
+
+        objective = self.objective
+        if objective.__class__ is VectorLeastSquares:
+            objective = LeastSquares(objective.model, objective.data)
+            objective.parameter_state = self.objective.parameter_state
+        if not isinstance(objective, (LeastSquares, LogLikelihood)):
+            raise TypeError('Sampling is not supported for {}.'.format(
+                objective.__class__.__name__
+            ))
+        params = objective.free_params
+        n_dim = len(params)
+        if n_walkers is None:
+            n_walkers = max(4 * n_dim, 8)
+        if n_walkers % 2 or n_walkers < 2 * n_dim:
+            raise ValueError('The number of walkers should be even, and at '
+                             'least twice the number of free parameters.')
+
+        scale = self._likelihood_scale(
+            self.objective, _scalar_objective_value(self.objective, fit_result)
+        )
+        settings = [parameter_settings(p, self.parameter_state) for p in params]
+        lower = np.array([-np.inf if s.min is None else s.min for s in settings])
+        upper = np.array([np.inf if s.max is None else s.max for s in settings])
+
+        def log_probability(positions):
+            result = np.full(len(positions), -np.inf)
+            inside = np.all((lower <= positions) & (positions <= upper), axis=1)
+            if np.any(inside):
+                points = OrderedDict(zip(params, positions[inside].T))
+                result[inside] = - objective.evaluate_points(
+                    points, chunk_size=chunk_size
+                ) / scale
+            result[np.isnan(result)] = -np.inf
+            return result
+
+        random_state = np.random.RandomState(seed)
+        center = np.array([fit_result.value(p) for p in params], dtype=float)
+        width = np.array([fit_result.stdev(p) or np.nan for p in params],
+                         dtype=float)
+        width = np.where(np.isfinite(width) & (width > 0), 1e-3 * width,
+                         1e-4 * (np.abs(center) + 1))
+        positions = center + width * random_state.randn(n_walkers, n_dim)
+        positions = np.clip(positions, lower, upper)
+        log_prob = log_probability(positions)
+
+        if filename is None:
+            chain = np.empty((n_steps, n_walkers, n_dim))
+        else:
+            chain = np.lib.format.open_memmap(
+                filename, mode='w+', dtype=np.float64,
+                shape=(n_steps, n_walkers, n_dim)
+            )
+        log_probabilities = np.empty((n_steps, n_walkers))
+        accepted = np.zeros(n_walkers)
+        half = n_walkers // 2
+        halves = [slice(0, half), slice(half, n_walkers)]
+        for step in range(n_steps):
+            for active, complement in [halves, halves[::-1]]:
+                z = ((stretch - 1) * random_state.rand(half) + 1) ** 2 / stretch
+                partners = positions[complement][random_state.randint(half, size=half)]
+                proposals = partners + z[:, np.newaxis] * (positions[active] - partners)
+                proposal_log_prob = log_probability(proposals)
+                log_acceptance = ((n_dim - 1) * np.log(z) + proposal_log_prob
+                                  - log_prob[active])
+                accept = np.log(random_state.rand(half)) < log_acceptance
+                # Slices are views, so this updates the walkers in place.
+                positions[active][accept] = proposals[accept]
+                log_prob[active][accept] = proposal_log_prob[accept]
+                accepted[active] += accept
+            chain[step] = positions
+            log_probabilities[step] = log_prob
+        if filename is not None:
+            chain.flush()
+        return Sampling(chain, log_probabilities, accepted / n_steps)
+
+    def _n_samples(self):
+        """
+        :return: the length of the data of the objective along its first
+            axis, along which it is resampled.
+        """
+        if isinstance(self.objective, LogLikelihood):
+            data = self.objective.independent_data.values()
+        else:
+            data = self.objective.dependent_data.values()
+        lengths = set(len(dataset) for dataset in data
+                      if dataset is not None and np.ndim(dataset) > 0)
+        if len(lengths) != 1:
+            raise ValueError('Resampling requires all data to have the same '
+                             'length along the first axis.')
+        return lengths.pop()
+
+    def _resample(self, fit_result, make_weights, keys, executor,
+                  minimize_options):
+        """
+        Fit a replica for each of ``keys``, with the sample weights
+        ``make_weights(key, n_samples)``.
+
+        :return: array of the parameters of the replicas, with a row per
+            replica and a column per parameter in ``self.model.params``.
+        """
+        if not isinstance(self.objective,
+                          (LeastSquares, VectorLeastSquares, LogLikelihood)):
+            raise TypeError('Resampling is not supported for {}.'.format(
+                self.objective.__class__.__name__
+            ))
+        keys = list(keys)
+        args = (repeat(self), repeat(fit_result), repeat(make_weights), keys,
+                repeat(self._n_samples()), repeat(minimize_options))
+        if executor is None:
+            replicas = list(map(_resampled_fit, *args))
+        else:
+            # Replicas are sent in chunks, such that a process pool pickles
+            # the fit once per chunk rather than once per replica.
+            chunksize = max(1, len(keys) // 64)
+            replicas = list(executor.map(_resampled_fit, *args,
+                                         chunksize=chunksize))
+        return np.array(replicas, dtype=float)
+
+    def _with_parameter_state(self, parameter_state):
+        """
+        :return: a copy of this fit which shares its model and data, but uses
+            ``parameter_state`` and has a new objective and minimizer.
+        """
+        fit = copy.copy(self)
+        fit.parameter_state = parameter_state
+        fit.objective = copy.copy(self.objective)
+        fit.objective.parameter_state = parameter_state
+        if isinstance(self.minimizer, ChainedMinimizer):
+            minimizer = [type(mini) for mini in self.minimizer.minimizers]
+        else:
+            minimizer = type(self.minimizer)
+        fit.minimizer = fit._init_minimizers(minimizer)
+        return fit
+
+
+Profile = namedtuple('Profile', ['lower', 'upper', 'values', 'objective_values'])
+Profile.__doc__ = """
+Profile of the objective in one parameter, as computed by
+:meth:`~symfit.core.fit.Fit.profile_likelihood`. ``lower`` and ``upper`` are
+the bounds of the confidence interval, ``values`` the values of the parameter
+at which the objective was minimized in the other parameters, and
+``objective_values`` the minima found.
+"""
+
+
+Resampling = namedtuple('Resampling', ['replicas', 'intervals'])
+Resampling.__doc__ = """
+Outcome of :meth:`~symfit.core.fit.Fit.bootstrap` or
+:meth:`~symfit.core.fit.Fit.jackknife`. ``replicas`` is an array with the
+fitted parameters of every replica as a row, in the order of the parameters
+of the model, and ``intervals`` maps each parameter to the ``(lower,
+upper)`` bounds of its confidence interval.
+"""
+
+
+Sampling = namedtuple('Sampling', ['chain', 'log_probability',
+                                   'acceptance_fraction'])
+Sampling.__doc__ = """
+Outcome of :meth:`~symfit.core.fit.Fit.sample`. ``chain`` is an array of
+shape ``(n_steps, n_walkers, n_free_params)`` with the positions of the
+walkers after every step, in the order of the free parameters of the
+objective. ``log_probability`` holds the log posterior probability for every
+step and walker, up to a constant, and ``acceptance_fraction`` the fraction
+of accepted moves of every walker.
+"""
+
+
+def _state_at(fit, fit_result):
+    """
+    :return: the :class:`~symfit.core.argument.ParameterState` of ``fit``,
+        with the values of the parameters found in ``fit_result``.
+    """
+    state = fit.parameter_state
+    if state is None:
+        state = ParameterState(fit.model.params)
+    for param, value in zip(fit.model.params, fit_result._popt):
+        state = state.replace(param, value=value)
+    return state
+
+
+def _bootstrap_weights(seed, n_samples):
+    """
+    :return: how often each of ``n_samples`` is drawn when drawing as many
+        with replacement.
+    """
+    random_state = np.random.RandomState(seed)
+    return np.bincount(random_state.randint(n_samples, size=n_samples),
+                       minlength=n_samples)
+
+
+def _jackknife_weights(index, n_samples):
+    """
+    :return: weights which leave out the sample at ``index``.
+    """
+    weights = np.ones(n_samples)
+    weights[index] = 0
+    return weights
+
+
+def _resampled_fit(fit, fit_result, make_weights, key, n_samples,
+                   minimize_options):
+    """
+    Fit again from ``fit_result``, with the sample weights
+    ``make_weights(key, n_samples)``.
+
+    :return: the values of all parameters of the model.
+    """
+    replica = fit._with_parameter_state(_state_at(fit, fit_result))
+    replica.objective.sample_weights = make_weights(key, n_samples)
+    return replica.minimizer.execute(**minimize_options)._popt
+
+
+def _scalar_objective_value(objective, fit_result):
+    """
+    :return: the objective value of ``fit_result`` on the scale of
+        ``objective``, which is that of :class:`~symfit.core.objectives.LeastSquares`
+        for :class:`~symfit.core.objectives.VectorLeastSquares`.
+    """
+    if isinstance(objective, VectorLeastSquares):
+        return _objective_value(fit_result) / 2
+    return _objective_value(fit_result)
+
+
+def _profile_walk(fit, param, step, fit_result, stop, max_steps,
+                  minimize_options):
+    """
+    Step ``param`` away from its value in ``fit_result`` until the objective,
+    minimized in the other parameters, exceeds ``stop``.
+
+    :return: the values of ``param`` and the corresponding minima of the
+        objective, as two lists.
+    """
+    state = _state_at(fit, fit_result)
+    settings = state[param]
+
+    values, objective_values = [], []
+    for index in range(1, max_steps + 1):
+        value = settings.value + index * step
+        at_bound = False
+        for bound, beyond in ((settings.min, np.less_equal),
+                              (settings.max, np.greater_equal)):
+            if bound is not None and beyond(value, bound):
+                value, at_bound = bound, True
+        state = state.replace(param, value=value, fixed=True)
+        profile_fit = fit._with_parameter_state(state)
+        if profile_fit.objective.free_params:
+            ans = profile_fit.minimizer.execute(**minimize_options)
+            objective_value = _scalar_objective_value(fit.objective, ans)
+            # Start the next point from this one.
+            for other, other_value in zip(fit.model.params, ans._popt):
+                if other is not param:
+                    state = state.replace(other, value=other_value)
+        else:
+            # Nothing is left to minimize.
+            objective_value = profile_fit.objective()
+            if isinstance(fit.objective, VectorLeastSquares):
+                objective_value = np.sum(np.square(objective_value)) / 2
+            objective_value = np.sum(objective_value)
+        values.append(value)
+        objective_values.append(objective_value)
+        if objective_value >= stop or at_bound:
+            break
+    return values, objective_values
+
+
+def _profile_crossing(values, objective_values, stop):
+    """
+    :return: the value at which the profile given by ``values`` and
+        ``objective_values`` crosses ``stop``, interpolated linearly. ``nan``
+        if it does not.
+    """
+    if objective_values[-1] < stop or len(values) < 2:
+        return np.nan
+    x0, x1 = values[-2:]
+    y0, y1 = objective_values[-2:]
+    return x0 + (stop - y0) * (x1 - x0) / (y1 - y0)
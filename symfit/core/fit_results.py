@@ -22,6 +22,10 @@ class FitResults(object):
     their optimized values. Can be `**` unpacked when evaluating
     :class:`~symfit.core.models.Model`'s.
     """
+    #: :class:`~symfit.core.instrumentation.Instrumentation` with which the
+    #: minimization was monitored, if any.
+    instrumentation = None
+
     @keywordonly(constraints=None)
     def __init__(self, model, popt, covariance_matrix, minimizer, objective, message, **minimizer_output):
         """
@@ -0,0 +1,521 @@
+"""
+Tools to monitor minimizations. An
+:class:`~symfit.core.instrumentation.Instrumentation` counts and times every
+evaluation of the objective, its derivatives and the constraints made by a
+minimizer, and can keep a trace of the points visited::
+
+    instrumentation = Instrumentation(trace=True)
+    fit_result = fit.execute(instrumentation=instrumentation)
+    print(fit_result.instrumentation.summary())
+
+A ``callback`` receives every evaluation as it happens, which can be used for
+live monitoring.
+
+A :class:`~symfit.core.instrumentation.Budget` limits the wall time and the
+number of evaluations a minimization may take::
+
+    fit_result = fit.execute(budget=Budget(max_seconds=10))
+
+Minimizers do not take a ``budget`` option themselves, since every minimizer
+implements its own ``execute``. To limit a minimizer used on its own, use
+``Budget(max_seconds=10).execute(minimizer)`` instead.
+
+A :class:`~symfit.core.instrumentation.Progress` streams the evaluations of a
+minimization run with :meth:`~symfit.core.fit.Fit.execute_async` to an
+:mod:`asyncio` event loop, and can be used to cancel it.
+"""
+import asyncio
+from collections import Counter
+from contextlib import contextmanager
+import copy
+import threading
+import time
+
+import numpy as np
+from scipy.optimize import OptimizeResult
+
+# Names of the callables a minimizer hands to its algorithm, and the kind of
+# evaluation they represent.
+_WRAPPED_KINDS = {
+    'wrapped_objective': 'objective',
+    'wrapped_jacobian': 'jacobian',
+    'wrapped_hessian': 'hessian',
+    'wrapped_hessp': 'hessp',
+}
+_CONSTRAINT_KINDS = {
+    'fun': 'constraint',
+    'jac': 'constraint_jacobian',
+    'hess': 'constraint_hessian',
+}
+
+
+class Instrumentation(object):
+    """
+    Counts and times the evaluations made by a minimizer.
+
+    Every evaluation is an event, a :class:`dict` with the ``kind`` of
+    evaluation (``'objective'``, ``'jacobian'``, ``'hessian'``, ``'hessp'``,
+    ``'constraint'``, ``'constraint_jacobian'`` or ``'constraint_hessian'``),
+    the free ``params`` it was evaluated at, its ``duration`` and the wall
+    ``time`` since the start of the minimization. Events for the objective
+    also hold its value as ``objective``, those for the Jacobian the norm of
+    the gradient as ``gradient_norm``.
+
+    What an iteration is differs between algorithms, so the trace has an entry
+    for every point at which the objective or the Jacobian was evaluated,
+    with the ``params``, ``objective``, ``gradient_norm`` and ``time``.
+
+    Evaluations done in other processes, e.g. when using a
+    :class:`~concurrent.futures.ProcessPoolExecutor`, are not recorded.
+    """
+    def __init__(self, trace=False, callback=None):
+        """
+        :param trace: If `True`, record a trace of the points visited.
+        :param callback: Optional callable, which is called with every event.
+        """
+        self.record_trace = trace
+        self.callback = callback
+        self.counts = Counter()
+        self.timings = Counter()
+        self.trace = []
+        self.wall_time = 0.0
+        self._start = None
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def attach(self, minimizer):
+        """
+        Context manager which instruments ``minimizer``, and any minimizers
+        it uses, for the duration of the context::
+
+            with instrumentation.attach(minimizer):
+                minimizer.execute()
+
+        :param minimizer: :class:`~symfit.core.minimizers.BaseMinimizer`.
+        """
+        originals = []
+        for instance in _nested_minimizers(minimizer):
+            wrapped = {key: value for key, value in vars(instance).items()
+                       if key.startswith('wrapped_')}
+            originals.append((instance, wrapped))
+            for key, value in wrapped.items():
+                setattr(instance, key, self._wrap_attribute(key, value))
+
+        self._start = time.perf_counter()
+        try:
+            yield self
+        finally:
+            self.wall_time += time.perf_counter() - self._start
+            for instance, wrapped in originals:
+                for key, value in wrapped.items():
+                    setattr(instance, key, value)
+
+    def wrap(self, func, kind):
+        """
+        :param func: callable taking the free parameters as its first
+            argument.
+        :param kind: kind of evaluation ``func`` performs.
+        :return: ``func``, counted and timed. ``None`` is returned as is.
+        """
+        if func is None:
+            return None
+        def instrumented(x, *args, **kwargs):
+            self._before(kind)
+            start = time.perf_counter()
+            value = func(x, *args, **kwargs)
+            self._record(kind, x, value, start, time.perf_counter())
+            return value
+        return instrumented
+
+    def summary(self):
+        """
+        :return: dict with the number of evaluations and the time spent on
+            them for every kind of evaluation, the total ``wall_time``, and
+            the time spent elsewhere, e.g. in the algorithm itself, as
+            ``overhead``.
+        """
+        return {
+            'counts': dict(self.counts),
+            'timings': dict(self.timings),
+            'wall_time': self.wall_time,
+            'overhead': self.wall_time - sum(self.timings.values()),
+        }
+
+    def _wrap_attribute(self, key, value):
+        if key in _WRAPPED_KINDS:
+            return self.wrap(value, _WRAPPED_KINDS[key])
+        elif key == 'wrapped_constraints':
+            return [self._wrap_constraint(constraint) for constraint in value]
+        return value
+
+    def _wrap_constraint(self, constraint):
+        """
+        Wrap the callables of a constraint, as given to scipy either as a
+        dict or as an object such as
+        :class:`~scipy.optimize.NonlinearConstraint`.
+        """
+        if isinstance(constraint, dict):
+            constraint = dict(constraint)
+            for key, kind in _CONSTRAINT_KINDS.items():
+                if callable(constraint.get(key)):
+                    constraint[key] = self.wrap(constraint[key], kind)
+        else:
+            constraint = copy.copy(constraint)
+            for key, kind in _CONSTRAINT_KINDS.items():
+                if callable(getattr(constraint, key, None)):
+                    setattr(constraint, key, self.wrap(getattr(constraint, key), kind))
+        return constraint
+
+    def _before(self, kind):
+        """
+        Called before every evaluation of the given ``kind``.
+        """
+        pass
+
+    def _record(self, kind, x, value, start, end):
+        event = {'kind': kind, 'params': np.array(x, dtype=float),
+                 'duration': end - start, 'time': end - self._start}
+        if kind == 'objective':
+            event['objective'] = value
+        elif kind == 'jacobian':
+            event['gradient_norm'] = np.linalg.norm(value)
+
+        with self._lock:
+            self.counts[kind] += 1
+            self.timings[kind] += end - start
+            if self.record_trace and kind in ('objective', 'jacobian'):
+                self._update_trace(event)
+        self._emit(event)
+
+    def _emit(self, event):
+        """
+        Pass ``event`` on to whoever is interested.
+        """
+        if self.callback is not None:
+            self.callback(event)
+
+    def _update_trace(self, event):
+        """
+        Add ``event`` to the entry of the trace for the same point, or start
+        a new entry.
+        """
+        key = 'objective' if event['kind'] == 'objective' else 'gradient_norm'
+        if self.trace:
+            last = self.trace[-1]
+            if last[key] is None and np.array_equal(last['params'], event['params']):
+                last[key] = event[key]
+                return
+        entry = {'params': event['params'], 'objective': None,
+                 'gradient_norm': None, 'time': event['time']}
+        entry[key] = event[key]
+        self.trace.append(entry)
+
+    def __getstate__(self):
+        # Neither the callback nor the lock can be expected to pickle.
+        state = self.__dict__.copy()
+        del state['_lock']
+        state['callback'] = None
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+
+class BudgetExceeded(Exception):
+    """
+    Raised by the callables wrapped by a
+    :class:`~symfit.core.instrumentation.Budget` when it runs out.
+    """
+    pass
+
+
+class Budget(Instrumentation):
+    """
+    Limits the wall time and the number of evaluations of the objective and
+    its Jacobian of a minimization. This works the same for every minimizer,
+    unlike their own options such as ``maxiter`` or ``maxfev``. When the
+    budget runs out the minimization is stopped, and the best point found so
+    far is returned as the result::
+
+        budget = Budget(max_seconds=10, max_nfev=1000)
+        fit_result = fit.execute(budget=budget)
+        if fit_result.minimizer_output['budget_limited']:
+            ...
+
+    A budget can also be used on a minimizer directly, with
+    ``budget.execute(minimizer)``; there is no ``budget`` option on
+    :meth:`~symfit.core.minimizers.BaseMinimizer.execute`. Like for
+    :class:`~symfit.core.instrumentation.Instrumentation`, evaluations in
+    other processes are not accounted for.
+    """
+    def __init__(self, max_seconds=None, max_nfev=None, max_njev=None,
+                 **kwargs):
+        """
+        :param max_seconds: maximum wall time in seconds.
+        :param max_nfev: maximum number of evaluations of the objective.
+        :param max_njev: maximum number of evaluations of the Jacobian.
+        :param kwargs: passed on to
+            :class:`~symfit.core.instrumentation.Instrumentation`.
+        """
+        super(Budget, self).__init__(**kwargs)
+        self.max_seconds = max_seconds
+        self.max_nfev = max_nfev
+        self.max_njev = max_njev
+        self._n_params = None
+        self._best = None
+
+    def execute(self, minimizer, **minimize_options):
+        """
+        Execute ``minimizer`` within this budget.
+
+        :param minimizer: :class:`~symfit.core.minimizers.BaseMinimizer`.
+        :param minimize_options: passed on to ``minimizer.execute``.
+        :return: :class:`~symfit.core.fit_results.FitResults`. Its
+            ``minimizer_output['budget_limited']`` tells whether the budget
+            ran out, in which case it holds the best point found.
+        """
+        self.counts.clear()
+        self.timings.clear()
+        self.trace = []
+        self._n_params = len(minimizer.params)
+        self._best = None
+        with self.attach(minimizer):
+            try:
+                ans = minimizer.execute(**minimize_options)
+            except BudgetExceeded as error:
+                ans = self._best_result(minimizer, error)
+            else:
+                ans.minimizer_output['budget_limited'] = False
+        return ans
+
+    def _before(self, kind):
+        if (self.max_seconds is not None and
+                time.perf_counter() - self._start > self.max_seconds):
+            raise BudgetExceeded('Exceeded the budget of {} '
+                                 'seconds.'.format(self.max_seconds))
+        if (kind == 'objective' and self.max_nfev is not None and
+                self.counts['objective'] >= self.max_nfev):
+            raise BudgetExceeded('Exceeded the budget of {} objective '
+                                 'evaluations.'.format(self.max_nfev))
+        if (kind == 'jacobian' and self.max_njev is not None and
+                self.counts['jacobian'] >= self.max_njev):
+            raise BudgetExceeded('Exceeded the budget of {} jacobian '
+                                 'evaluations.'.format(self.max_njev))
+
+    def _record(self, kind, x, value, start, end):
+        super(Budget, self)._record(kind, x, value, start, end)
+        # Local minimizers can work on fewer parameters, such as those of
+        # VariableProjection. Only points for all free parameters qualify.
+        if kind == 'objective' and np.size(x) == self._n_params:
+            score = np.sum(np.square(value)) if np.ndim(value) else value
+            with self._lock:
+                if self._best is None or score < self._best[0]:
+                    self._best = (score, np.array(x, dtype=float), value)
+
+    def _best_result(self, minimizer, error):
+        """
+        :return: :class:`~symfit.core.fit_results.FitResults` for the best
+            point found before the budget ran out, or the initial guesses if
+            there is none.
+        """
+        if self._best is None:
+            x = np.array(minimizer.initial_guesses, dtype=float)
+            fun = minimizer.objective(x)
+        else:
+            _, x, fun = self._best
+        ans = OptimizeResult(
+            x=x, fun=fun, success=False, status=-1, message=str(error),
+            nfev=self.counts['objective'], njev=self.counts['jacobian'],
+            budget_limited=True
+        )
+        return minimizer._pack_output(ans)
+
+
+class Cancelled(Exception):
+    """
+    Raised by the callables wrapped by a
+    :class:`~symfit.core.instrumentation.Progress` once it has been cancelled.
+    """
+    pass
+
+
+# Put in the queue of a Progress when its minimization is done.
+_DONE = object()
+
+
+class Progress(Instrumentation):
+    """
+    Reports on a minimization running in an executor to an :mod:`asyncio`
+    event loop, and lets the loop cancel it. A progress is an asynchronous
+    iterator over the events, see
+    :class:`~symfit.core.instrumentation.Instrumentation`, which ends when the
+    minimization does::
+
+        progress = Progress()
+        task = asyncio.ensure_future(fit.execute_async(progress=progress))
+        async for event in progress:
+            ...
+        fit_result = await task
+
+    Only the newest event is kept for the iterator, so a slow consumer skips
+    events rather than falling behind, and no events are kept at all until
+    someone iterates. Use ``callback`` or ``counts`` to see every evaluation.
+
+    A minimization is cancelled by cancelling the task awaiting it, or by
+    :meth:`cancel`. The minimization itself stops at the next evaluation of
+    the objective or its derivatives. Use one progress per minimization.
+    """
+    def __init__(self, **kwargs):
+        """
+        :param kwargs: passed on to
+            :class:`~symfit.core.instrumentation.Instrumentation`.
+        """
+        super(Progress, self).__init__(**kwargs)
+        self._cancelled = threading.Event()
+        self._loop = None
+        self._queue = None
+        self._iterating = False
+        self._finished = False
+        self._newest = None
+        self._delivery_scheduled = False
+
+    def cancel(self):
+        """
+        Stop the minimization at its next evaluation, which raises
+        :class:`~symfit.core.instrumentation.Cancelled`.
+        """
+        self._cancelled.set()
+
+    @property
+    def cancelled(self):
+        """
+        `True` if :meth:`cancel` has been called.
+        """
+        return self._cancelled.is_set()
+
+    def execute(self, minimizer, **minimize_options):
+        """
+        Execute ``minimizer`` with this progress attached.
+
+        :param minimizer: :class:`~symfit.core.minimizers.BaseMinimizer`.
+        :param minimize_options: passed on to ``minimizer.execute``.
+        :return: :class:`~symfit.core.fit_results.FitResults`.
+        """
+        with self.attach(minimizer):
+            return minimizer.execute(**minimize_options)
+
+    async def run(self, func, executor=None):
+        """
+        Call ``func`` in ``executor`` without blocking the event loop, and
+        stream the events to it. If the awaiting task is cancelled, so is the
+        minimization.
+
+        :param func: callable without arguments which performs a minimization
+            with this progress attached, e.g. ``partial(self.execute,
+            minimizer)``.
+        :param executor: :class:`~concurrent.futures.Executor` to run ``func``
+            in. By default the default executor of the loop is used. Since
+            events and cancellation are passed between threads, this should
+            not be a :class:`~concurrent.futures.ProcessPoolExecutor`.
+        :return: whatever ``func`` returns.
+        """
+        self._loop = asyncio.get_event_loop()
+        queue = self._get_queue()
+        try:
+            return await self._loop.run_in_executor(executor, func)
+        except asyncio.CancelledError:
+            self.cancel()
+            raise
+        finally:
+            self._put_newest(_DONE)
+
+    def _get_queue(self):
+        # The queue can only be made from within the loop it is used in.
+        if self._queue is None:
+            self._queue = asyncio.Queue(maxsize=1)
+        return self._queue
+
+    def _put_newest(self, event):
+        """
+        Put ``event`` in the queue, replacing an event nobody has taken yet.
+        Must be called from within the loop.
+        """
+        if self._finished and event is not _DONE:
+            return
+        self._finished = event is _DONE
+        queue = self._get_queue()
+        if queue.full():
+            queue.get_nowait()
+        queue.put_nowait(event)
+
+    def _deliver(self):
+        # Called in the loop, with the newest event since the last delivery.
+        with self._lock:
+            event = self._newest
+            self._newest = None
+            self._delivery_scheduled = False
+        if event is not None:
+            self._put_newest(event)
+
+    def _before(self, kind):
+        if self.cancelled:
+            raise Cancelled('The minimization was cancelled.')
+
+    def _emit(self, event):
+        super(Progress, self)._emit(event)
+        loop = self._loop
+        if not self._iterating or loop is None or loop.is_closed():
+            return
+        # Wake the loop only once for all events until it has been delivered.
+        with self._lock:
+            self._newest = event
+            if self._delivery_scheduled:
+                return
+            self._delivery_scheduled = True
+        loop.call_soon_threadsafe(self._deliver)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        self._iterating = True
+        queue = self._get_queue()
+        event = await queue.get()
+        if event is _DONE:
+            # Leave it for any other iterators.
+            self._put_newest(_DONE)
+            raise StopAsyncIteration
+        return event
+
+    def __getstate__(self):
+        state = super(Progress, self).__getstate__()
+        state['_cancelled'] = self.cancelled
+        state['_loop'] = state['_queue'] = state['_newest'] = None
+        state['_iterating'] = state['_finished'] = False
+        state['_delivery_scheduled'] = False
+        return state
+
+    def __setstate__(self, state):
+        cancelled = state.pop('_cancelled')
+        super(Progress, self).__setstate__(state)
+        self._cancelled = threading.Event()
+        if cancelled:
+            self._cancelled.set()
+
+
+def _nested_minimizers(minimizer):
+    """
+    :return: list of ``minimizer`` and the minimizers it uses, such as the
+        ``local_minimizer`` of :class:`~symfit.core.minimizers.BasinHopping`
+        or the ``minimizers`` of
+        :class:`~symfit.core.minimizers.ChainedMinimizer`.
+    """
+    found = [minimizer]
+    children = list(getattr(minimizer, 'minimizers', []))
+    if getattr(minimizer, 'local_minimizer', None) is not None:
+        children.append(minimizer.local_minimizer)
+    for child in children:
+        if not isinstance(child, type):
+            found.extend(_nested_minimizers(child))
+    return found
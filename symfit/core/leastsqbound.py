@@ -3,28 +3,50 @@
 import warnings
 
 from numpy import array, take, eye, triu, transpose, dot, finfo
-from numpy import empty_like, sqrt, cos, sin, arcsin, asarray
+from numpy import ones_like, flatnonzero, sqrt, cos, sin, arcsin, asarray
 from numpy import atleast_1d, shape, issubdtype, dtype, inexact
 from scipy.optimize import _minpack, leastsq
 
 
-def _internal2external_grad(xi, bounds):
+def _bound_indices(bounds):
     """
-    Calculate the internal (unconstrained) to external (constained)
-    parameter gradiants.
+    Classify the parameters by the kind of bounds they have.
+
+    :return: arrays of the lower and upper bounds, zero where absent, and the
+        indices of the parameters with only a lower bound, only an upper
+        bound, and both bounds. Other parameters are unbounded.
+    """
+    has_lower = array([lower is not None for lower, _ in bounds], dtype=bool)
+    has_upper = array([upper is not None for _, upper in bounds], dtype=bool)
+    lower = array([0. if lower is None else lower for lower, _ in bounds],
+                  dtype=float)
+    upper = array([0. if upper is None else upper for _, upper in bounds],
+                  dtype=float)
+    return (lower, upper, flatnonzero(has_lower & ~has_upper),
+            flatnonzero(~has_lower & has_upper),
+            flatnonzero(has_lower & has_upper))
+
+
+def _internal2external_grad_func(bounds):
     """
-    grad = empty_like(xi)
-    for i, (v, bound) in enumerate(zip(xi, bounds)):
-        lower, upper = bound
-        if lower is None and upper is None:  # No constraints
-            grad[i] = 1.0
-        elif upper is None:     # only lower bound
-            grad[i] = v / sqrt(v * v + 1.)
-        elif lower is None:     # only upper bound
-            grad[i] = -v / sqrt(v * v + 1.)
-        else:   # lower and upper bounds
-            grad[i] = (upper - lower) * cos(v) / 2.
-    return grad
+    Make a function which calculates the internal (unconstrained) to external
+    (constained) parameter gradiants.
+    """
+    lower, upper, lower_only, upper_only, both = _bound_indices(bounds)
+    both_half_range = (upper[both] - lower[both]) / 2.
+
+    def convert_grad(xi):
+        xi = asarray(xi)
+        grad = ones_like(xi, dtype=float)
+        if len(lower_only):
+            grad[lower_only] = xi[lower_only] / sqrt(xi[lower_only] ** 2 + 1.)
+        if len(upper_only):
+            grad[upper_only] = -xi[upper_only] / sqrt(xi[upper_only] ** 2 + 1.)
+        if len(both):
+            grad[both] = both_half_range * cos(xi[both])
+        return grad
+
+    return convert_grad
 
 
 def _internal2external_func(bounds):
@@ -32,65 +54,51 @@ def _internal2external_func(bounds):
     Make a function which converts between internal (unconstrained) and
     external (constrained) parameters.
     """
-    ls = [_internal2external_lambda(b) for b in bounds]
+    lower, upper, lower_only, upper_only, both = _bound_indices(bounds)
+    lower_only_min = lower[lower_only] - 1.
+    upper_only_max = upper[upper_only] + 1.
+    both_min = lower[both]
+    both_half_range = (upper[both] - lower[both]) / 2.
 
     def convert_i2e(xi):
-        xe = empty_like(xi)
-        xe[:] = [l(p) for l, p in zip(ls, xi)]
+        xi = asarray(xi)
+        xe = array(xi, dtype=float)
+        if len(lower_only):
+            xe[lower_only] = lower_only_min + sqrt(xi[lower_only] ** 2 + 1.)
+        if len(upper_only):
+            xe[upper_only] = upper_only_max - sqrt(xi[upper_only] ** 2 + 1.)
+        if len(both):
+            xe[both] = both_min + both_half_range * (sin(xi[both]) + 1.)
         return xe
 
     return convert_i2e
 
 
-def _internal2external_lambda(bound):
-    """
-    Make a lambda function which converts a single internal (uncontrained)
-    parameter to a external (constrained) parameter.
-    """
-    lower, upper = bound
-
-    if lower is None and upper is None:  # no constraints
-        return lambda x: x
-    elif upper is None:     # only lower bound
-        return lambda x: lower - 1. + sqrt(x * x + 1.)
-    elif lower is None:     # only upper bound
-        return lambda x: upper + 1. - sqrt(x * x + 1.)
-    else:
-        return lambda x: lower + ((upper - lower) / 2.) * (sin(x) + 1.)
-
-
 def _external2internal_func(bounds):
     """
     Make a function which converts between external (constrained) and
     internal (unconstrained) parameters.
     """
-    ls = [_external2internal_lambda(b) for b in bounds]
+    lower, upper, lower_only, upper_only, both = _bound_indices(bounds)
+    lower_only_min = lower[lower_only] - 1.
+    upper_only_max = upper[upper_only] + 1.
+    both_min = lower[both]
+    both_range = upper[both] - lower[both]
 
     def convert_e2i(xe):
-        xi = empty_like(xe)
-        xi[:] = [l(p) for l, p in zip(ls, xe)]
+        xe = asarray(xe)
+        xi = array(xe, dtype=float)
+        if len(lower_only):
+            xi[lower_only] = sqrt((xe[lower_only] - lower_only_min) ** 2 - 1.)
+        if len(upper_only):
+            xi[upper_only] = sqrt((upper_only_max - xe[upper_only]) ** 2 - 1.)
+        if len(both):
+            xi[both] = arcsin(2. * (xe[both] - both_min) / both_range - 1.)
         return xi
 
     return convert_e2i
 
 
-def _external2internal_lambda(bound):
-    """
-    Make a lambda function which converts an single external (constrained)
-    parameter to a internal (unconstrained) parameter.
-    """
-    lower, upper = bound
-
-    if lower is None and upper is None:  # no constraints
-        return lambda x: x
-    elif upper is None:     # only lower bound
-        return lambda x: sqrt((x - lower + 1.) ** 2 - 1)
-    elif lower is None:     # only upper bound
-        return lambda x: sqrt((upper - x + 1.) ** 2 - 1)
-    else:
-        return lambda x: arcsin((2. * (x - lower) / (upper - lower)) - 1.)
-
-
 def _check_func(checker, argname, thefunc, x0, args, numinputs,
                 output_shape=None):
     res = atleast_1d(thefunc(*((x0[:numinputs],) + args)))
@@ -265,6 +273,7 @@ def leastsqbound(func, x0, args=(), bounds=None, Dfun=None, full_output=0,
     # create function which convert between internal and external parameters
     i2e = _internal2external_func(bounds)
     e2i = _external2internal_func(bounds)
+    i2e_grad = _internal2external_grad_func(bounds)
 
     x0 = asarray(x0).flatten()
     i0 = e2i(x0)
@@ -347,7 +356,7 @@ def leastsqbound(func, x0, args=(), bounds=None, Dfun=None, full_output=0,
 
     if full_output:
         # convert fjac from internal params to external
-        grad = _internal2external_grad(retval[0], bounds)
+        grad = i2e_grad(retval[0])
         retval[1]['fjac'] = (retval[1]['fjac'].T / take(grad,
                              retval[1]['ipvt'] - 1)).T
         cov_x = None
@@ -1,6 +1,9 @@
 import abc
+import os
+import pickle
 import sys
 from collections import namedtuple, Counter, OrderedDict
+from itertools import repeat
 
 from scipy.optimize import (
     minimize, differential_evolution, basinhopping, NonlinearConstraint,
@@ -10,10 +13,15 @@ from scipy.optimize import BFGS as soBFGS
 import sympy
 import numpy as np
 
-from .support import keywordonly
+from .support import keywordonly, partial
 from .leastsqbound import leastsqbound
+from .argument import parameter_settings
 from .fit_results import FitResults
-from .objectives import BaseObjective, MinimizeModel
+from .instrumentation import Progress
+from .objectives import (
+    BaseObjective, GradientObjective, MinimizeModel, LeastSquares,
+    _directional_derivative
+)
 from .models import CallableNumericalModel, BaseModel
 
 if sys.version_info >= (3,0):
@@ -30,18 +38,34 @@ class BaseMinimizer(object):
     """
     ABC for all Minimizers.
     """
-    def __init__(self, objective, parameters):
+    def __init__(self, objective, parameters, parameter_state=None):
         """
         :param objective: Objective function to be used.
         :param parameters: List of :class:`~symfit.core.argument.Parameter` instances
+        :param parameter_state: Optionally, a
+            :class:`~symfit.core.argument.ParameterState` holding the initial
+            guesses, bounds and fixed parameters to use, instead of those of
+            ``parameters``.
         """
         self.parameters = parameters
-        self._fixed_params = [p for p in parameters if p.fixed]
+        self.parameter_state = parameter_state
+        self._fixed_params = [p for p in parameters if self._settings(p).fixed]
         self.objective = self._baseobjective_from_callable(objective)
+        # The objective as it is handed to the algorithm. This can be wrapped
+        # to monitor the minimization, see symfit.core.instrumentation.
+        self.wrapped_objective = self.objective
 
         # Mapping which we use to track the original, to be used upon pickling
-        self._pickle_kwargs = {'parameters': parameters, 'objective': objective}
-        self.params = [p for p in parameters if not p.fixed]
+        self._pickle_kwargs = {'parameters': parameters, 'objective': objective,
+                               'parameter_state': parameter_state}
+        self.params = [p for p in parameters if not self._settings(p).fixed]
+
+    def _settings(self, param):
+        """
+        :return: :class:`~symfit.core.argument.ParameterSettings` of ``param``
+            to use in this minimization.
+        """
+        return parameter_settings(param, self.parameter_state)
 
     def _baseobjective_from_callable(self, func, objective_type=MinimizeModel):
         """
@@ -85,17 +109,68 @@ class BaseMinimizer(object):
         """
         pass
 
+    async def execute_async(self, executor=None, progress=None,
+                            **minimize_options):
+        """
+        Coroutine which runs :meth:`execute` in an executor, such that an
+        :mod:`asyncio` event loop is not blocked by it.
+
+        :param executor: :class:`~concurrent.futures.Executor` to run the
+            minimization in, the default executor of the loop by default. A
+            :class:`~concurrent.futures.ThreadPoolExecutor` limits the number
+            of minimizations running at the same time.
+        :param progress: Optionally, a
+            :class:`~symfit.core.instrumentation.Progress` to follow or cancel
+            the minimization with.
+        :param minimize_options: passed on to :meth:`execute`.
+        :return:  an instance of :class:`~symfit.core.fit_results.FitResults`.
+        """
+        if progress is None:
+            progress = Progress()
+        return await progress.run(
+            partial(progress.execute, self, **minimize_options), executor
+        )
+
     @property
     def initial_guesses(self):
         try:
             return self._initial_guesses
         except AttributeError:
-            return [p.value for p in self.params]
+            return [self._settings(p).value for p in self.params]
 
     @initial_guesses.setter
     def initial_guesses(self, vals):
         self._initial_guesses = vals
 
+    def _pack_output(self, ans):
+        """
+        Packs the output of a minimization in a
+        :class:`~symfit.core.fit_results.FitResults`.
+
+        :param ans: The output of a minimization as produced by
+            :func:`scipy.optimize.minimize`
+        :returns: :class:`~symfit.core.fit_results.FitResults`
+        """
+        best_vals = []
+        found = iter(np.atleast_1d(ans.x))
+        for param in self.parameters:
+            settings = self._settings(param)
+            if settings.fixed:
+                best_vals.append(settings.value)
+            else:
+                best_vals.append(next(found))
+
+        fit_results = dict(
+            model=DummyModel(params=self.parameters),
+            popt=best_vals,
+            covariance_matrix=None,
+            objective=self.objective,
+            minimizer=self,
+            **ans
+        )
+
+        return FitResults(**fit_results)
+
     def __getstate__(self):
         return {key: value for key, value in self.__dict__.items()
                 if not key.startswith('wrapped_')}
@@ -110,7 +185,8 @@ class BoundedMinimizer(BaseMinimizer):
     """
     @property
     def bounds(self):
-        return [(p.min, p.max) for p in self.params]
+        return [(self._settings(p).min, self._settings(p).max)
+                for p in self.params]
 
 class ConstrainedMinimizer(BaseMinimizer):
     """
@@ -198,6 +274,38 @@ class HessianMinimizer(GradientMinimizer):
         return resized
 
 
+class HessianProductMinimizer(GradientMinimizer):
+    """
+    ABC for Minimizers that only need products of the Hessian with a vector.
+    For models with many parameters these are much cheaper than the Hessian.
+    """
+    @keywordonly(hessp=None)
+    def __init__(self, *args, **kwargs):
+        self.hessp = kwargs.pop('hessp')
+        super(HessianProductMinimizer, self).__init__(*args, **kwargs)
+        self._pickle_kwargs['hessp'] = self.hessp
+        if self.hessp is not None:
+            # Like the jacobian, hessp has an entry per parameter.
+            self.wrapped_hessp = self.resize_jac(self.hessp)
+        else:
+            self.wrapped_hessp = None
+
+    def _approx_jacobian(self, x):
+        """
+        Central difference estimate of the jacobian, for when it is unknown.
+        """
+        return np.array([_directional_derivative(self.wrapped_objective, x, unit)
+                         for unit in np.eye(len(x))])
+
+    def _approx_hessp(self, x, vector):
+        """
+        Estimate the hessian-vector product by differentiating the jacobian in
+        the direction of ``vector``, for when no hessp is known.
+        """
+        jacobian = self.wrapped_jacobian or self._approx_jacobian
+        return _directional_derivative(jacobian, x, vector)
+
+
 class GlobalMinimizer(BaseMinimizer):
     """
     A minimizer that looks for a global minimum, instead of a local one.
@@ -345,7 +453,7 @@ class ScipyMinimize(object):
             usually be filled by a specific subclass.
         """
         ans = minimize(
-            self.objective,
+            self.wrapped_objective,
             self.initial_guesses,
             method=self.method_name(),
             bounds=bounds,
@@ -356,34 +464,6 @@ class ScipyMinimize(object):
         )
         return self._pack_output(ans)
 
-    def _pack_output(self, ans):
-        """
-        Packs the output of a minimization in a
-        :class:`~symfit.core.fit_results.FitResults`.
-
-        :param ans: The output of a minimization as produced by
-            :func:`scipy.optimize.minimize`
-        :returns: :class:`~symfit.core.fit_results.FitResults`
-        """
-        best_vals = []
-        found = iter(np.atleast_1d(ans.x))
-        for param in self.parameters:
-            if param.fixed:
-                best_vals.append(param.value)
-            else:
-                best_vals.append(next(found))
-
-        fit_results = dict(
-            model=DummyModel(params=self.parameters),
-            popt=best_vals,
-            covariance_matrix=None,
-            objective=self.objective,
-            minimizer=self,
-            **ans
-        )
-
-        return FitResults(**fit_results)
-
     @classmethod
     def method_name(cls):
         """
@@ -456,6 +536,26 @@ class ScipyHessianMinimize(ScipyGradientMinimize, HessianMinimizer):
         return cons
 
 
+class ScipyHessianProductMinimize(ScipyGradientMinimize, HessianProductMinimizer):
+    """
+    Base class for :func:`scipy.optimize.minimize`'s minimizers which use
+    Hessian-vector products.
+    """
+    @keywordonly(jacobian=None, hessp=None)
+    def execute(self, **minimize_options):
+        # These methods cannot do without a jacobian and hessp, so they are
+        # estimated numerically if needed.
+        jacobian = minimize_options.pop('jacobian')
+        if jacobian is None:
+            jacobian = self.wrapped_jacobian or self._approx_jacobian
+        hessp = minimize_options.pop('hessp')
+        if hessp is None:
+            hessp = self.wrapped_hessp or self._approx_hessp
+        return super(ScipyHessianProductMinimize, self).execute(
+            jacobian=jacobian, hessp=hessp, **minimize_options
+        )
+
+
 class ScipyConstrainedMinimize(ScipyMinimize, ConstrainedMinimizer):
     """
     Base class for :func:`scipy.optimize.minimize`'s constrained-minimizers.
@@ -645,18 +745,195 @@ class TrustConstr(ScipyHessianMinimize, ScipyConstrainedMinimize, ScipyBoundedMi
         return ans
 
 
+class NewtonCG(ScipyHessianProductMinimize):
+    """
+    Wrapper around :func:`scipy.optimize.minimize`'s Newton-CG algorithm.
+    """
+    @classmethod
+    def method_name(cls):
+        return 'Newton-CG'
+
+class TrustNCG(ScipyHessianProductMinimize):
+    """
+    Wrapper around :func:`scipy.optimize.minimize`'s Trust-NCG algorithm.
+    """
+    @classmethod
+    def method_name(cls):
+        return 'trust-ncg'
+
+class TrustKrylov(ScipyHessianProductMinimize):
+    """
+    Wrapper around :func:`scipy.optimize.minimize`'s Trust-Krylov algorithm.
+    """
+    @classmethod
+    def method_name(cls):
+        return 'trust-krylov'
+
+
 class DifferentialEvolution(ScipyBoundedMinimizer, GlobalMinimizer):
     """
     A wrapper around :func:`scipy.optimize.differential_evolution`.
     """
     @keywordonly(strategy='rand1bin', popsize=40, mutation=(0.423, 1.053),
-                 recombination=0.95, polish=False, init='latinhypercube')
+                 recombination=0.95, polish=False, init='latinhypercube',
+                 checkpoint=None, checkpoint_interval=10, resume=False)
     def execute(self, **de_options):
-        ans = differential_evolution(self.objective,
-                                     self.bounds,
-                                     **de_options)
+        """
+        :param checkpoint: Optionally, the path of a file to which the state
+            of the minimization is saved every ``checkpoint_interval``
+            generations, such that it can be resumed if it gets interrupted.
+        :param checkpoint_interval: number of generations between checkpoints.
+        :param resume: If `True`, continue from ``checkpoint`` if that file
+            exists. This way, a job can simply be restarted as is.
+        :param de_options: options to be passed on to
+            :func:`scipy.optimize.differential_evolution`.
+        :return: :class:`~symfit.core.fit_results.FitResults`
+        """
+        checkpoint = de_options.pop('checkpoint')
+        checkpoint_interval = de_options.pop('checkpoint_interval')
+        resume = de_options.pop('resume')
+        if checkpoint is None:
+            ans = differential_evolution(self.wrapped_objective,
+                                         self.bounds,
+                                         **de_options)
+        else:
+            ans = self._execute_checkpointed(checkpoint, checkpoint_interval,
+                                             resume, de_options)
         return self._pack_output(ans)
 
+    def _execute_checkpointed(self, checkpoint, checkpoint_interval, resume,
+                              de_options):
+        """
+        Evolve the population one generation at a time, saving the
+        population, its energies, the random state and the counters every
+        ``checkpoint_interval`` generations.
+        """
+        maxiter = de_options.pop('maxiter', 1000)
+        maxfun = de_options.pop('maxfun', np.inf)
+        polish = de_options.pop('polish')
+        callback = de_options.pop('callback', None)
+        # Settings which have to match for a checkpoint to be resumed from.
+        settings = {'strategy': de_options['strategy'],
+                    'popsize': de_options['popsize'],
+                    'bounds': [tuple(bound) for bound in self.bounds]}
+        try:
+            from scipy.optimize._differentialevolution import \
+                DifferentialEvolutionSolver
+        except ImportError:
+            raise ImportError('Checkpointing DifferentialEvolution requires a '
+                              'scipy version which provides '
+                              'DifferentialEvolutionSolver.')
+        objective = _CountingFunction(self.wrapped_objective)
+        solver = DifferentialEvolutionSolver(objective, self.bounds,
+                                             polish=False, **de_options)
+        nit = 0
+        if resume and os.path.exists(checkpoint):
+            state = _load_checkpoint(checkpoint, self, settings)
+            nit = state['nit']
+            objective.count = state['nfev']
+            solver.population = state['population']
+            solver.population_energies = state['population_energies']
+            solver.random_number_generator = state['random_state']
+
+        success = False
+        message = 'Maximum number of iterations has been exceeded.'
+        try:
+            while nit < maxiter:
+                if objective.count >= maxfun:
+                    message = ('Maximum number of function evaluations has '
+                               'been exceeded.')
+                    break
+                next(solver)
+                nit += 1
+                stop = callback is not None and bool(callback(
+                    solver.x, convergence=solver.tol / (
+                        solver.convergence + np.finfo(float).eps)
+                ))
+                converged = solver.converged()
+                if stop or converged or nit % checkpoint_interval == 0:
+                    _save_checkpoint(checkpoint, self, {
+                        'nit': nit,
+                        'population': solver.population,
+                        'population_energies': solver.population_energies,
+                        'random_state': solver.random_number_generator,
+                        'nfev': objective.count,
+                    }, settings)
+                if stop:
+                    message = 'callback function requested stop early'
+                    break
+                if converged:
+                    success = True
+                    message = 'Optimization terminated successfully.'
+                    break
+            ans = OptimizeResult(x=solver.x, fun=solver.population_energies[0],
+                                 nit=nit, nfev=objective.count,
+                                 success=success, message=message)
+        finally:
+            # Since scipy 1.4 the solver owns a pool of workers, which is
+            # released when leaving it as a context manager.
+            if hasattr(solver, '__exit__'):
+                solver.__exit__(None, None, None)
+        if polish:
+            polished = minimize(self.wrapped_objective, ans.x,
+                                method='L-BFGS-B', bounds=self.bounds)
+            ans.nfev += polished.nfev
+            if polished.fun < ans.fun:
+                ans.x, ans.fun, ans.jac = polished.x, polished.fun, polished.jac
+        return ans
+
+
+class _CountingFunction(object):
+    """
+    Wraps ``func`` to count how often it is called.
+    """
+    def __init__(self, func):
+        self.func = func
+        self.count = 0
+
+    def __call__(self, *args, **kwargs):
+        self.count += 1
+        return self.func(*args, **kwargs)
+
+def _save_checkpoint(path, minimizer, state, settings=None):
+    """
+    Save the ``state`` of ``minimizer`` to ``path``. The file is replaced at
+    once, so an interruption cannot leave a partially written checkpoint.
+
+    :param settings: dict of the settings of the minimization which have to
+        be the same to resume from this checkpoint.
+    """
+    state = dict(state, minimizer=minimizer.__class__.__name__,
+                 params=[p.name for p in minimizer.params],
+                 settings=settings or {})
+    with open(path + '.tmp', 'wb') as f:
+        pickle.dump(state, f)
+    os.replace(path + '.tmp', path)
+
+def _load_checkpoint(path, minimizer, settings=None):
+    """
+    :return: the state saved to ``path`` by :func:`_save_checkpoint`.
+    :raises ValueError: if the checkpoint is from another kind of minimization,
+        or from one with other ``settings``.
+    """
+    with open(path, 'rb') as f:
+        state = pickle.load(f)
+    params = [p.name for p in minimizer.params]
+    if (state['minimizer'] != minimizer.__class__.__name__ or
+            state['params'] != params):
+        raise ValueError(
+            'The checkpoint in {} is for a {} with parameters {}, not for a {} '
+            'with parameters {}.'.format(path, state['minimizer'],
+                                         state['params'],
+                                         minimizer.__class__.__name__, params)
+        )
+    settings = settings or {}
+    if state['settings'] != settings:
+        raise ValueError(
+            'The checkpoint in {} was made with settings {}, not {}.'.format(
+                path, state['settings'], settings)
+        )
+    return state
+
 
 class BasinHopping(ScipyMinimize, GlobalMinimizer):
     """
@@ -722,47 +999,338 @@ class BasinHopping(ScipyMinimize, GlobalMinimizer):
             if not issubclass(self.local_minimizer, ScipyMinimize):
                 # Only ScipyMinimize subclasses supported
                 raise TypeError(type_error_msg)
-            self.local_minimizer = self.local_minimizer(self.objective, self.parameters)
+            self.local_minimizer = self.local_minimizer(
+                self.objective, self.parameters,
+                parameter_state=self.parameter_state
+            )
 
+    @keywordonly(walkers=1, executor=None, exchange_interval=None,
+                 temperatures=None, checkpoint=None, checkpoint_interval=10,
+                 resume=False)
     def execute(self, **minimize_options):
         """
         Execute the basin-hopping minimization.
 
+        Several walkers can hop at the same time, each with its own random
+        steps, by setting ``walkers``. Every ``exchange_interval`` iterations
+        the walkers continue from the best minimum found so far by any of
+        them. If ``temperatures`` are given, a walker instead swaps its
+        lowest minimum with that of the walker at the next temperature,
+        following the Metropolis criterion (replica exchange).
+
+        :param walkers: number of walkers.
+        :param executor: If given, a :class:`concurrent.futures.Executor` used
+            to run the walkers in parallel.
+        :param exchange_interval: number of iterations after which walkers
+            exchange their minima. By default the walkers are independent.
+        :param temperatures: Optionally, a temperature ``T`` for each walker,
+            in increasing order.
+        :param checkpoint: Optionally, the path of a file to which the state
+            of the walkers is saved every ``checkpoint_interval`` iterations,
+            such that the minimization can be resumed if it gets interrupted.
+        :param checkpoint_interval: number of iterations between checkpoints.
+        :param resume: If `True`, continue from ``checkpoint`` if that file
+            exists. This way, a job can simply be restarted as is.
         :param minimize_options: options to be passed on to
-            :func:`scipy.optimize.basinhopping`.
+            :func:`scipy.optimize.basinhopping`. ``niter`` is the number of
+            iterations of each walker.
         :return: :class:`symfit.core.fit_results.FitResults`
         """
-        if 'minimizer_kwargs' not in minimize_options:
-            minimize_options['minimizer_kwargs'] = {}
-
-        if 'method' not in minimize_options['minimizer_kwargs']:
-            # If no minimizer was set by the user upon execute, use local_minimizer
-            minimize_options['minimizer_kwargs']['method'] = self.local_minimizer.method_name()
-        if 'jac' not in minimize_options['minimizer_kwargs'] and isinstance(self.local_minimizer, GradientMinimizer):
-            # Assign the jacobian
-            minimize_options['minimizer_kwargs']['jac'] = self.local_minimizer.wrapped_jacobian
-        if 'constraints' not in minimize_options['minimizer_kwargs'] and isinstance(self.local_minimizer, ConstrainedMinimizer):
-            # Assign constraints
-            minimize_options['minimizer_kwargs']['constraints'] = self.local_minimizer.wrapped_constraints
-        if 'bounds' not in minimize_options['minimizer_kwargs'] and isinstance(self.local_minimizer, BoundedMinimizer):
-            # Assign bounds
-            minimize_options['minimizer_kwargs']['bounds'] = self.local_minimizer.bounds
+        walkers = minimize_options.pop('walkers')
+        executor = minimize_options.pop('executor')
+        exchange_interval = minimize_options.pop('exchange_interval')
+        temperatures = minimize_options.pop('temperatures')
+        checkpoint = minimize_options.pop('checkpoint')
+        checkpoint_interval = minimize_options.pop('checkpoint_interval')
+        resume = minimize_options.pop('resume')
+        if walkers == 1 and temperatures is None and checkpoint is None:
+            ans = _hop(self, self.initial_guesses, minimize_options)
+        else:
+            ans = self._execute_walkers(
+                walkers, executor, exchange_interval, temperatures,
+                minimize_options, checkpoint=checkpoint,
+                checkpoint_interval=checkpoint_interval, resume=resume
+            )
 
-        ans = basinhopping(
-            self.objective,
-            self.initial_guesses,
-            **minimize_options
-        )
         if isinstance(ans.message, list):
             # For some reason this is currently a length one list containing
             # the message. We check just in case this gets fixed upstream in
             # future releases.
             ans.message = ans.message[0]
-        if 'constraints' in minimize_options['minimizer_kwargs']:
+        if (isinstance(self.local_minimizer, ConstrainedMinimizer) or
+                'constraints' in minimize_options.get('minimizer_kwargs', {})):
             # Add the constraints to the FitResults
             ans['constraints'] = self.local_minimizer.constraints
         return self._pack_output(ans)
 
+    def _basinhopping_options(self, minimize_options):
+        """
+        Complete the options for :func:`scipy.optimize.basinhopping` with the
+        properties of the local minimizer, without modifying the original.
+        """
+        minimize_options = dict(minimize_options)
+        minimizer_kwargs = dict(minimize_options.get('minimizer_kwargs', {}))
+        minimize_options['minimizer_kwargs'] = minimizer_kwargs
+
+        if 'method' not in minimizer_kwargs:
+            # If no minimizer was set by the user upon execute, use local_minimizer
+            minimizer_kwargs['method'] = self.local_minimizer.method_name()
+        if 'jac' not in minimizer_kwargs and isinstance(self.local_minimizer, GradientMinimizer):
+            # Assign the jacobian
+            minimizer_kwargs['jac'] = self.local_minimizer.wrapped_jacobian
+        if isinstance(self.local_minimizer, HessianProductMinimizer):
+            # Assign the Hessian-vector product, these methods require it
+            local_minimizer = self.local_minimizer
+            if minimizer_kwargs['jac'] is None:
+                minimizer_kwargs['jac'] = local_minimizer._approx_jacobian
+            if 'hessp' not in minimizer_kwargs:
+                minimizer_kwargs['hessp'] = local_minimizer.wrapped_hessp or local_minimizer._approx_hessp
+        if 'constraints' not in minimizer_kwargs and isinstance(self.local_minimizer, ConstrainedMinimizer):
+            # Assign constraints
+            minimizer_kwargs['constraints'] = self.local_minimizer.wrapped_constraints
+        if 'bounds' not in minimizer_kwargs and isinstance(self.local_minimizer, BoundedMinimizer):
+            # Assign bounds
+            minimizer_kwargs['bounds'] = self.local_minimizer.bounds
+        return minimize_options
+
+    def _execute_walkers(self, walkers, executor, exchange_interval,
+                         temperatures, minimize_options, checkpoint=None,
+                         checkpoint_interval=10, resume=False):
+        """
+        Run several basin-hopping walkers, which exchange their lowest minima
+        every ``exchange_interval`` iterations. See :meth:`execute`.
+
+        :return: :class:`scipy.optimize.OptimizeResult` of the best walker,
+            with the number of iterations and evaluations summed over all
+            walkers.
+        """
+        niter = minimize_options.pop('niter', 100)
+        replica_exchange = temperatures is not None
+        if temperatures is None:
+            temperatures = [minimize_options.pop('T', 1.0)] * walkers
+        elif len(temperatures) != walkers:
+            raise ValueError('Provide a temperature for each of the walkers.')
+        random_state = np.random.RandomState(
+            minimize_options.pop('seed', np.random.randint(2**31))
+        )
+
+        positions = [self.initial_guesses] * walkers
+        best = None
+        totals = Counter()
+        done = 0
+        if resume and checkpoint is not None and os.path.exists(checkpoint):
+            state = _load_checkpoint(checkpoint, self)
+            if len(state['positions']) != walkers:
+                raise ValueError('The checkpoint in {} has {} walkers, not '
+                                 '{}.'.format(checkpoint,
+                                              len(state['positions']),
+                                              walkers))
+            done, positions, best = state['done'], state['positions'], state['best']
+            totals, random_state = state['totals'], state['random_state']
+
+        while done < niter:
+            # Hop until the next exchange or checkpoint, whichever is first.
+            n_hops = niter - done
+            for interval in [exchange_interval, checkpoint is not None and checkpoint_interval]:
+                if interval:
+                    n_hops = min(n_hops, interval - done % interval)
+            options = [dict(minimize_options, niter=n_hops, T=temperature,
+                            seed=random_state.randint(2**31))
+                       for temperature in temperatures]
+            args = (repeat(self), positions, options)
+            if executor is None:
+                results = list(map(_hop, *args))
+            else:
+                results = list(executor.map(_hop, *args))
+            done += n_hops
+
+            for ans in results:
+                totals.update({key: ans[key] for key in
+                               ['nit', 'nfev', 'njev', 'nhev',
+                                'minimization_failures'] if key in ans})
+                if best is None or ans.fun < best.fun:
+                    best = ans
+            positions = [ans.x for ans in results]
+            if done % (exchange_interval or niter) == 0:
+                if replica_exchange:
+                    energies = [ans.fun for ans in results]
+                    for i in range(walkers - 1):
+                        j = i + 1
+                        delta = ((1. / temperatures[i] - 1. / temperatures[j]) *
+                                 (energies[i] - energies[j]))
+                        if delta >= 0 or random_state.rand() < np.exp(delta):
+                            positions[i], positions[j] = positions[j], positions[i]
+                            energies[i], energies[j] = energies[j], energies[i]
+                elif exchange_interval is not None:
+                    positions = [best.x] * walkers
+            if checkpoint is not None:
+                _save_checkpoint(checkpoint, self, {
+                    'done': done, 'positions': positions, 'best': best,
+                    'totals': totals, 'random_state': random_state,
+                })
+
+        ans = OptimizeResult(best)
+        ans.update(totals)
+        return ans
+
+
+def _hop(minimizer, x0, minimize_options):
+    """
+    Run :func:`scipy.optimize.basinhopping` for the
+    :class:`~symfit.core.minimizers.BasinHopping` ``minimizer``, starting
+    from ``x0``. Defined at module level such that it can be run by any
+    :class:`concurrent.futures.Executor`.
+    """
+    minimize_options = minimizer._basinhopping_options(minimize_options)
+    return basinhopping(minimizer.wrapped_objective, x0, **minimize_options)
+
+
+class MultiStart(GlobalMinimizer):
+    """
+    Runs a local minimizer from many initial guesses, spread within the bounds
+    of the parameters, and returns the best minimum found. Every parameter
+    should therefore have a ``min`` and a ``max``. The local minimizations are
+    independent, and can be run in parallel by providing a
+    :class:`concurrent.futures.Executor`::
+
+        from concurrent.futures import ProcessPoolExecutor
+
+        fit = Fit(model, x=xdata, y=ydata, minimizer=MultiStart)
+        with ProcessPoolExecutor() as executor:
+            fit_result = fit.execute(n_starts=50, executor=executor)
+
+    The distinct minima found are available as
+    ``fit_result.minimizer_output['minima']``, best first.
+    """
+    @keywordonly(local_minimizer=BFGS)
+    def __init__(self, *args, **kwargs):
+        """
+        :param local_minimizer: minimizer to be used for the local
+            minimizations, as a subclass or instance of
+            :class:`~symfit.core.minimizers.BaseMinimizer`.
+        :param args: positional arguments to be passed on to `super`.
+        :param kwargs: keyword arguments to be passed on to `super`.
+        """
+        self.local_minimizer = kwargs.pop('local_minimizer')
+        super(MultiStart, self).__init__(*args, **kwargs)
+        self._pickle_kwargs['local_minimizer'] = self.local_minimizer
+        if isinstance(self.local_minimizer, type):
+            self.local_minimizer = self.local_minimizer(
+                self.objective, self.parameters,
+                parameter_state=self.parameter_state
+            )
+
+    def sample(self, n, sampling='latin-hypercube', seed=None):
+        """
+        Sample initial guesses within the bounds of the parameters.
+
+        :param n: number of samples.
+        :param sampling: ``'latin-hypercube'`` or ``'sobol'``. The latter
+            needs ``scipy >= 1.7``.
+        :param seed: seed for the random number generator.
+        :return: array of shape ``(n, len(self.params))``.
+        """
+        bounds = [(self._settings(p).min, self._settings(p).max)
+                  for p in self.params]
+        if any(bound is None for bound in np.ravel(bounds)):
+            raise ValueError('MultiStart needs a min and max for every free '
+                             'parameter to sample from.')
+        lower, upper = np.array(bounds, dtype=float).T
+        random_state = np.random.RandomState(seed)
+        if sampling == 'latin-hypercube':
+            # One sample in each of n equal strata, randomly paired up over
+            # the dimensions.
+            unit = (random_state.rand(n, len(self.params)) +
+                    np.arange(n)[:, None]) / n
+            for column in unit.T:
+                random_state.shuffle(column)
+        elif sampling == 'sobol':
+            try:
+                from scipy.stats import qmc
+            except ImportError:
+                raise ImportError('Sobol sampling requires scipy >= 1.7.')
+            sampler = qmc.Sobol(len(self.params), seed=random_state)
+            unit = sampler.random(n)
+        else:
+            raise ValueError('Unknown sampling `{}`.'.format(sampling))
+        return lower + unit * (upper - lower)
+
+    @keywordonly(n_starts=20, sampling='latin-hypercube', seed=None,
+                 executor=None, xtol=1e-4)
+    def execute(self, **minimize_options):
+        """
+        Execute the local minimizer from ``n_starts`` initial guesses.
+
+        :param n_starts: number of local minimizations. The first one starts
+            from the initial guesses, the others from :meth:`sample`.
+        :param sampling: sampling strategy, see :meth:`sample`.
+        :param seed: seed used for sampling.
+        :param executor: If given, a :class:`concurrent.futures.Executor` used
+            to run the local minimizations in parallel.
+        :param xtol: minima whose parameters agree within this tolerance,
+            relative and absolute, are considered the same.
+        :param minimize_options: options to be passed on to the ``execute``
+            of the local minimizer.
+        :return: :class:`symfit.core.fit_results.FitResults` of the best
+            minimum.
+        """
+        n_starts = minimize_options.pop('n_starts')
+        sampling = minimize_options.pop('sampling')
+        seed = minimize_options.pop('seed')
+        executor = minimize_options.pop('executor')
+        xtol = minimize_options.pop('xtol')
+
+        starts = [self.initial_guesses]
+        if n_starts > 1:
+            starts.extend(self.sample(n_starts - 1, sampling=sampling, seed=seed))
+        args = (repeat(self.local_minimizer), starts, repeat(minimize_options))
+        if executor is None:
+            answers = list(map(_execute_from, *args))
+        else:
+            answers = list(executor.map(_execute_from, *args))
+
+        converged = [ans for ans in answers
+                     if ans.minimizer_output.get('success', True)]
+        minima = []
+        for ans in sorted(converged or answers, key=_objective_value):
+            x = np.array(ans._popt, dtype=float)
+            if not any(np.allclose(x, minimum._popt, rtol=xtol, atol=xtol)
+                       for minimum in minima):
+                minima.append(ans)
+
+        best = minima[0]
+        ans = OptimizeResult(best.minimizer_output)
+        ans.x = [value for param, value in zip(self.parameters, best._popt)
+                 if param in self.params]
+        ans.message = best.status_message
+        ans.nit = sum(answer.iterations or 0 for answer in answers)
+        ans.nfev = sum(answer.minimizer_output.get('nfev', 0)
+                       for answer in answers)
+        ans.minima = minima
+        if best.constraints:
+            ans['constraints'] = best.constraints
+        return self._pack_output(ans)
+
+
+def _execute_from(minimizer, initial_guesses, minimize_options):
+    """
+    Execute a copy of ``minimizer`` starting from ``initial_guesses``, such
+    that minimizers can be shared between threads.
+    """
+    # Unlike copy.copy, this keeps the wrapped_ attributes.
+    original, minimizer = minimizer, object.__new__(minimizer.__class__)
+    minimizer.__dict__.update(original.__dict__)
+    minimizer.initial_guesses = list(initial_guesses)
+    return minimizer.execute(**minimize_options)
+
+def _objective_value(fit_result):
+    """
+    :return: the objective value of ``fit_result`` as a scalar, also for
+        :class:`~symfit.core.objectives.VectorLeastSquares`.
+    """
+    value = fit_result.objective_value
+    return np.sum(np.square(value)) if np.ndim(value) else value
+
 
 class MINPACK(ScipyBoundedMinimizer, GradientMinimizer):
     """
@@ -780,7 +1348,7 @@ class MINPACK(ScipyBoundedMinimizer, GradientMinimizer):
         # These are the corresponding names for OptimizeResult
         output_names = ['x', 'hess_inv', 'infodic', 'message', 'status']
         full_output = leastsqbound(
-            self.objective,
+            self.wrapped_objective,
             # Dfun=self.jacobian,
             x0=self.initial_guesses,
             bounds=self.bounds,
@@ -795,3 +1363,319 @@ class MINPACK(ScipyBoundedMinimizer, GradientMinimizer):
         ans['nit'] = ans.infodic['nfev']  # Nearest indication of nit.
 
         return self._pack_output(ans)
+
+
+def _weighted_linear_system(objective, ordered_parameters):
+    """
+    Linearize a least-squares objective around ``ordered_parameters``. For a
+    step :math:`\\delta \\vec{p}` in the free parameters, the weighted
+    residuals are then approximated by :math:`b - A \\delta \\vec{p}`. This is
+    exact for models which are linear in their parameters.
+
+    :param objective: :class:`~symfit.core.objectives.LeastSquares` instance.
+    :param ordered_parameters: values of the free parameters, in the order of
+        ``objective.free_params``.
+    :return: design matrix ``A`` of shape ``(n_datapoints, n_free_params)``
+        and right hand side ``b`` of shape ``(n_datapoints,)``.
+    """
+    model = objective.model
+    evaluated_func = super(LeastSquares, objective).__call__(ordered_parameters)
+    evaluated_jac = super(LeastSquares, objective).eval_jacobian(ordered_parameters)
+    free_params = objective.free_params
+    free = np.array([p in free_params for p in model.params], dtype=bool)
+
+    design, rhs = [], []
+    for var, f, jac_comp in zip(model.dependent_vars, evaluated_func,
+                                evaluated_jac):
+        y = objective.dependent_data.get(var, None)
+        if y is not None:
+            root_weights = np.sqrt(objective.weights[var])
+            weighted_jac = jac_comp[free] * root_weights[np.newaxis, ...]
+            design.append(weighted_jac.reshape(np.sum(free), -1).T)
+            rhs.append(((y - f) * root_weights).ravel())
+    return np.concatenate(design), np.concatenate(rhs)
+
+
+class LinearLeastSquares(BaseMinimizer):
+    """
+    Solves least-squares problems for models that are linear in all of their
+    free :class:`~symfit.core.argument.Parameter`'s in a single step, by
+    solving the weighted linear system through a singular value decomposition
+    of the design matrix. The inverse of :math:`J^T W J` is returned as
+    ``hess_inv``.
+
+    :class:`~symfit.core.fit.Fit` will select this minimizer for
+    :class:`~symfit.core.objectives.LeastSquares` problems without bounds or
+    constraints, when the model
+    :attr:`~symfit.core.models.GradientModel.is_linear`.
+    """
+    def __init__(self, *args, **kwargs):
+        super(LinearLeastSquares, self).__init__(*args, **kwargs)
+        if not isinstance(self.objective, LeastSquares):
+            raise TypeError('{} can only minimize a LeastSquares '
+                            'objective.'.format(self.__class__.__name__))
+
+    @keywordonly(rcond=None)
+    def execute(self, **options):
+        """
+        :param rcond: Cut-off ratio for small singular values of the design
+            matrix. Singular values smaller than ``rcond`` times the largest
+            singular value are considered zero. Defaults to machine precision
+            times the largest dimension of the design matrix.
+        :return: :class:`~symfit.core.fit_results.FitResults`
+        """
+        rcond = options.pop('rcond')
+        if options:
+            raise TypeError('Unknown options {} for {}.'.format(
+                list(options), self.__class__.__name__)
+            )
+        x0 = np.array(self.initial_guesses, dtype=float)
+        A, b = _weighted_linear_system(self.objective, x0)
+        ans = self._solve(A, b, rcond)
+        ans.x = x0 + ans.x
+        ans.update(fun=self.wrapped_objective(ans.x), nfev=1, njev=1)
+        return self._pack_output(ans)
+
+    @staticmethod
+    def _solve(A, b, rcond=None):
+        """
+        Solve :math:`A \\vec{x} = b` in the least-squares sense, through a
+        singular value decomposition of ``A``.
+
+        :return: :class:`scipy.optimize.OptimizeResult` with the solution
+            ``x`` and ``hess_inv``, :math:`(A^T A)^{-1}`.
+        """
+        U, s, Vt = np.linalg.svd(A, full_matrices=False)
+        if rcond is None:
+            rcond = np.finfo(float).eps * max(A.shape)
+        keep = s > rcond * s.max() if s.size else s.astype(bool)
+        s_inv = np.zeros_like(s)
+        s_inv[keep] = 1 / s[keep]
+
+        success = np.all(keep)
+        if success:
+            message = 'Solved the linear least-squares problem.'
+        else:
+            message = ('The design matrix is rank deficient, the minimum '
+                       'norm solution was returned.')
+        return OptimizeResult(
+            x=Vt.T.dot(s_inv * U.T.dot(b)),
+            hess_inv=(Vt.T * s_inv**2).dot(Vt),
+            success=success,
+            status=0 if success else 1,
+            message=message,
+            nit=1,
+        )
+
+
+class RecursiveLeastSquares(LinearLeastSquares):
+    """
+    :class:`~symfit.core.minimizers.LinearLeastSquares` for data which
+    arrives in chunks, see :class:`~symfit.core.fit.IncrementalFit`.
+
+    Instead of the weighted design matrix :math:`A` of all the data, only the
+    triangular factor :math:`R` of its QR decomposition and :math:`Q^T b` are
+    kept. These are updated with every chunk of data at a cost linear in its
+    size, after which solving no longer depends on the amount of data.
+    """
+    def __init__(self, *args, **kwargs):
+        super(RecursiveLeastSquares, self).__init__(*args, **kwargs)
+        self.reset()
+
+    def reset(self):
+        """
+        Forget all data.
+        """
+        self._R = None
+        self._Qtb = None
+        self._bb = 0.0
+
+    def update(self, objective):
+        """
+        Add data to the least-squares problem.
+
+        :param objective: :class:`~symfit.core.objectives.LeastSquares` of the
+            same model, for the new data only.
+        """
+        # The model is linear, so the system is the same around any point.
+        A, b = _weighted_linear_system(objective, np.zeros(len(self.params)))
+        if self._R is not None:
+            A = np.concatenate([self._R, A])
+            b = np.concatenate([self._Qtb, b])
+        Q, self._R = np.linalg.qr(A)
+        Qtb = Q.T.dot(b)
+        # The part of b which is orthogonal to the columns of A.
+        self._bb += b.dot(b) - Qtb.dot(Qtb)
+        self._Qtb = Qtb
+
+    @keywordonly(rcond=None)
+    def execute(self, **options):
+        """
+        :param rcond: Cut-off ratio for small singular values of the design
+            matrix, see :class:`~symfit.core.minimizers.LinearLeastSquares`.
+        :return: :class:`~symfit.core.fit_results.FitResults`
+        """
+        rcond = options.pop('rcond')
+        if options:
+            raise TypeError('Unknown options {} for {}.'.format(
+                list(options), self.__class__.__name__)
+            )
+        if self._R is None:
+            self.update(self.objective)
+        ans = self._solve(self._R, self._Qtb, rcond)
+        residual = self._R.dot(ans.x) - self._Qtb
+        ans.update(fun=0.5 * (self._bb + residual.dot(residual)),
+                   nfev=0, njev=0)
+        return self._pack_output(ans)
+
+
+class _ProjectedLeastSquares(GradientObjective):
+    """
+    Variable projection of a :class:`~symfit.core.objectives.LeastSquares`
+    objective: a function of the nonlinear parameters only, for which the
+    linear parameters are eliminated by solving the linear least-squares
+    problem at every evaluation.
+    """
+    def __init__(self, objective, nonlinear_params):
+        """
+        :param objective: :class:`~symfit.core.objectives.LeastSquares` to
+            project.
+        :param nonlinear_params: free parameters which are kept, all other free
+            parameters should enter the model linearly.
+        """
+        super(_ProjectedLeastSquares, self).__init__(objective.model,
+                                                     objective.data)
+        self.objective = objective
+        self.parameter_state = objective.parameter_state
+        self.nonlinear_params = nonlinear_params
+        self._free_params = objective.free_params
+        self._linear = np.array([p not in nonlinear_params
+                                 for p in self._free_params], dtype=bool)
+        self._last_call = None
+
+    def full_parameters(self, ordered_parameters):
+        """
+        :param ordered_parameters: values of the nonlinear parameters.
+        :return: values of all the free parameters, with the linear ones set
+            to their least-squares optimum given ``ordered_parameters``.
+        """
+        nonlinear_values = np.array(ordered_parameters, dtype=float)
+        if (self._last_call is not None and
+                np.array_equal(self._last_call[0], nonlinear_values)):
+            return self._last_call[1].copy()
+
+        x = np.array([parameter_settings(p, self.parameter_state).value
+                      for p in self._free_params], dtype=float)
+        x[~self._linear] = nonlinear_values
+        if np.any(self._linear):
+            A, b = _weighted_linear_system(self.objective, x)
+            step = np.linalg.lstsq(A[:, self._linear], b, rcond=None)[0]
+            x[self._linear] += step
+        self._last_call = (nonlinear_values, x)
+        return x.copy()
+
+    def _clear_cache(self):
+        super(_ProjectedLeastSquares, self)._clear_cache()
+        self._last_call = None
+
+    def __call__(self, ordered_parameters=[], **parameters):
+        return self.objective(self.full_parameters(ordered_parameters))
+
+    def eval_jacobian(self, ordered_parameters=[], **parameters):
+        # Because the linear parameters are at their optimum, the derivative of
+        # the projected objective equals the partial derivative of the full one.
+        jac = self.objective.eval_jacobian(
+            self.full_parameters(ordered_parameters)
+        )
+        return jac[[p in self.nonlinear_params for p in self.model.params]]
+
+
+class VariableProjection(BaseMinimizer):
+    """
+    Variable projection (Golub-Pereyra) for separable nonlinear least-squares
+    problems, such as a Fourier series with a fitted frequency or a sum of
+    exponentials.
+
+    The free parameters are split into those in which the model is linear, see
+    :attr:`~symfit.core.models.GradientModel.linear_params`, and the remaining
+    nonlinear ones. Only the nonlinear parameters are minimized over by
+    ``local_minimizer``, the linear ones are eliminated by a linear solve for
+    every evaluation of the objective.
+
+    Example::
+
+        fit = Fit(model, x=xdata, y=ydata, minimizer=VariableProjection)
+        fit_result = fit.execute()
+
+    Bounds on the nonlinear parameters are respected when ``local_minimizer``
+    supports them, bounds on the linear parameters and constraints are not.
+    """
+    @keywordonly(local_minimizer=BFGS)
+    def __init__(self, *args, **kwargs):
+        """
+        :param local_minimizer: subclass of
+            :class:`~symfit.core.minimizers.BaseMinimizer` used to minimize
+            over the nonlinear parameters.
+        :param args: positional arguments to be passed on to `super`.
+        :param kwargs: keyword arguments to be passed on to `super`.
+        """
+        local_minimizer = kwargs.pop('local_minimizer')
+        super(VariableProjection, self).__init__(*args, **kwargs)
+        self._pickle_kwargs['local_minimizer'] = local_minimizer
+        if not isinstance(self.objective, LeastSquares):
+            raise TypeError('{} can only minimize a LeastSquares '
+                            'objective.'.format(self.__class__.__name__))
+
+        linear_params = getattr(self.objective.model, 'linear_params', [])
+        self.linear_params = [p for p in self.params if p in linear_params]
+        self.nonlinear_params = [p for p in self.params
+                                 if p not in linear_params]
+        self.projected_objective = _ProjectedLeastSquares(
+            self.objective, self.nonlinear_params
+        )
+        if issubclass(local_minimizer, GradientMinimizer):
+            self.local_minimizer = local_minimizer(
+                self.projected_objective, self.nonlinear_params,
+                jacobian=self.projected_objective.eval_jacobian,
+                parameter_state=self.parameter_state
+            )
+        else:
+            self.local_minimizer = local_minimizer(
+                self.projected_objective, self.nonlinear_params,
+                parameter_state=self.parameter_state
+            )
+
+    def execute(self, **minimize_options):
+        """
+        :param minimize_options: options to be passed on to the
+            ``local_minimizer``.
+        :return: :class:`~symfit.core.fit_results.FitResults`
+        """
+        if self.nonlinear_params:
+            self.local_minimizer.initial_guesses = [
+                value for p, value in zip(self.params, self.initial_guesses)
+                if p in self.nonlinear_params
+            ]
+            local_ans = self.local_minimizer.execute(**minimize_options)
+            ans = OptimizeResult(local_ans.minimizer_output)
+            ans.message = local_ans.status_message
+            nonlinear_values = [local_ans.value(p)
+                                for p in self.nonlinear_params]
+        else:
+            ans = OptimizeResult(success=True, status=0, nit=1,
+                                 message='Solved the linear least-squares '
+                                         'problem.')
+            nonlinear_values = []
+        # Only the gradient and Hessian in the nonlinear parameters are known.
+        ans.pop('jac', None)
+        ans.pop('hess_inv', None)
+        ans.x = self.projected_objective.full_parameters(nonlinear_values)
+        ans.fun = self.wrapped_objective(ans.x)
+        return self._pack_output(ans)
+
+    def __getstate__(self):
+        # The local minimizer is rebuilt by __init__ upon unpickling.
+        state = super(VariableProjection, self).__getstate__()
+        for key in ['local_minimizer', 'projected_objective']:
+            state.pop(key, None)
+        return state
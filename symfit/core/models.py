@@ -12,7 +12,8 @@ from scipy.integrate import odeint
 
 from .argument import Parameter, Variable
 from .support import (
-    seperate_symbols, keywordonly, sympy_to_py, partial, cached_property, D
+    seperate_symbols, keywordonly, sympy_to_py, sympy_to_py_many, partial,
+    cached_property, D, _from_srepr
 )
 
 if sys.version_info >= (3,0):
@@ -62,15 +63,24 @@ class ModelOutput(tuple):
         """
         self.variables = variables
         self.output = output
-        self.output_dict = OrderedDict(zip(variables, output))
-        self.variable_names = {var.name: var for var in variables}
+
+    @property
+    def output_dict(self):
+        """
+        :return: ``OrderedDict`` from the variables to their output. It is
+            only made when asked for, to keep model calls cheap.
+        """
+        return OrderedDict(zip(self.variables, self.output))
 
     def __getattr__(self, name):
-        try:
-            var = self.variable_names[name]
-        except KeyError as err:
-            raise AttributeError(err)
-        return self.output_dict[var]
+        # Only called when normal lookup fails. Don't look for the variables
+        # before __init__ has set them, e.g. while unpickling.
+        if name in ('variables', 'output'):
+            raise AttributeError(name)
+        for var, output in zip(self.variables, self.output):
+            if var.name == name:
+                return output
+        raise AttributeError(name)
 
     def __getitem__(self, key):
         return self.output[key]
@@ -82,10 +92,10 @@ class ModelOutput(tuple):
         """
         :return: Returns a new OrderedDict representing this object.
         """
-        return self.output_dict.copy()
+        return self.output_dict
 
     def __len__(self):
-        return len(self.output_dict)
+        return len(self.output)
 
 
 class ModelError(Exception):
@@ -102,6 +112,11 @@ class BaseModel(Mapping):
     or from an expression directly.
     Expressions are not enforced for ducktyping purposes.
     """
+    #: Optional :class:`concurrent.futures.Executor`, used to compute the
+    #: derivatives and to generate the code of the components in parallel.
+    #: Worthwhile for models with many components or parameters.
+    executor = None
+
     def __init__(self, model):
         """
         Initiate a Model from a dict::
@@ -481,6 +496,7 @@ class BaseModel(Mapping):
         # re-calculated after pickle.
         state = self.__dict__.copy()
         del state['__signature__']
+        state.pop('executor', None)
         for key in self.__dict__:
             if key.startswith(cached_property.base_str):
                 del state[key]
@@ -604,7 +620,19 @@ class BaseCallableModel(BaseModel):
             model_dict, to be used in numerical calculation.
         """
         bound_arguments = self.__signature__.bind(*args, **kwargs)
-        kwargs = bound_arguments.arguments  # Only work with kwargs
+        return self._eval_components(bound_arguments.arguments)
+
+    def _eval_components(self, arguments):
+        """
+        Evaluate the components without binding the arguments first. This is
+        the fast path taken by the objectives, which prepare ``arguments``
+        once per evaluation.
+
+        :param arguments: dict with a value for every independent variable and
+            parameter of the model, by name.
+        :return: list of the evaluated components, in the order of the model.
+        """
+        kwargs = dict(arguments)
         components = dict(zip(self, self.numerical_components))
         # Evaluate the variables in topological order.
         for symbol in self.ordered_symbols:
@@ -746,6 +774,15 @@ class BaseGradientModel(BaseCallableModel):
         """
         return ModelOutput(self.keys(), self.finite_difference(*args, **kwargs))
 
+    def _eval_jacobian(self, arguments):
+        """
+        :param arguments: dict with a value for every independent variable and
+            parameter of the model, by name.
+        :return: list of the jacobian of every component, see
+            :meth:`_eval_components`.
+        """
+        return list(self.eval_jacobian(**arguments))
+
 
 class CallableNumericalModel(BaseCallableModel, BaseNumericalModel):
     """
@@ -806,27 +843,38 @@ class CallableModel(BaseCallableModel):
         # All components must feature the independent vars and params, that's
         # the API convention. But for those components which also contain
         # interdependence, we add those vars
-        components = []
-        for var, expr in self.items():
+        args = []
+        for var in self:
             dependencies = self.connectivity_mapping[var]
             # vars first, then params, and alphabetically within each group
             key = lambda arg: [isinstance(arg, Parameter), str(arg)]
-            ordered = sorted(dependencies, key=key)
-            components.append(sympy_to_py(expr, ordered))
+            args.append(sorted(dependencies, key=key))
+        components = sympy_to_py_many(self.values(), args,
+                                      executor=self.executor)
         return ModelOutput(self.keys(), components)
 
 
 class GradientModel(CallableModel, BaseGradientModel):
     """
     Analytical model which has an analytically computed Jacobian.
+
+    Models which are a sum of many terms with a parameter as coefficient, such
+    as a Fourier series or a polynomial, are evaluated as a matrix of basis
+    functions times a vector of coefficients, see :attr:`basis`. This happens
+    when at least :attr:`basis_threshold` parameters enter as coefficients.
     """
+    #: Minimal number of coefficient parameters for which the model is
+    #: evaluated through its :attr:`basis` rather than term by term.
+    basis_threshold = 10
+
     def __init__(self, *args, **kwargs):
         super(GradientModel, self).__init__(*args, **kwargs)
 
     @cached_property
     def jacobian_model(self):
-        jac_model = jacobian_from_model(self)
+        jac_model = jacobian_from_model(self, executor=self.executor)
         jac_model.params = self.params
+        jac_model.executor = self.executor
         return jac_model
 
     @cached_property
@@ -847,11 +895,232 @@ class GradientModel(CallableModel, BaseGradientModel):
             jac.append(jac_row)
         return jac
 
+    @cached_property
+    def _substituted_components(self):
+        """
+        :return: Every component of the model, written in terms of the
+            independent variables and parameters only by substituting the
+            interdependent components.
+        """
+        expressions = OrderedDict()
+        for symbol in self.ordered_symbols:
+            if symbol in self.model_dict:
+                expressions[symbol] = self.model_dict[symbol].xreplace(expressions)
+        return expressions
+
+    @cached_property
+    def is_linear(self):
+        """
+        :return: ``True`` when every component of the model is linear in all
+            of the :class:`~symfit.core.argument.Parameter`'s, i.e. when all
+            the second order derivatives with respect to the parameters vanish.
+            The Jacobian of such a model does not depend on the parameters.
+        """
+        params = set(self.params)
+        for expr in self._substituted_components.values():
+            for param in self.params:
+                if expr.diff(param).free_symbols & params:
+                    return False
+        return True
+
+    @cached_property
+    def linear_params(self):
+        """
+        :return: The largest set of :class:`~symfit.core.argument.Parameter`'s
+            found in which the model is linear when all the other parameters
+            are kept fixed, in the order of :attr:`params`. For example, for
+            :math:`a e^{-k x} + b` these are :math:`a` and :math:`b`.
+        """
+        expressions = self._substituted_components.values()
+        # Start with the parameters in which every component is linear by
+        # itself, and remove those which multiply another candidate.
+        candidates = [p for p in self.params
+                      if all(expr.diff(p, 2) == 0 for expr in expressions)]
+        derivatives = {p: set().union(*[expr.diff(p).free_symbols
+                                        for expr in expressions])
+                       for p in candidates}
+        while True:
+            coupled = [p for p in candidates if derivatives[p] & set(candidates)]
+            if not coupled:
+                return candidates
+            candidates.remove(coupled[0])
+
+    @cached_property
+    def basis(self):
+        """
+        Decomposition of every component as :math:`f_0 + \\sum_j p_j B_j`, where
+        the :math:`p_j` are the parameters which enter the model only as a
+        coefficient of a term, and neither the offset :math:`f_0` nor the basis
+        functions :math:`B_j` depend on them. For example, for
+        :math:`a_0 + a_1 \\cos(w x) + b_1 \\sin(w x)` these are :math:`a_0`,
+        :math:`a_1` and :math:`b_1`.
+
+        :return: :class:`~collections.OrderedDict` of ``(offset, functions)``
+            per component, where ``functions`` maps every coefficient
+            parameter to its basis function. ``None`` if the model has
+            interdependent components or no such parameters.
+        """
+        if self.interdependent_vars:
+            return None
+        # Start from all parameters, and reject those which appear anywhere
+        # else than as a lone factor of a term until nothing changes.
+        coefficients = set(self.params)
+        while coefficients:
+            rejected = set()
+            for expr in self.values():
+                for term in sympy.Add.make_args(expr):
+                    factors = sympy.Mul.make_args(term)
+                    lone = [f for f in factors if f in coefficients]
+                    rejected.update(lone[1:])
+                    for factor in factors:
+                        if factor not in coefficients:
+                            rejected.update(factor.free_symbols & coefficients)
+            if not rejected:
+                break
+            coefficients -= rejected
+        if not coefficients:
+            return None
+
+        basis = OrderedDict()
+        for var, expr in self.items():
+            offset = []
+            functions = OrderedDict((p, []) for p in self.params
+                                    if p in coefficients)
+            for term in sympy.Add.make_args(expr):
+                factors = sympy.Mul.make_args(term)
+                lone = [f for f in factors if f in coefficients]
+                if lone:
+                    functions[lone[0]].append(
+                        sympy.Mul(*[f for f in factors if f != lone[0]])
+                    )
+                else:
+                    offset.append(term)
+            basis[var] = (
+                sympy.Add(*offset),
+                OrderedDict((p, sympy.Add(*terms))
+                            for p, terms in functions.items())
+            )
+        return basis
+
+    @cached_property
+    def _basis_params(self):
+        """
+        :return: The coefficient parameters of :attr:`basis`, empty when the
+            model should not be evaluated through it.
+        """
+        if self.basis is None:
+            return []
+        offset, functions = next(iter(self.basis.values()))
+        if len(functions) < self.basis_threshold:
+            return []
+        return list(functions)
+
+    @cached_property
+    def _basis_indices(self):
+        """
+        :return: indices in :attr:`params` of the coefficients of the
+            :attr:`basis`, and of the other parameters.
+        """
+        linear = [i for i, p in enumerate(self.params)
+                  if p in self._basis_params]
+        nonlinear = [i for i, p in enumerate(self.params)
+                     if p not in self._basis_params]
+        return linear, nonlinear
+
+    def _lambdify_basis(self, order):
+        """
+        Lambdify the :attr:`basis` and its derivatives with respect to the
+        parameters which are not coefficients.
+
+        :param order: Order of the derivatives, 0, 1 or 2.
+        :return: list of callables, one per component, returning for every
+            combination of ``order`` nonlinear parameters the derivative of the
+            offset followed by that of every basis function as a flat tuple.
+        """
+        nonlinear = [self.params[i] for i in self._basis_indices[1]]
+        if order == 0:
+            derivatives = [()]
+        elif order == 1:
+            derivatives = [(p,) for p in nonlinear]
+        else:
+            derivatives = [(p1, p2) for i, p1 in enumerate(nonlinear)
+                           for p2 in nonlinear[i:]]
+
+        components = []
+        for offset, functions in self.basis.values():
+            exprs = []
+            for derivative in derivatives:
+                for expr in [offset] + list(functions.values()):
+                    exprs.append(expr.diff(*derivative) if derivative else expr)
+            components.append(sympy_to_py(sympy.Tuple(*exprs),
+                                          self.independent_vars + self.params))
+        return components
+
+    @cached_property
+    def _basis_components(self):
+        return self._lambdify_basis(0)
+
+    @cached_property
+    def _basis_jacobian_components(self):
+        return self._lambdify_basis(1)
+
+    @cached_property
+    def _basis_hessian_components(self):
+        return self._lambdify_basis(2)
+
+    def _eval_basis(self, components, kwargs):
+        """
+        Evaluate lambdified :attr:`basis` functions, see
+        :meth:`_lambdify_basis`, and contract them with the coefficients.
+
+        :param components: callables to evaluate, one per component.
+        :param kwargs: dict with a value for every independent variable and
+            parameter of the model, by name.
+        :return: for every component a list with, for every combination of
+            nonlinear parameters, the derivative of the model and the
+            derivatives of the basis functions stacked into an array.
+        """
+        coefficients = [kwargs[p.name] for p in self._basis_params]
+        n = len(coefficients) + 1
+
+        evaluated = []
+        for func in components:
+            values = func(**{name: kwargs[name]
+                             for name in self.__signature__.parameters})
+            groups = []
+            for start in range(0, len(values), n):
+                arrays = np.broadcast_arrays(*values[start:start + n])
+                offset, design = arrays[0], np.stack(arrays[1:])
+                if all(np.ndim(c) == 0 for c in coefficients):
+                    # A single matrix-vector product over all the terms.
+                    value = offset + np.tensordot(coefficients, design, axes=1)
+                else:
+                    value = offset + sum(c * B for c, B in
+                                         zip(coefficients, design))
+                groups.append((value, design))
+            evaluated.append(groups)
+        return evaluated
+
+    def _eval_components(self, arguments):
+        if not self._basis_params:
+            return super(GradientModel, self)._eval_components(arguments)
+        evaluated = self._eval_basis(self._basis_components, arguments)
+        return [np.atleast_1d(groups[0][0]) for groups in evaluated]
+
     def eval_jacobian(self, *args, **kwargs):
         """
         :return: Jacobian evaluated at the specified point.
         """
-        eval_jac_dict = self.jacobian_model(*args, **kwargs)._asdict()
+        bound_arguments = self.__signature__.bind(*args, **kwargs)
+        return ModelOutput(self.keys(),
+                           self._eval_jacobian(bound_arguments.arguments))
+
+    def _eval_jacobian(self, arguments):
+        if self._basis_params:
+            return self._eval_basis_jacobian(arguments)
+        jacobian_model = self.jacobian_model
+        eval_jac_dict = dict(zip(jacobian_model,
+                                 jacobian_model._eval_components(arguments)))
         # Take zero for component which are not present, happens for Constraints
         jac = [[np.broadcast_to(eval_jac_dict.get(D(var, param), 0),
                                 eval_jac_dict[var].shape)
@@ -865,7 +1134,26 @@ class GradientModel(CallableModel, BaseGradientModel):
         for idx, comp in enumerate(jac):
             jac[idx] = np.stack(np.broadcast_arrays(*comp))
 
-        return ModelOutput(self.keys(), jac)
+        return jac
+
+    def _eval_basis_jacobian(self, arguments):
+        """
+        :return: Jacobian evaluated through the :attr:`basis`. The derivatives
+            with respect to the coefficients are the basis functions.
+        """
+        values = self._eval_basis(self._basis_components, arguments)
+        first = self._eval_basis(self._basis_jacobian_components, arguments)
+        linear, nonlinear = self._basis_indices
+        jac = []
+        for ((value, design),), first_groups in zip(values, first):
+            value = np.atleast_1d(value)
+            dtype = np.result_type(value, design, *[g[0] for g in first_groups])
+            comp = np.empty((len(self.params),) + value.shape, dtype=dtype)
+            comp[linear] = _broadcast_design(design, value.shape)
+            for index, (derivative, _) in zip(nonlinear, first_groups):
+                comp[index] = derivative
+            jac.append(comp)
+        return jac
 
 class HessianModel(GradientModel):
     """
@@ -876,31 +1164,60 @@ class HessianModel(GradientModel):
 
     @cached_property
     def hessian_model(self):
-        hess_model = hessian_from_model(self)
+        hess_model = hessian_from_model(self, executor=self.executor,
+                                        symmetric=True)
         hess_model.params = self.params
+        hess_model.executor = self.executor
         return hess_model
 
-    @property
+    @cached_property
     def hessian(self):
         """
         :return: Hessian filled with the symbolic expressions for all the
             second order partial derivatives. Partial derivatives are taken with
             respect to the Parameter's, not the independent Variable's.
         """
-        return [[[sympy.diff(partial_dv, param) for param in self.params]
-                 for partial_dv in comp] for comp in self.jacobian]
+        hess = []
+        for comp in self.jacobian:
+            hess_comp = [[None for _ in self.params] for _ in self.params]
+            for i, partial_dv in enumerate(comp):
+                # Mixed derivatives are symmetric, so only compute j >= i.
+                for j, param in enumerate(self.params[i:], start=i):
+                    if param in partial_dv.free_symbols:
+                        entry = sympy.diff(partial_dv, param)
+                    else:
+                        entry = sympy.S.Zero
+                    hess_comp[i][j] = hess_comp[j][i] = entry
+            hess.append(hess_comp)
+        return hess
 
     def eval_hessian(self, *args, **kwargs):
         """
         :return: Hessian evaluated at the specified point.
         """
-        # Evaluate the hessian model and use the resulting Ans namedtuple as a
-        # dict. From this, take the relevant components.
-        eval_hess_dict = self.hessian_model(*args, **kwargs)._asdict()
-        hess = [[[np.broadcast_to(eval_hess_dict.get(D(var, p1, p2), 0),
+        bound_arguments = self.__signature__.bind(*args, **kwargs)
+        return ModelOutput(self.keys(),
+                           self._eval_hessian(bound_arguments.arguments))
+
+    def _eval_hessian(self, arguments):
+        """
+        :param arguments: dict with a value for every independent variable and
+            parameter of the model, by name.
+        :return: list of the hessian of every component, see
+            :meth:`_eval_components`.
+        """
+        if self._basis_params:
+            return self._eval_basis_hessian(arguments)
+        # Evaluate the hessian model, and take the relevant components.
+        hessian_model = self.hessian_model
+        eval_hess_dict = dict(zip(hessian_model,
+                                  hessian_model._eval_components(arguments)))
+        # Only one of each pair of mixed derivatives is in the hessian_model.
+        hess = [[[np.broadcast_to(eval_hess_dict.get(D(var, p1, p2) if i <= j
+                                                     else D(var, p2, p1), 0),
                                   eval_hess_dict[var].shape)
-                    for p2 in self.params]
-                for p1 in self.params]
+                    for j, p2 in enumerate(self.params)]
+                for i, p1 in enumerate(self.params)]
             for var in self
         ]
         # Use numpy to broadcast these arrays together and then stack them along
@@ -909,7 +1226,35 @@ class HessianModel(GradientModel):
         for idx, comp in enumerate(hess):
             hess[idx] = np.stack(np.broadcast_arrays(*comp))
 
-        return ModelOutput(self.keys(), hess)
+        return hess
+
+    def _eval_basis_hessian(self, arguments):
+        """
+        :return: Hessian evaluated through the :attr:`basis`. Second
+            derivatives with respect to two coefficients vanish.
+        """
+        values = self._eval_basis(self._basis_components, arguments)
+        first = self._eval_basis(self._basis_jacobian_components, arguments)
+        second = self._eval_basis(self._basis_hessian_components, arguments)
+        linear, nonlinear = self._basis_indices
+        pairs = [(i, j) for n, i in enumerate(nonlinear) for j in nonlinear[n:]]
+
+        hess = []
+        for ((value, _),), first_groups, second_groups in zip(values, first,
+                                                              second):
+            value = np.atleast_1d(value)
+            n_params = len(self.params)
+            dtype = np.result_type(value, *[g[1] for g in first_groups])
+            comp = np.zeros((n_params, n_params) + value.shape, dtype=dtype)
+            for index, (_, design) in zip(nonlinear, first_groups):
+                design = _broadcast_design(design, value.shape)
+                comp[linear, index] = design
+                comp[index, linear] = design
+            for (i, j), (derivative, _) in zip(pairs, second_groups):
+                comp[i, j] = derivative
+                comp[j, i] = derivative
+            hess.append(comp)
+        return hess
 
 
 class Model(HessianModel):
@@ -1172,6 +1517,9 @@ class ODEModel(BaseGradientModel):
             # and so is t_like with t_initial inserted at the right position).
             return ans[t_total != t_initial].T
 
+    def _eval_components(self, arguments):
+        return self.eval_components(**arguments)
+
     def __call__(self, *args, **kwargs):
         """
         Evaluate the model for a certain value of the independent vars and parameters.
@@ -1214,7 +1562,48 @@ def _partial_subs(func, func2vars):
     else:
         return func.xreplace(func2vars)
 
-def jacobian_from_model(model, as_functions=False):
+def _broadcast_design(design, shape):
+    """
+    Broadcast a stack of basis functions, as evaluated by
+    :meth:`GradientModel._eval_basis`, to ``shape`` for every basis function.
+
+    :param design: array whose first axis runs over the basis functions.
+    :param shape: shape of the component of the model.
+    :return: view of ``design`` with shape ``(len(design),) + shape``.
+    """
+    extra_dims = (1,) * (len(shape) - design.ndim + 1)
+    design = design.reshape(design.shape[:1] + extra_dims + design.shape[1:])
+    return np.broadcast_to(design, design.shape[:1] + tuple(shape))
+
+def _derivative(expr, param, functions_as_vars=None):
+    """
+    Differentiate ``expr`` with respect to ``param`` and, if given, substitute
+    ``functions_as_vars`` into the result. Defined at module level such that
+    it can be run by any :class:`concurrent.futures.Executor`.
+    """
+    dfdp = expr.diff(param)
+    if functions_as_vars is not None and dfdp != 0:
+        dfdp = dfdp.subs(functions_as_vars, evaluate=False)
+    return dfdp
+
+def _derivative_srepr(expr, param, functions_as_vars=None):
+    """
+    :func:`_derivative`, with the arguments and the result as made by
+    :func:`sympy.srepr`, which is how they are sent to the processes of an
+    executor.
+
+    :return: the derivative, or ``None`` if the arguments cannot be rebuilt.
+    """
+    try:
+        expr, param = _from_srepr(expr), _from_srepr(param)
+        if functions_as_vars is not None:
+            functions_as_vars = dict(_from_srepr(functions_as_vars))
+    except Exception:
+        return None
+    return sympy.srepr(_derivative(expr, param, functions_as_vars))
+
+def jacobian_from_model(model, as_functions=False, symmetric=False,
+                        executor=None):
     """
     Build a :class:`~symfit.core.models.CallableModel` representing the Jacobian
      of ``model``.
@@ -1226,6 +1615,12 @@ def jacobian_from_model(model, as_functions=False):
     :param as_functions: If `True`, the result is returned using
         :class:`sympy.core.function.Function` where needed, e.g.
         ``{y(x, a): a * x}`` instead of ``{y: a * x}``.
+    :param symmetric: If `True`, components of ``model`` which are themselves
+        derivatives, such as ``D(y, a)``, are only differentiated with respect
+        to the parameters which do not come before ``a`` in ``model.params``.
+        Since mixed partial derivatives commute the others follow by symmetry.
+    :param executor: If given, a :class:`concurrent.futures.Executor` which
+        is used to compute the derivatives in parallel.
     :return: :class:`~symfit.core.models.CallableModel` representing the Jacobian
         of ``model``.
     """
@@ -1234,17 +1629,45 @@ def jacobian_from_model(model, as_functions=False):
     # Create the jacobian components. The `vars` here in the model_dict are
     # always of the type D(y, a), but the righthand-side might still contain
     # functions instead of vars depending on the value of `as_functions`.
-    jac = {}
+    dependencies = _parameter_dependencies(model)
+    tasks = []
+    zeros = []
     for func, expr in model.function_dict.items():
-        for param in model.params:
-            target = D(func, param)
-            dfdp = expr.diff(param)
-            if as_functions:
-                jac[_partial_subs(target, functions_as_vars)] = dfdp
+        params = model.params
+        var = functions_as_vars[func]
+        if (symmetric and isinstance(var, sympy.Derivative) and
+                var.variables[-1] in params):
+            params = params[params.index(var.variables[-1]):]
+        for param in params:
+            target = _partial_subs(D(func, param), functions_as_vars)
+            if param in dependencies[var]:
+                tasks.append((target, expr, param))
             else:
-                # Turn Function objects back into Variables.
-                dfdp = dfdp.subs(functions_as_vars, evaluate=False)
-                jac[_partial_subs(target, functions_as_vars)] = dfdp
+                # Structurally zero, no need to differentiate.
+                zeros.append(target)
+    targets, exprs, params = zip(*tasks) if tasks else ((), (), ())
+    # Function objects are turned back into Variables, unless as_functions.
+    substitutions = None if as_functions else functions_as_vars
+    if executor is None:
+        derivatives = [_derivative(expr, param, substitutions)
+                       for expr, param in zip(exprs, params)]
+    else:
+        srepr_substitutions = (None if substitutions is None else
+                               sympy.srepr(list(substitutions.items())))
+        derivatives = executor.map(
+            _derivative_srepr, map(sympy.srepr, exprs), map(sympy.srepr, params),
+            [srepr_substitutions] * len(tasks)
+        )
+        # Use the symbols of the model rather than copies.
+        symbols = set(model.params + model.vars)
+        symbols.update(functions_as_vars.values())
+        derivatives = [
+            _derivative(expr, param, substitutions) if dfdp is None
+            else _from_srepr(dfdp, symbols)
+            for expr, param, dfdp in zip(exprs, params, derivatives)
+        ]
+    jac = dict(zip(targets, derivatives))
+    jac.update((target, sympy.S.Zero) for target in zeros)
     # Next lines are needed for the Hessian, where the components of model still
     # contain functions instead of vars.
     if as_functions:
@@ -1255,7 +1678,7 @@ def jacobian_from_model(model, as_functions=False):
     jacobian_model = CallableModel(jac)
     return jacobian_model
 
-def hessian_from_model(model):
+def hessian_from_model(model, executor=None, symmetric=False):
     """
     Build a :class:`~symfit.core.models.CallableModel` representing the Hessian
     of ``model``.
@@ -1264,8 +1687,38 @@ def hessian_from_model(model):
     interdependent variables.
 
     :param model: Any symbolical model-type.
+    :param executor: If given, a :class:`concurrent.futures.Executor` which
+        is used to compute the derivatives in parallel.
+    :param symmetric: If `True`, only the second derivatives ``D(y, a, b)``
+        for which ``a`` does not come after ``b`` in ``model.params`` are
+        included, the others are equal by symmetry. This is what
+        :attr:`HessianModel.hessian_model` uses.
     :return: :class:`~symfit.core.models.CallableModel` representing the Hessian
         of ``model``.
     """
-    jac_model = jacobian_from_model(model, as_functions=True)
-    return jacobian_from_model(jac_model)
\ No newline at end of file
+    jac_model = jacobian_from_model(model, as_functions=True, executor=executor)
+    return jacobian_from_model(jac_model, symmetric=symmetric,
+                               executor=executor)
+
+def _parameter_dependencies(model):
+    """
+    :return: dict from every variable of ``model`` to the set of parameters it
+        depends on, directly or through other variables, according to
+        ``model.connectivity_mapping``.
+    """
+    connectivity = model.connectivity_mapping
+    params = set(model.params)
+    dependencies = {}
+    def visit(var):
+        if var not in dependencies:
+            found = set()
+            for symbol in connectivity.get(var, ()):
+                if symbol in params:
+                    found.add(symbol)
+                elif symbol in connectivity:
+                    found.update(visit(symbol))
+            dependencies[var] = found
+        return dependencies[var]
+    for var in connectivity:
+        visit(var)
+    return dependencies
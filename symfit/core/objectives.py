@@ -14,11 +14,14 @@ objectives can also be created, for example by inheriting from
 """
 
 import abc
+import threading
 from collections import OrderedDict
 from six import add_metaclass
 
 import numpy as np
 
+from .argument import parameter_settings
+from .models import CallableModel
 from .support import cached_property, keywordonly, key2str
 
 @add_metaclass(abc.ABCMeta)
@@ -26,6 +29,9 @@ class BaseObjective(object):
     """
     ABC for objective functions. Implements basic data handling.
     """
+    _parameter_state = None
+    _sample_weights = None
+
     def __init__(self, model, data):
         """
         :param model: `symfit` style model.
@@ -36,6 +42,75 @@ class BaseObjective(object):
         # Compares the model with the data to see if they are compatible.
         self._sanity_checking()
 
+    @property
+    def parameter_state(self):
+        """
+        Optionally, a :class:`~symfit.core.argument.ParameterState`. Which
+        parameters are fixed, and their values, are then taken from it instead
+        of from the parameters of the model.
+        """
+        return self._parameter_state
+
+    @parameter_state.setter
+    def parameter_state(self, state):
+        self._parameter_state = state
+        del self._invariant_kwargs
+        del self._invariant_arguments
+        del self._free_param_names
+
+    def _clear_cache(self):
+        """
+        Forget everything cached about the data, for when it has changed.
+        """
+        for cls in type(self).__mro__:
+            for name, attribute in vars(cls).items():
+                if isinstance(attribute, cached_property):
+                    delattr(self, name)
+
+    @property
+    def sample_weights(self):
+        """
+        Optionally, a weight for each data point along the first axis of the
+        data, by which its contribution to the objective is multiplied.
+        Integer weights are equivalent to repeating data points, and zero
+        weights to leaving them out, such that data can be resampled without
+        copying it. Supported by
+        :class:`~symfit.core.objectives.LeastSquares`,
+        :class:`~symfit.core.objectives.VectorLeastSquares` and
+        :class:`~symfit.core.objectives.LogLikelihood`.
+        """
+        return self._sample_weights
+
+    @sample_weights.setter
+    def sample_weights(self, weights):
+        if weights is not None:
+            weights = np.asarray(weights, dtype=np.float64)
+        self._sample_weights = weights
+        self._clear_cache()
+
+    def _apply_sample_weights(self, array, param_level=0):
+        """
+        :param array: array of shape ``param_shape + data_shape``.
+        :param param_level: number of parameter dimensions of ``array``.
+        :return: ``array`` multiplied by the ``sample_weights`` along its
+            first data axis.
+        """
+        if self.sample_weights is None:
+            return array
+        data_ndim = np.ndim(array) - param_level
+        return array * self.sample_weights.reshape((-1,) + (data_ndim - 1) * (1,))
+
+    @property
+    def free_params(self):
+        """
+        :return: the parameters of the model which are not fixed, and are
+            therefore expected as ``ordered_parameters``.
+        """
+        if self.parameter_state is None:
+            return self.model.free_params
+        return [p for p in self.model.params
+                if not parameter_settings(p, self.parameter_state).fixed]
+
     @cached_property
     def dependent_data(self):
         """
@@ -85,13 +160,12 @@ class BaseObjective(object):
         :return: evaluated model.
         """
         # zip will stop when the shortest of the two is exhausted
-        parameters.update(dict(zip(self.model.free_params, ordered_parameters)))
-        parameters.update(self._invariant_kwargs)
-        result = self.model(**key2str(parameters))._asdict()
+        arguments = self._model_arguments(ordered_parameters, parameters)
+        result = self.model._eval_components(arguments)
         # Return only the components corresponding to the dependent data.
         return self._shape_of_dependent_data(
-            [comp for var, comp in result.items()
-             if var in self.model.dependent_vars]
+            [comp for comp, dependent in zip(result, self._dependent_mask)
+             if dependent]
         )
 
     def _shape_of_dependent_data(self, model_output, param_level=0):
@@ -133,8 +207,9 @@ class BaseObjective(object):
         minimization. This means fixed parameters and data, matching the
         signature of ``self.model``.
         """
-        kwargs = {p: p.value for p in self.model.params
-                  if p not in self.model.free_params}
+        free_params = self.free_params
+        kwargs = {p: parameter_settings(p, self.parameter_state).value
+                  for p in self.model.params if p not in free_params}
         data_by_name = key2str(self.independent_data)
         kwargs.update(
             {p: data_by_name[p] for p in
@@ -142,6 +217,164 @@ class BaseObjective(object):
         )
         return kwargs
 
+    @cached_property
+    def _invariant_arguments(self):
+        """
+        :attr:`_invariant_kwargs` by name, if together with the free
+        parameters they provide every argument of ``self.model``. Otherwise
+        ``None``, and the arguments have to be checked on every call.
+        """
+        arguments = key2str(self._invariant_kwargs)
+        names = set(arguments).union(p.name for p in self.free_params)
+        if names != set(self.model.__signature__.parameters):
+            return None
+        return arguments
+
+    @cached_property
+    def _dependent_mask(self):
+        """
+        For every component of ``self.model``, whether it is a dependent
+        variable, and therefore part of the objective.
+        """
+        dependent_vars = set(self.model.dependent_vars)
+        return [var in dependent_vars for var in self.model]
+
+    def _model_arguments(self, ordered_parameters, parameters):
+        """
+        Prepare the arguments to ``self.model`` from the values provided by the
+        minimizer and the invariant kwargs, as a dict by name.
+
+        When the minimizer provides all the free parameters in order, which is
+        the case during a fit, this only copies the invariant arguments and
+        adds the parameters. Otherwise the arguments are bound to the
+        signature of the model, so missing values raise a ``TypeError``.
+
+        :param ordered_parameters: List of parameter, in alphabetical order.
+        :param parameters: parameters as keyword arguments.
+        :return: dict with a value for every argument of ``self.model``.
+        """
+        invariant = self._invariant_arguments
+        names = self._free_param_names
+        if (not parameters and invariant is not None
+                and len(ordered_parameters) == len(names)):
+            arguments = dict(invariant)
+            arguments.update(zip(names, ordered_parameters))
+            return arguments
+        parameters.update(dict(zip(self.free_params, ordered_parameters)))
+        parameters.update(self._invariant_kwargs)
+        bound_arguments = self.model.__signature__.bind(**key2str(parameters))
+        return bound_arguments.arguments
+
+    @cached_property
+    def _free_param_names(self):
+        return [p.name for p in self.free_params]
+
+    #: Number of array elements to aim for per chunk of points in
+    #: ``evaluate_points``.
+    scan_chunk_elements = 2**21
+
+    #: Optional method reducing the model evaluated on a batch of points to
+    #: the objective at each of those points, see ``evaluate_points``.
+    _reduce_batch = None
+
+    @keywordonly(chunk_size=None)
+    def scan(self, grid, **parameters):
+        """
+        Evaluate the objective on every point of a Cartesian grid of parameter
+        values, for example to map out the :math:`\\chi^2` landscape around a
+        minimum. See :meth:`evaluate_points`.
+
+        :param grid: mapping of free :class:`~symfit.core.argument.Parameter`
+            to a 1D array of values to scan that parameter over.
+        :param chunk_size: number of points to evaluate at once, see
+            :meth:`evaluate_points`.
+        :param parameters: values of the free parameters which are not
+            scanned, see :meth:`evaluate_points`.
+        :return: ``np.ndarray`` of objective values with an axis per parameter
+            in ``grid``, in the same order.
+        """
+        axes = [np.ravel(values) for values in grid.values()]
+        shape = tuple(len(axis) for axis in axes)
+        points = OrderedDict(
+            (param, np.ravel(coords)) for param, coords
+            in zip(grid, np.meshgrid(*axes, indexing='ij'))
+        )
+        result = self.evaluate_points(points, **parameters)
+        return result.reshape(shape + result.shape[1:])
+
+    @keywordonly(chunk_size=None)
+    def evaluate_points(self, points, **parameters):
+        """
+        Evaluate the objective at many points in parameter space at once.
+
+        For models which are sympy expressions the points are evaluated in
+        chunks, by giving every parameter in ``points`` an array of values
+        with an extra leading axis which is broadcast through the model. Other
+        models are evaluated one point at a time.
+
+        :param points: mapping of free :class:`~symfit.core.argument.Parameter`
+            to a 1D array with its value at every point. These arrays should
+            have the same length.
+        :param chunk_size: number of points to evaluate at once. By default
+            this is chosen such that the evaluated model holds about
+            ``scan_chunk_elements`` elements per component.
+        :param parameters: values of the free parameters which are not in
+            ``points``. Those not given, and those of fixed parameters, are
+            taken from the ``parameter_state`` if any, or else from the
+            parameters themselves.
+        :return: ``np.ndarray`` with the objective value at every point.
+        """
+        chunk_size = parameters.pop('chunk_size')
+        points = OrderedDict((str(p), np.ravel(values)) for p, values in points.items())
+        free_params = self.free_params
+        unknown = set(points).difference(p.name for p in free_params)
+        if unknown:
+            raise ValueError('Cannot evaluate points in {}, these are not free '
+                             'parameters of the model.'.format(sorted(unknown)))
+        values = key2str(parameters)
+        for p in self.model.params:
+            if p not in free_params or p.name not in values:
+                values[p.name] = parameter_settings(p, self.parameter_state).value
+
+        n_points = len(next(iter(points.values()), [None]))
+        if self._reduce_batch is None or not isinstance(self.model, CallableModel):
+            result = []
+            for index in range(n_points):
+                values.update((name, coords[index])
+                              for name, coords in points.items())
+                result.append(self(**values))
+            return np.array(result)
+
+        data = [np.asarray(d) for d in self.data.values() if d is not None]
+        ndim = max([d.ndim for d in data] + [0])
+        if chunk_size is None:
+            size = max([d.size for d in data] + [1])
+            chunk_size = max(1, self.scan_chunk_elements // size)
+        data_by_name = key2str(self.independent_data)
+        values.update({p: data_by_name[p] for p in
+                       self.model.__signature__.parameters if p in data_by_name})
+
+        result = np.empty(n_points)
+        for start in range(0, n_points, chunk_size):
+            stop = min(start + chunk_size, n_points)
+            values.update(
+                (name, coords[start:stop].reshape((-1,) + ndim * (1,)))
+                for name, coords in points.items()
+            )
+            evaluated = self.model(**values)._asdict()
+            batch = []
+            for var in self.model.dependent_vars:
+                component = np.asarray(evaluated[var])
+                # Components which do not depend on the parameters in points
+                # lack the axis enumerating the points.
+                if component.ndim <= ndim:
+                    component = component[np.newaxis, ...]
+                batch.append(np.broadcast_to(
+                    component, (stop - start,) + component.shape[1:]
+                ))
+            result[start:stop] = self._reduce_batch(batch, stop - start)
+        return result
+
     def __eq__(self, other):
         """
         Objectives are considered equal if they are of the same type, have the
@@ -192,13 +425,12 @@ class GradientObjective(BaseObjective):
         :param parameters: parameters as keyword arguments.
         :return: evaluated jacobian
         """
-        parameters.update(dict(zip(self.model.free_params, ordered_parameters)))
-        parameters.update(self._invariant_kwargs)
-        result = self.model.eval_jacobian(**key2str(parameters))._asdict()
+        arguments = self._model_arguments(ordered_parameters, parameters)
+        result = self.model._eval_jacobian(arguments)
         # Return only the components corresponding to the dependent data.
         return self._shape_of_dependent_data(
-            [comp for var, comp in result.items()
-             if var in self.model.dependent_vars],
+            [comp for comp, dependent in zip(result, self._dependent_mask)
+             if dependent],
             param_level=1
         )
 
@@ -218,16 +450,49 @@ class HessianObjective(GradientObjective):
         :param parameters: parameters as keyword arguments.
         :return: evaluated hessian
         """
-        parameters.update(dict(zip(self.model.free_params, ordered_parameters)))
-        parameters.update(self._invariant_kwargs)
-        result = self.model.eval_hessian(**key2str(parameters))._asdict()
+        arguments = self._model_arguments(ordered_parameters, parameters)
+        result = self.model._eval_hessian(arguments)
         # Return only the components corresponding to the dependent data.
         return self._shape_of_dependent_data(
-            [comp for var, comp in result.items()
-             if var in self.model.dependent_vars],
+            [comp for comp, dependent in zip(result, self._dependent_mask)
+             if dependent],
             param_level=2
         )
 
+    def eval_hessp(self, ordered_parameters, vector, **parameters):
+        """
+        Evaluate the product of the hessian with ``vector``, without computing
+        the hessian itself. This is the derivative of the jacobian in the
+        direction of ``vector``, computed by central differences.
+
+        :param ordered_parameters: List of the free parameters, in
+            alphabetical order. Typically provided by the minimizer.
+        :param vector: Vector with an entry per free parameter.
+        :param parameters: parameters as keyword arguments.
+        :return: evaluated hessian-vector product, with an entry per parameter
+            in the model, like the jacobian.
+        """
+        def jacobian(values):
+            return np.atleast_1d(np.squeeze(
+                self.eval_jacobian(values, **parameters)
+            ))
+        return _directional_derivative(jacobian, ordered_parameters, vector)
+
+
+def _directional_derivative(func, x, direction):
+    """
+    Central difference approximation of the derivative of ``func`` at ``x``
+    in the direction of ``direction``.
+    """
+    x = np.asarray(x, dtype=float)
+    direction = np.asarray(direction, dtype=float)
+    norm = np.linalg.norm(direction)
+    if norm == 0:
+        return np.zeros_like(func(x))
+    # This step balances the truncation and rounding errors.
+    step = np.finfo(float).eps ** (1. / 3) * (1 + np.linalg.norm(x)) / norm
+    return (func(x + step * direction) - func(x - step * direction)) / (2 * step)
+
 
 class VectorLeastSquares(GradientObjective):
     """
@@ -254,7 +519,9 @@ class VectorLeastSquares(GradientObjective):
         for y, ans in zip(self.model.dependent_vars, evaluated_func):
             dep_data = self.dependent_data.get(y, None)
             if dep_data is not None:
-                result.append(((self.dependent_data[y] - ans) / self.sigma_data[self.model.sigmas[y]]) ** 2)
+                result.append(self._apply_sample_weights(
+                    ((self.dependent_data[y] - ans) / self.sigma_data[self.model.sigmas[y]]) ** 2
+                ))
                 if flatten_components: # Flattens *within* a component
                     result[-1] = result[-1].flatten()
         return np.sqrt(sum(result))
@@ -268,19 +535,18 @@ class VectorLeastSquares(GradientObjective):
             ordered_parameters, **parameters
         )
 
-        result = len(self.model.params) * [0.0]
-        for ans, y, row in zip(evaluated_func, self.model.dependent_vars,
-                               evaluated_jac):
+        result = 0
+        for ans, y, jac_comp in zip(evaluated_func, self.model.dependent_vars,
+                                    evaluated_jac):
             dep_data = self.dependent_data.get(y, None)
             if dep_data is not None:
-                for index, component in enumerate(row):
-                    result[index] += component * (
-                        (self.dependent_data[y] - ans) / self.sigma_data[self.model.sigmas[y]] ** 2
-                    )
-        result *= (1 / chi)
-        result = np.nan_to_num(result)
-        result = [item.flatten() for item in result]
-        return - np.array(result).T
+                sigma = self.sigma_data[self.model.sigmas[y]]
+                # Broadcast the weighted residuals along the parameter axis.
+                result = result + jac_comp * self._apply_sample_weights(
+                    (dep_data - ans) / sigma ** 2
+                )
+        result = np.nan_to_num(result / chi)
+        return - np.reshape(result, (len(self.model.params), -1)).T
 
 
 class LeastSquares(HessianObjective):
@@ -295,7 +561,64 @@ class LeastSquares(HessianObjective):
     The data for each component does not have to be the same, and it does not
     have to have the same shape. The only thing that matters is that within each
     component the shapes have to be compatible.
+
+    The weights :math:`1/\\sigma_i^2` are computed once, and the residuals are
+    written into buffers which are reused between evaluations.
     """
+    @cached_property
+    def weights(self):
+        """
+        Read-only Property
+
+        :return: :math:`1/\\sigma^2`, times the ``sample_weights`` if any, for
+            every dependent variable with data, as contiguous float64 arrays
+            with the shape of that data.
+        :rtype: collections.OrderedDict
+        """
+        weights = OrderedDict()
+        for var, y in self.dependent_data.items():
+            if y is not None:
+                sigma = np.asarray(self.sigma_data[self.model.sigmas[var]],
+                                   dtype=np.float64)
+                weights[var] = np.ascontiguousarray(self._apply_sample_weights(
+                    np.broadcast_to(1 / sigma ** 2, np.shape(y))
+                ))
+        return weights
+
+    @cached_property
+    def _residual_buffers(self):
+        # Every thread has its own buffers, which end with the thread.
+        return threading.local()
+
+    def __getstate__(self):
+        # The buffers belong to the threads of this process.
+        state = self.__dict__.copy()
+        state.pop('_cached__residual_buffers', None)
+        return state
+
+    def _residuals(self, var, evaluated):
+        """
+        :param var: dependent variable with data.
+        :param evaluated: evaluated model component belonging to ``var``.
+        :return: the residuals :math:`f - y`. When possible these are written
+            into a buffer owned by the current thread, which is overwritten by
+            the next call for ``var``.
+        """
+        y = self.dependent_data[var]
+        if (np.shape(evaluated) != np.shape(y) or
+                np.result_type(evaluated, y) != np.float64):
+            return evaluated - y
+        local = self._residual_buffers
+        try:
+            buffers = local.buffers
+        except AttributeError:
+            buffers = local.buffers = {}
+        try:
+            out = buffers[var]
+        except KeyError:
+            out = buffers[var] = np.empty(np.shape(y))
+        return np.subtract(evaluated, y, out=out)
+
     @keywordonly(flatten_components=True)
     def __call__(self, ordered_parameters=[], **parameters):
         """
@@ -316,13 +639,22 @@ class LeastSquares(HessianObjective):
         for index, (dep_var, dep_var_value) in enumerate(zip(self.model.dependent_vars, evaluated_func)):
             dep_data = self.dependent_data.get(dep_var, None)
             if dep_data is not None:
-                sigma = self.sigma_data[self.model.sigmas[dep_var]]
-                chi2[index] += np.sum(
-                    (dep_var_value - dep_data) ** 2 / sigma ** 2
-                )
+                residuals = self._residuals(dep_var, dep_var_value)
+                np.multiply(residuals, residuals, out=residuals)
+                chi2[index] += _weighted_sum(self.weights[dep_var], residuals)
         chi2 = np.sum(chi2) if flatten_components else chi2
         return chi2 / 2
 
+    def _reduce_batch(self, evaluated_func, size):
+        chi2 = np.zeros(size)
+        for var, f in zip(self.model.dependent_vars, evaluated_func):
+            y = self.dependent_data.get(var, None)
+            if y is not None:
+                residuals = np.broadcast_to(f, (size,) + np.shape(y)) - y
+                residuals *= residuals
+                chi2 += _weighted_sum(residuals, self.weights[var], param_level=1)
+        return chi2 / 2
+
     def eval_jacobian(self, ordered_parameters=[], **parameters):
         """
         Jacobian of :math:`S` in the
@@ -343,12 +675,10 @@ class LeastSquares(HessianObjective):
         for var, f, jac_comp in zip(self.model.dependent_vars, evaluated_func,
                                     evaluated_jac):
             y = self.dependent_data.get(var, None)
-            sigma_var = self.model.sigmas[var]
             if y is not None:
-                sigma = self.sigma_data[sigma_var]
-                pre_sum = jac_comp * ((y - f) / sigma**2)[np.newaxis, ...]
-                axes = tuple(range(1, len(pre_sum.shape)))
-                result -= np.sum(pre_sum, axis=axes, keepdims=False)
+                residuals = self._residuals(var, f)
+                np.multiply(residuals, self.weights[var], out=residuals)
+                result += _weighted_sum(jac_comp, residuals, param_level=1)
         return np.atleast_1d(np.squeeze(np.array(result)))
 
     def eval_hessian(self, ordered_parameters=[], **parameters):
@@ -375,19 +705,44 @@ class LeastSquares(HessianObjective):
                                                evaluated_func, evaluated_jac,
                                                evaluated_hess):
             y = self.dependent_data.get(var, None)
-            sigma_var = self.model.sigmas[var]
             if y is not None:
-                sigma = self.sigma_data[sigma_var]
-                p1 = hess_comp * ((y - f) / sigma**2)[np.newaxis, np.newaxis, ...]
-                # Outer product
-                p2 = np.einsum('i...,j...->ij...', jac_comp, jac_comp)
-                p2 = p2 / sigma[np.newaxis, np.newaxis, ...]**2
-                # We sum away everything except the matrices in the axes 0 & 1.
-                axes = tuple(range(2, len(p2.shape)))
-                result += np.sum(p2 - p1, axis=axes, keepdims=False)
+                weights = self.weights[var]
+                residuals = self._residuals(var, f)
+                np.multiply(residuals, weights, out=residuals)
+                # J^T W J, summing over the data while taking the outer product
+                jac_comp = np.broadcast_to(jac_comp, jac_comp.shape[:1] + np.shape(y))
+                jac_comp = jac_comp.reshape(len(jac_comp), -1)
+                p2 = (jac_comp * weights.ravel()).dot(jac_comp.T)
+                p1 = _weighted_sum(hess_comp, residuals, param_level=2)
+                result += p2 + p1
         return np.atleast_2d(np.squeeze(np.array(result)))
 
 
+def _weighted_sum(array, weights, param_level=0):
+    """
+    Sum ``array`` times ``weights`` over the data dimensions, leaving the first
+    ``param_level`` parameter dimensions of ``array`` intact.
+
+    :param array: array of shape ``param_shape + data_shape``.
+    :param weights: array of shape ``data_shape``.
+    :param param_level: number of parameter dimensions of ``array``.
+    :return: scalar or array of shape ``param_shape``.
+    """
+    param_shape = np.shape(array)[:param_level]
+    # Zero-strided views, so finding the broadcast shape allocates no data.
+    data_shape = np.broadcast(
+        np.broadcast_to(0, np.shape(array)[param_level:]),
+        np.broadcast_to(0, np.shape(weights))
+    ).shape
+    if np.shape(weights) != data_shape:
+        weights = np.broadcast_to(weights, data_shape)
+    if np.shape(array) != param_shape + data_shape:
+        array = np.broadcast_to(array, param_shape + data_shape)
+    # Contract over the data as a matrix-vector product, without temporaries
+    # when the arrays are contiguous.
+    return np.reshape(array, param_shape + (-1,)).dot(np.ravel(weights))
+
+
 class HessianObjectiveJacApprox(HessianObjective):
     """
     This object should only be used as a Mixin for covariance matrix estimation.
@@ -459,10 +814,19 @@ class LogLikelihood(HessianObjective, BaseIndependentObjective):
         )
 
         ans = - np.nansum(
-            [np.nansum(np.log(component)) for component in evaluated_func]
+            [np.nansum(self._apply_sample_weights(np.log(component)))
+             for component in evaluated_func]
         )
         return ans
 
+    def _reduce_batch(self, evaluated_func, size):
+        ans = np.zeros(size)
+        for component in evaluated_func:
+            log_component = self._apply_sample_weights(np.log(component),
+                                                       param_level=1)
+            ans -= np.nansum(log_component.reshape(size, -1), axis=1)
+        return ans
+
     @keywordonly(apply_func=np.nansum)
     def eval_jacobian(self, ordered_parameters=[], **parameters):
         """
@@ -481,17 +845,17 @@ class LogLikelihood(HessianObjective, BaseIndependentObjective):
             ordered_parameters, **parameters
         )
 
-        result = []
+        result = 0
         for component, jac_comp in zip(evaluated_func, evaluated_jac):
-            component_sums = []
-            for df in jac_comp:
-                component_sums.append(
-                    - apply_func(
-                        df / component
-                    )
-                )
-            result.append(component_sums)
-        result = np.sum(result, axis=0)
+            dlogf = self._apply_sample_weights(
+                jac_comp / component[np.newaxis, ...], param_level=1
+            )
+            if apply_func is np.nansum:
+                # Reduce for all parameters at once.
+                axes = tuple(range(1, len(dlogf.shape)))
+                result -= np.nansum(dlogf, axis=axes)
+            else:
+                result -= np.array([apply_func(df) for df in dlogf])
         return np.atleast_1d(np.squeeze(np.array(result)))
 
     def eval_hessian(self, ordered_parameters=[], **parameters):
@@ -518,6 +882,7 @@ class LogLikelihood(HessianObjective, BaseIndependentObjective):
             jac_outer_jac = np.einsum('i...,j...->ij...', jac_comp, jac_comp)
             dd_logf = - hess_comp / f[np.newaxis, np.newaxis, ...] + \
                       (1 / f**2)[np.newaxis, np.newaxis, ...] * jac_outer_jac
+            dd_logf = self._apply_sample_weights(dd_logf, param_level=2)
             # We sum away everything except the matrices in the axes 0 & 1.
             axes = tuple(range(2, len(dd_logf.shape)))
             result += np.sum(dd_logf, axis=axes, keepdims=False)
@@ -541,6 +906,9 @@ class MinimizeModel(HessianObjective, BaseIndependentObjective):
         )
         return evaluated_func[0]
 
+    def _reduce_batch(self, evaluated_func, size):
+        return np.reshape(evaluated_func[0], size)
+
     def eval_jacobian(self, ordered_parameters=[], **parameters):
         if hasattr(self.model, 'eval_jacobian'):
             evaluated_jac = super(MinimizeModel, self).eval_jacobian(
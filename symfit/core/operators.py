@@ -14,8 +14,10 @@ from symfit.core.argument import Parameter
 
 if sys.version_info >= (3,0):
     import inspect as inspect_sig
+    from functools import lru_cache
 else:
     import funcsigs as inspect_sig
+    from functools32 import lru_cache
 
 # # Overwrite the behavior opun equality checking. But we want to be able to fall
 # # back on default behavior.
@@ -45,17 +47,44 @@ else:
 #     else:
 #         return orig_ne(self.__class__, other)
 
+#: Maximum number of expressions for which :func:`compile_expression` keeps
+#: the compiled function.
+COMPILE_CACHE_SIZE = 256
+
+@lru_cache(maxsize=COMPILE_CACHE_SIZE)
+def compile_expression(expr):
+    """
+    Compile an expression into a python function of its variables and
+    parameters, as used by :func:`call`.
+
+    The results are kept in a least recently used cache keyed on the
+    expression, since the arguments of the function follow from it. Inspect
+    the cache with ``compile_expression.cache_info()``, and empty it with
+    ``compile_expression.cache_clear()``.
+
+    :param expr: Any subclass of sympy.Expr
+    :return: tuple of the python function, its signature, and the names of
+        its arguments as a frozenset.
+    """
+    independent_vars, params = seperate_symbols(expr)
+    # Convert to a pythonic function
+    func = sympy_to_py(expr, independent_vars + params)
+
+    # Handle args and kwargs according to the allowed names.
+    parameters = [  # Note that these are inspect_sig.Parameter's, not symfit parameters!
+        inspect_sig.Parameter(arg.name, inspect_sig.Parameter.POSITIONAL_OR_KEYWORD)
+            for arg in independent_vars + params
+    ]
+    signature = inspect_sig.Signature(parameters=parameters)
+    return func, signature, frozenset(signature.parameters)
+
 def call(self, *values, **named_values):
     """
     Call an expression to evaluate it at the given point.
 
-    Future improvements: I would like if func and signature could be buffered after the
-    first call so they don't have to be recalculated for every call. However, nothing
-    can be stored on self as sympy uses __slots__ for efficiency. This means there is no
-    instance dict to put stuff in! And I'm pretty sure it's ill advised to hack into the
-    __slots__ of Expr.
-
-    However, for the moment I don't really notice a performance penalty in running tests.
+    The function and signature are compiled on the first call, and buffered
+    by :func:`compile_expression` for later calls. Nothing can be stored on
+    self as sympy uses __slots__ for efficiency.
 
     p.s. In the current setup signature is not even needed since no introspection is possible
     on the Expr before calling it anyway, which makes calculating the signature absolutely useless.
@@ -71,22 +100,10 @@ def call(self, *values, **named_values):
     :return: The function evaluated at ``values``. The type depends entirely on the input.
         Typically an array or a float but nothing is enforced.
     """
-    independent_vars, params = seperate_symbols(self)
-    # Convert to a pythonic function
-    func = sympy_to_py(self, independent_vars + params)
-
-    # Handle args and kwargs according to the allowed names.
-    parameters = [  # Note that these are inspect_sig.Parameter's, not symfit parameters!
-        inspect_sig.Parameter(arg.name, inspect_sig.Parameter.POSITIONAL_OR_KEYWORD)
-            for arg in independent_vars + params
-    ]
-
-    arg_names = [arg.name for arg in independent_vars + params]
+    func, signature, arg_names = compile_expression(self)
     relevant_named_values = {
         name: value for name, value in named_values.items() if name in arg_names
     }
-
-    signature = inspect_sig.Signature(parameters=parameters)
     bound_arguments = signature.bind(*values, **relevant_named_values)
 
     return func(**bound_arguments.arguments)
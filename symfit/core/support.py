@@ -5,10 +5,14 @@ designed for users.
 """
 from __future__ import print_function
 from collections import OrderedDict
+from contextlib import contextmanager
 import sys
 import warnings
 import re
 import keyword
+import inspect
+import pickle
+import threading
 
 import numpy as np
 from sympy.utilities.lambdify import lambdify
@@ -23,10 +27,10 @@ import symfit.core.printing  # Overwrites some numpy printing
 
 if sys.version_info >= (3,0):
     import inspect as inspect_sig
-    from functools import wraps
+    from functools import wraps, lru_cache
 else:
     import funcsigs as inspect_sig
-    from functools32 import wraps
+    from functools32 import wraps, lru_cache
 
 if sys.version_info >= (3, 5):
     from functools import partial
@@ -158,6 +162,95 @@ def sympy_to_py(func, args):
     )
     return wrapped_lambdafunc
 
+def _lambdify_source(func, args):
+    """
+    Lambdify ``func`` as :func:`sympy_to_py` does, but return the generated
+    source code and the globals it needs on top of those lambdify always
+    provides. Unlike the function itself these can be pickled, such that the
+    code generation can be done in another process.
+
+    :param func: expression as made by :func:`sympy.srepr`.
+    :param args: list of arguments as made by :func:`sympy.srepr`.
+    :return: tuple of source code and globals, or ``None`` if the function
+        cannot be rebuilt from its source.
+    """
+    try:
+        func, args = _from_srepr(func), _from_srepr(args)
+    except Exception:
+        return None
+    lambdafunc = sympy_to_py(func, args)
+    if hasattr(lambdafunc, '__wrapped__'):
+        # Wrapped to fix the argument names, see sympy_to_py.
+        return None
+    base_globals = _lambdify_globals()
+    extra_globals = {key: value for key, value in lambdafunc.__globals__.items()
+                     if key not in base_globals}
+    try:
+        pickle.dumps(extra_globals)
+    except Exception:
+        return None
+    return inspect.getsource(lambdafunc), extra_globals
+
+@lru_cache(maxsize=1)
+def _lambdify_globals():
+    """
+    :return: the namespace every function made by lambdify is executed in.
+    """
+    return sympy_to_py(sympy.S.Zero, []).__globals__
+
+def sympy_to_py_many(funcs, args, executor=None):
+    """
+    Apply :func:`sympy_to_py` to several expressions. If an
+    :class:`concurrent.futures.Executor` is given, the code is generated in
+    parallel and only compiled in the current process.
+
+    :param funcs: iterable of sympy expressions
+    :param args: iterable with the arguments of each expression
+    :param executor: optional :class:`concurrent.futures.Executor`.
+    :return: list of lambda functions.
+    """
+    funcs, args = list(funcs), list(args)
+    if executor is None:
+        return [sympy_to_py(func, arg) for func, arg in zip(funcs, args)]
+
+    lambdafuncs = []
+    sources = executor.map(_lambdify_source, map(sympy.srepr, funcs),
+                           map(sympy.srepr, args))
+    for func, arg, source in zip(funcs, args, sources):
+        if source is None:
+            lambdafuncs.append(sympy_to_py(func, arg))
+            continue
+        code, extra_globals = source
+        namespace = dict(_lambdify_globals())
+        namespace.update(extra_globals)
+        funclocals = {}
+        exec(compile(code, '<lambdifygenerated>', 'exec'), namespace, funclocals)
+        lambdafunc, = funclocals.values()
+        lambdafuncs.append(lambdafunc)
+    return lambdafuncs
+
+def _from_srepr(string, symbols=None):
+    """
+    Rebuild an expression from its :func:`sympy.srepr`. This is how
+    expressions are sent to the processes of an executor, since not all of
+    them can be pickled.
+
+    :param string: output of :func:`sympy.srepr`.
+    :param symbols: Optionally, the :class:`~symfit.core.argument.Parameter`
+        and :class:`~symfit.core.argument.Variable` objects to use for the
+        arguments in ``string``, by name. By default new ones are made.
+    :return: the expression.
+    """
+    namespace = vars(sympy).copy()
+    if symbols is None:
+        namespace.update(Parameter=Parameter, Variable=Variable)
+    else:
+        by_name = {symbol.name: symbol for symbol in symbols
+                   if isinstance(symbol, (Parameter, Variable))}
+        lookup = lambda name, **assumptions: by_name[name]
+        namespace.update(Parameter=lookup, Variable=lookup)
+    return eval(string, namespace)
+
 def sympy_to_scipy(func, vars, params):
     """
     Convert a symbolic expression to one scipy digs. Not used by ``symfit`` any more.
@@ -262,12 +355,45 @@ class cached_property(property):
     perform only once.
 
     Does not allow setting of the attribute.
+
+    The first call is thread-safe: when several threads ask for the value at
+    the same time, it is computed only once and all of them get the same
+    value. Each attribute of each instance has its own lock, so unrelated
+    properties are computed concurrently. Cached values are returned without
+    locking.
     """
     base_str = '_cached'
+    # Locks by (id(obj), cache_attr), with the number of threads using them.
+    # Entries only live while in use, so the ids cannot be reused meanwhile.
+    _locks = {}
+    _locks_lock = threading.Lock()
+
     def __init__(self, *args, **kwargs):
         super(cached_property, self).__init__(*args, **kwargs)
         self.cache_attr = '{}_{}'.format(self.base_str, self.fget.__name__)
 
+    @contextmanager
+    def _locked(self, obj):
+        """
+        Context manager holding the lock of this property on ``obj``.
+        """
+        key = (id(obj), self.cache_attr)
+        with self._locks_lock:
+            lock, users = self._locks.get(key, (None, 0))
+            if lock is None:
+                lock = threading.RLock()
+            self._locks[key] = (lock, users + 1)
+        try:
+            with lock:
+                yield
+        finally:
+            with self._locks_lock:
+                lock, users = self._locks[key]
+                if users == 1:
+                    del self._locks[key]
+                else:
+                    self._locks[key] = (lock, users - 1)
+
     def __get__(self, obj, objtype=None):
         """
         In case of a first call, this will call the decorated function and
@@ -281,19 +407,26 @@ class cached_property(property):
         try:
             return getattr(obj, self.cache_attr)
         except AttributeError:
-            # Call the wrapped function with the obj instance as argument
-            setattr(obj, self.cache_attr, self.fget(obj))
-            return getattr(obj, self.cache_attr)
+            pass
+        with self._locked(obj):
+            # Another thread might have computed it in the meantime.
+            try:
+                return getattr(obj, self.cache_attr)
+            except AttributeError:
+                # Call the wrapped function with the obj instance as argument
+                setattr(obj, self.cache_attr, self.fget(obj))
+                return getattr(obj, self.cache_attr)
 
     def __delete__(self, obj):
         """
         Calling delete on the attribute will delete the cache.
         :param obj: parent object.
         """
-        try:
-            delattr(obj, self.cache_attr)
-        except AttributeError:
-            pass
+        with self._locked(obj):
+            try:
+                delattr(obj, self.cache_attr)
+            except AttributeError:
+                pass
 
 
 def jacobian(expr, symbols):
@@ -5,6 +5,7 @@ import sys
 import sympy
 
 from symfit import Variable, Parameter
+from symfit.core.argument import ParameterState
 
 if sys.version_info >= (3, 0):
     import inspect as inspect_sig
@@ -77,3 +78,29 @@ def test_slots():
     V = Variable('V')
     with pytest.raises(AttributeError):
         V.bar = None
+
+
+def test_parameter_state():
+    """
+    A ParameterState is a snapshot of the settings of parameters, which does
+    not change along with them.
+    """
+    a = Parameter('a', value=2.0, min=0.0)
+    b = Parameter('b', value=3.0, fixed=True)
+    state = ParameterState([a, b])
+    a.value, a.min = 5.0, 1.0
+
+    assert state[a] == (2.0, 0.0, None, False)
+    assert state.free_params == [a]
+    assert state.initial_guesses == [2.0]
+    assert state.bounds == [(0.0, None)]
+
+    new_state = state.replace(b, fixed=False, max=4.0)
+    assert new_state.free_params == [a, b]
+    assert new_state.bounds == [(0.0, None), (None, 4.0)]
+    assert state[b].fixed
+    with pytest.raises(TypeError):
+        state[a] = new_state[a]
+
+    new_state = pickle.loads(pickle.dumps(state))
+    assert list(new_state.values()) == list(state.values())
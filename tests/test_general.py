@@ -8,7 +8,7 @@ import pytest
 
 from symfit import (
     Variable, Parameter, Fit, FitResults, log, variables,
-    parameters, Model, exp, integrate, oo, GradientModel
+    parameters, Model, exp, integrate, oo, GradientModel, Eq
 )
 from symfit.core.minimizers import (
     MINPACK, LBFGSB, BoundedMinimizer, DifferentialEvolution, BaseMinimizer,
@@ -856,6 +856,48 @@ def test_fixed_parameters():
             assert 4.0 == fit_result.params['c']
 
 
+def test_covariance_strategies():
+    """
+    The covariance matrix can be computed from the exact Hessian, from the
+    Gauss-Newton approximation or from the inverse Hessian of the minimizer.
+    """
+    a, b, c = parameters('a, b, c')
+    x, y = variables('x, y')
+    xdata = np.linspace(0, 10, 50)
+    np.random.seed(5)
+    ydata = 2 * np.exp(-0.3 * xdata) + 1 + np.random.normal(0, 0.02, 50)
+
+    # For linear models all strategies are exact.
+    model = Model({y: a * x ** 2 + b * x + c})
+    fit = Fit(model, x=xdata, y=ydata)
+    exact = fit.execute().covariance_matrix
+    for strategy in ['gauss-newton', 'from-minimizer']:
+        cov = fit.execute(covariance=strategy).covariance_matrix
+        assert cov == pytest.approx(exact)
+
+    b.value = 0.2
+    model = Model({y: a * exp(-b * x) + c})
+    fit = Fit(model, x=xdata, y=ydata)
+    exact = fit.execute().covariance_matrix
+    gauss_newton = fit.execute(covariance='gauss-newton').covariance_matrix
+    # The residuals are small, so the model's Hessian hardly contributes.
+    assert gauss_newton == pytest.approx(exact, rel=1e-2)
+    # MINPACK returns J^T W J of the final iteration.
+    fit = Fit(model, x=xdata, y=ydata, minimizer=MINPACK)
+    minpack = fit.execute(covariance='from-minimizer').covariance_matrix
+    assert minpack == pytest.approx(gauss_newton, rel=1e-3)
+
+    # Fixed parameters have no variance.
+    c.value, c.fixed = 1.0, True
+    fit = Fit(model, x=xdata, y=ydata, minimizer=MINPACK)
+    cov = fit.execute(covariance='from-minimizer').covariance_matrix
+    assert cov.shape == (3, 3)
+    assert np.all(cov[2] == 0) and np.all(cov[:, 2] == 0)
+
+    with pytest.raises(ValueError):
+        fit.execute(covariance='guess')
+
+
 def test_boundaries():
     """
     Make sure parameter boundaries are respected
@@ -953,3 +995,261 @@ def test_version():
     """
     import symfit
     symfit.__version__
+
+
+def test_parameter_state():
+    """
+    Fits given their own ParameterState of the same model use its initial
+    guesses, bounds and fixed parameters, and can run concurrently.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+    from symfit.core.argument import ParameterState
+
+    x, y = variables('x, y')
+    a, b, k = parameters('a, b, k')
+    model = Model({y: a * exp(-k * x) + b})
+    xdata = np.linspace(0, 10, 101)
+    ydata = model(x=xdata, a=3.0, b=1.0, k=0.8).y
+
+    state = ParameterState(model.params).replace(k, value=0.5)
+    states = [state, state.replace(b, value=1.5, fixed=True),
+              state.replace(k, min=0.0, max=0.7)]
+    fits = [Fit(model, x=xdata, y=ydata, parameter_state=state)
+            for state in states]
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        fit_results = list(executor.map(lambda fit: fit.execute(), fits))
+    # The parameters themselves are not touched.
+    assert (k.value, b.fixed, k.max) == (1.0, False, None)
+
+    assert fit_results[0].value(k) == pytest.approx(0.8, 1e-5)
+    assert fit_results[1].value(b) == 1.5
+    assert fit_results[2].value(k) == pytest.approx(0.7)
+    assert isinstance(fits[2].minimizer, LBFGSB)
+    for fit, fit_result in zip(fits, fit_results):
+        assert fit_result.params == fit.execute().params
+
+
+def test_rebind():
+    """
+    A rebound fit gives the same results as a new fit to the new data, while
+    reusing its objective and minimizer.
+    """
+    x, y = variables('x, y')
+    a, b = parameters('a, b')
+    model = Model({y: a * exp(-b * x)})
+    xdata = np.linspace(0, 5, 51)
+    ydata = model(x=xdata, a=3.0, b=0.8).y
+
+    for constraints, sigma in [(None, None), ([Eq(a, 2 * b)], 0.1)]:
+        fit = Fit(model, x=xdata, y=ydata, sigma_y=sigma,
+                  constraints=constraints)
+        fit.execute()
+        objective, minimizer = fit.objective, fit.minimizer
+
+        new_ydata = model(x=xdata, a=2.0, b=1.0).y
+        if sigma is not None:
+            sigma = np.full_like(xdata, 2 * sigma)
+        fit_result = fit.rebind(x=xdata, y=new_ydata, sigma_y=sigma).execute()
+        new_fit = Fit(model, x=xdata, y=new_ydata, sigma_y=sigma,
+                      constraints=constraints)
+        new_result = new_fit.execute()
+        assert fit.objective is objective and fit.minimizer is minimizer
+        assert fit_result.value(a) == pytest.approx(new_result.value(a))
+        assert fit_result.value(b) == pytest.approx(new_result.value(b))
+        assert np.allclose(fit_result.covariance_matrix,
+                           new_result.covariance_matrix)
+
+    with pytest.raises(TypeError):
+        fit.rebind(y=new_ydata)
+
+
+def test_incremental_fit():
+    """
+    Appending data to an IncrementalFit gives the same results as fitting all
+    the data at once. Linear models are solved by recursive least squares,
+    other models start from the previous result.
+    """
+    from symfit import IncrementalFit
+    from symfit.core.minimizers import RecursiveLeastSquares
+
+    x, y = variables('x, y')
+    a, b, k = parameters('a, b, k')
+    xdata = np.linspace(0, 10, 200)
+    noise = np.random.RandomState(0).normal(0, 0.1, size=xdata.shape)
+
+    for model in [Model({y: a * x + b}), Model({y: a * exp(-k * x) + b})]:
+        values = {'a': 3.0, 'b': 1.0, 'k': 0.8}
+        ydata = model(x=xdata, **{p.name: values[p.name] for p in model.params}).y
+        ydata = ydata + noise
+        fit = IncrementalFit(model, x=xdata[:50], y=ydata[:50])
+        fit_result = fit.execute()
+        for start in range(50, 200, 30):
+            previous = [fit_result.value(p) for p in fit.fit.minimizer.params]
+            fit.append(x=xdata[start:start + 30], y=ydata[start:start + 30])
+            fit_result = fit.execute()
+        assert len(fit.fit.data[x]) == 200
+
+        full_result = Fit(model, x=xdata, y=ydata).execute()
+        for param in model.params:
+            assert fit_result.value(param) == pytest.approx(full_result.value(param), 1e-5)
+        assert fit_result.objective_value == pytest.approx(full_result.objective_value)
+        assert np.allclose(fit_result.covariance_matrix,
+                           full_result.covariance_matrix, rtol=1e-4)
+        if model.is_linear:
+            assert isinstance(fit.fit.minimizer, RecursiveLeastSquares)
+        else:
+            assert fit.fit.minimizer.initial_guesses == previous
+
+    with pytest.raises(ValueError):
+        fit.append(x=xdata[:, None], y=ydata[:, None])
+
+
+def test_profile_likelihood():
+    """
+    For linear least squares the profile is exactly quadratic, and the
+    profile likelihood intervals are the standard deviations. Otherwise they
+    are asymmetric.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    x, y = variables('x, y')
+    a, b = parameters('a, b')
+    xdata = np.linspace(0, 3, 40)
+    noise = np.random.RandomState(0).normal(0, 0.05, size=xdata.shape)
+
+    fit = Fit({y: a * x + b}, x=xdata, y=2 * xdata + 1 + noise, sigma_y=0.05)
+    fit_result = fit.execute()
+    profiles = fit.profile_likelihood(fit_result)
+    for param in [a, b]:
+        value, stdev = fit_result.value(param), fit_result.stdev(param)
+        assert profiles[param].lower == pytest.approx(value - stdev, 1e-3)
+        assert profiles[param].upper == pytest.approx(value + stdev, 1e-3)
+        assert np.all(np.diff(profiles[param].values) > 0)
+        assert min(profiles[param].objective_values) == pytest.approx(
+            fit_result.objective_value
+        )
+    profiles = fit.profile_likelihood(fit_result, parameters=[b],
+                                      confidence=0.9545)
+    assert list(profiles) == [b]
+    assert profiles[b].upper == pytest.approx(
+        fit_result.value(b) + 2 * fit_result.stdev(b), 1e-3
+    )
+
+    k = Parameter('k', value=1, max=1.32)
+    fit = Fit({y: a * exp(-k * x)}, x=xdata,
+              y=2 * np.exp(-1.3 * xdata) + noise, sigma_y=0.05)
+    fit_result = fit.execute()
+    with ThreadPoolExecutor(2) as executor:
+        profiles = fit.profile_likelihood(fit_result, executor=executor)
+    for param, profile in fit.profile_likelihood(fit_result).items():
+        assert np.allclose(profiles[param].values, profile.values)
+        assert np.allclose(profiles[param].objective_values,
+                           profile.objective_values)
+    assert profiles[a].lower < fit_result.value(a) < profiles[a].upper
+    # The maximum of k is reached before the upper bound of its interval.
+    assert profiles[k].values[-1] == 1.32
+    assert np.isnan(profiles[k].upper)
+
+
+def test_bootstrap_jackknife():
+    """
+    Bootstrap and jackknife replicas are fits to the resampled data, and
+    their spread is comparable to the standard deviations of the fit.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+    from symfit.core.fit import _bootstrap_weights
+
+    x, y = variables('x, y')
+    a, b = parameters('a, b')
+    xdata = np.linspace(0, 3, 40)
+    ydata = 2 * xdata + 1 + np.random.RandomState(0).normal(0, 0.05, size=40)
+    fit = Fit({y: a * x + b}, x=xdata, y=ydata)
+    fit_result = fit.execute()
+
+    resampling = fit.bootstrap(fit_result, n_replicas=100, seed=1)
+    assert resampling.replicas.shape == (100, 2)
+    with ThreadPoolExecutor(2) as executor:
+        parallel = fit.bootstrap(fit_result, n_replicas=100, seed=1,
+                                 executor=executor)
+    assert np.allclose(parallel.replicas, resampling.replicas)
+    # Each replica is a fit to data drawn with replacement.
+    drawn = np.repeat(np.arange(40), _bootstrap_weights(
+        np.random.RandomState(1).randint(2**31 - 1, size=100)[0], 40
+    ))
+    replica = Fit({y: a * x + b}, x=xdata[drawn], y=ydata[drawn]).execute()
+    assert resampling.replicas[0] == pytest.approx(replica._popt)
+
+    jackknife = fit.jackknife(fit_result)
+    assert jackknife.replicas.shape == (40, 2)
+    for param in [a, b]:
+        for intervals in [resampling.intervals, jackknife.intervals]:
+            lower, upper = intervals[param]
+            assert lower < fit_result.value(param) < upper
+            assert upper - lower == pytest.approx(2 * fit_result.stdev(param),
+                                                  rel=0.3)
+
+    fit = Fit({y: a * x + b}, x=xdata, y=ydata[:20, None])
+    with pytest.raises(ValueError):
+        fit.jackknife(fit_result)
+
+
+def test_sample(tmp_path):
+    """
+    The posterior sampled by the ensemble sampler agrees with the fit, and
+    stays within the bounds of the parameters.
+    """
+    x, y = variables('x, y')
+    a, b = parameters('a, b')
+    xdata = np.linspace(0, 3, 40)
+    ydata = 2 * xdata + 1 + np.random.RandomState(0).normal(0, 0.05, size=40)
+    fit = Fit({y: a * x + b}, x=xdata, y=ydata, sigma_y=0.05)
+    fit_result = fit.execute()
+
+    sampling = fit.sample(fit_result, n_steps=1500, seed=0)
+    assert sampling.chain.shape == (1500, 8, 2)
+    assert sampling.log_probability.shape == (1500, 8)
+    assert np.all(0 < sampling.acceptance_fraction)
+    assert np.all(sampling.acceptance_fraction < 1)
+    samples = sampling.chain[500:].reshape(-1, 2)
+    for index, param in enumerate([a, b]):
+        assert np.mean(samples[:, index]) == pytest.approx(
+            fit_result.value(param), abs=fit_result.stdev(param)
+        )
+        assert np.std(samples[:, index]) == pytest.approx(
+            fit_result.stdev(param), rel=0.3
+        )
+
+    # The prior cuts off the posterior at the maximum of b.
+    b.max = fit_result.value(b)
+    filename = str(tmp_path / 'chain.npy')
+    sampling = fit.sample(fit_result, n_steps=200, n_walkers=6, seed=0,
+                          filename=filename)
+    assert np.all(sampling.chain[:, :, 1] <= b.max)
+    assert np.array_equal(np.load(filename, mmap_mode='r'), sampling.chain)
+
+    with pytest.raises(ValueError):
+        fit.sample(fit_result, n_walkers=3)
+
+
+def test_callable_cache():
+    """
+    Calling an expression compiles it only once, after which the compiled
+    function is taken from the cache.
+    """
+    from symfit.core.operators import compile_expression
+
+    a, b = parameters('a, b')
+    x, y = variables('x, y')
+    func = a*x**2 + b*y**2
+    compile_expression.cache_clear()
+    assert func(x=2, y=3, a=3, b=9) == 3*2**2 + 9*3**2
+    assert func(2, 3, a=1, b=1, c=5) == 2**2 + 3**2
+    info = compile_expression.cache_info()
+    assert info.misses == 1
+    assert info.hits == 1
+    assert info.currsize == 1
+    with pytest.raises(TypeError):
+        func(2, a=1, b=1)
+
+    compile_expression.cache_clear()
+    assert compile_expression.cache_info().currsize == 0
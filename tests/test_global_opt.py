@@ -8,7 +8,7 @@ import numpy as np
 from symfit import (
     Fit, Parameter, Variable, Model, GradientModel
 )
-from symfit.core.minimizers import BFGS, DifferentialEvolution
+from symfit.core.minimizers import BFGS, DifferentialEvolution, BasinHopping
 from symfit.distributions import Gaussian
 
 if sys.version_info >= (3, 0):
@@ -134,3 +134,46 @@ def test_mexican_hat():
 
     assert fit_result1.value(x) > 0
     assert fit_result2.value(x) < 0
+
+
+def test_checkpoint(tmp_path):
+    """
+    A minimization which is stopped and resumed from its checkpoint ends up
+    where an uninterrupted one does.
+    """
+    x = Parameter('x', value=-2.5, min=-100, max=100)
+    y = Variable('y')
+    model = Model({y: x**4 - 10 * x**2 - x})
+    fit = Fit(model, minimizer=DifferentialEvolution)
+
+    options = dict(seed=0, tol=0, polish=False, checkpoint_interval=5)
+    full_result = fit.execute(maxiter=20, checkpoint=str(tmp_path / 'full.pkl'),
+                              **options)
+    checkpoint = str(tmp_path / 'de.pkl')
+    partial_result = fit.execute(maxiter=8, checkpoint=checkpoint, **options)
+    assert partial_result.iterations == 8
+    resumed_result = fit.execute(maxiter=20, checkpoint=checkpoint,
+                                 resume=True, **options)
+    assert resumed_result.iterations == 20
+    assert resumed_result.value(x) == full_result.value(x)
+    assert resumed_result.value(x) > 0
+    assert resumed_result.minimizer_output['nfev'] == full_result.minimizer_output['nfev']
+    # Nor can one made with other settings.
+    with pytest.raises(ValueError):
+        fit.execute(maxiter=20, checkpoint=checkpoint, resume=True,
+                    popsize=20, **options)
+
+    # A checkpoint of another minimizer can not be resumed from.
+    fit = Fit(model, minimizer=BasinHopping)
+    with pytest.raises(ValueError):
+        fit.execute(niter=10, checkpoint=checkpoint, resume=True)
+
+    checkpoint = str(tmp_path / 'bh.pkl')
+    full_result = fit.execute(niter=10, walkers=2, seed=1, checkpoint=checkpoint)
+    fit.execute(niter=4, walkers=2, seed=1, checkpoint=checkpoint,
+                checkpoint_interval=2)
+    resumed_result = fit.execute(niter=10, walkers=2, seed=1,
+                                 checkpoint=checkpoint, checkpoint_interval=2,
+                                 resume=True)
+    assert resumed_result.iterations == full_result.iterations == 2 * 10
+    assert resumed_result.value(x) == pytest.approx(full_result.value(x), abs=1e-4)
@@ -0,0 +1,209 @@
+from __future__ import division, print_function
+from concurrent.futures import ThreadPoolExecutor
+import asyncio
+import pytest
+import pickle
+
+import numpy as np
+
+from symfit import parameters, variables, Fit, Model, Eq, exp
+from symfit.core.minimizers import (
+    BFGS, SLSQP, BasinHopping, MINPACK, DifferentialEvolution, NelderMead
+)
+from symfit.core.instrumentation import (
+    Instrumentation, Budget, Progress, Cancelled
+)
+
+
+def _exponential_fit(minimizer, constrained=False):
+    x, y = variables('x, y')
+    a, b, k = parameters('a, b, k')
+    k.value = 0.5
+    model = Model({y: a * exp(-k * x) + b})
+    xdata = np.linspace(0, 10, 100)
+    ydata = model(x=xdata, a=3.0, b=1.0, k=0.8).y
+    ydata = ydata + np.random.RandomState(2).normal(0, 0.05, size=xdata.shape)
+    constraints = [Eq(a, 3 * b)] if constrained else None
+    return Fit(model, x=xdata, y=ydata, minimizer=minimizer,
+               constraints=constraints)
+
+
+def test_instrumentation():
+    """
+    Every evaluation is counted, timed and passed to the callback, and the
+    trace holds the objective and gradient at every point visited.
+    """
+    events = []
+    instrumentation = Instrumentation(trace=True, callback=events.append)
+    fit = _exponential_fit(BFGS)
+    fit_result = fit.execute(instrumentation=instrumentation)
+    assert fit_result.instrumentation is instrumentation
+
+    summary = instrumentation.summary()
+    assert summary['counts']['objective'] == fit_result.minimizer_output['nfev']
+    assert summary['counts']['jacobian'] == fit_result.minimizer_output['njev']
+    assert sum(summary['counts'].values()) == len(events)
+    assert summary['wall_time'] >= sum(summary['timings'].values())
+    assert summary['overhead'] == pytest.approx(
+        summary['wall_time'] - sum(summary['timings'].values())
+    )
+
+    objective_events = [event for event in events if event['kind'] == 'objective']
+    assert objective_events[-1]['objective'] == pytest.approx(fit_result.objective_value)
+    assert len(instrumentation.trace) <= len(objective_events)
+    times = [entry['time'] for entry in instrumentation.trace]
+    assert times == sorted(times)
+    last = instrumentation.trace[-1]
+    assert last['gradient_norm'] == pytest.approx(0, abs=1e-4)
+    assert list(last['params']) == pytest.approx(list(fit_result.params.values()))
+
+    # The minimizer is restored afterwards, and can still be pickled.
+    assert fit.minimizer.wrapped_objective is fit.minimizer.objective
+    unpickled = pickle.loads(pickle.dumps(instrumentation))
+    assert unpickled.callback is None
+    assert unpickled.counts == instrumentation.counts
+
+
+@pytest.mark.parametrize('minimizer, constrained, execute_kwargs, kinds', [
+    (BasinHopping, False, dict(niter=2), {'objective', 'jacobian'}),
+    (MINPACK, False, {}, {'objective'}),
+    (SLSQP, True, {},
+     {'objective', 'jacobian', 'constraint', 'constraint_jacobian'}),
+])
+def test_instrumentation_minimizers(minimizer, constrained, execute_kwargs, kinds):
+    """
+    Minimizers which use a local minimizer, and constraints, are also
+    instrumented.
+    """
+    fit = _exponential_fit(minimizer, constrained=constrained)
+    instrumentation = Instrumentation()
+    fit.execute(instrumentation=instrumentation, **execute_kwargs)
+    assert set(instrumentation.counts) == kinds
+    assert instrumentation.trace == []
+
+
+@pytest.mark.parametrize('minimizer', [
+    BFGS, NelderMead, MINPACK, BasinHopping, [DifferentialEvolution, BFGS]
+])
+def test_budget(minimizer):
+    """
+    When the budget runs out the best point so far is returned, whatever the
+    minimizer.
+    """
+    fit = _exponential_fit(minimizer)
+    for param in fit.model.params:
+        param.min, param.max = -10, 10
+    instrumentation = Instrumentation(trace=True)
+    fit_result = fit.execute(budget=Budget(max_nfev=10),
+                             instrumentation=instrumentation)
+    assert fit_result.minimizer_output['budget_limited']
+    assert fit_result.status_message == 'Exceeded the budget of 10 objective evaluations.'
+    assert fit_result.minimizer_output['nfev'] == 10
+    assert instrumentation.counts['objective'] == 10
+    best = min(instrumentation.trace,
+               key=lambda entry: np.sum(np.square(entry['objective'])))
+    assert list(fit_result.params.values()) == list(best['params'])
+    assert fit_result.covariance_matrix is not None
+
+
+def test_budget_limits():
+    """
+    Time and Jacobian evaluations are limited as well. Fits within budget are
+    not affected.
+    """
+    fit = _exponential_fit(BFGS)
+    fit_result = fit.execute(budget=Budget(max_njev=3))
+    assert fit_result.minimizer_output['budget_limited']
+    assert fit_result.minimizer_output['njev'] == 3
+
+    fit = _exponential_fit(DifferentialEvolution)
+    for param in fit.model.params:
+        param.min, param.max = -10, 10
+    budget = Budget(max_seconds=0.1)
+    fit_result = fit.execute(budget=budget)
+    assert fit_result.minimizer_output['budget_limited']
+    assert budget.wall_time < 1
+
+    fit = _exponential_fit(BFGS)
+    fit_result = fit.execute(budget=Budget(max_seconds=100, max_nfev=1000))
+    assert not fit_result.minimizer_output['budget_limited']
+    assert fit_result.minimizer_output['success']
+    assert fit_result.params == fit.execute().params
+
+
+def test_execute_async():
+    """
+    Fits run in an executor while the event loop streams their progress, and
+    give the same results as when run synchronously.
+    """
+    fit = _exponential_fit(BFGS)
+    other_fit = _exponential_fit(BFGS)
+    fit_result = fit.execute()
+
+    async def main(executor):
+        progress = Progress()
+        task = asyncio.ensure_future(
+            fit.execute_async(executor=executor, progress=progress)
+        )
+        other_task = asyncio.ensure_future(
+            other_fit.minimizer.execute_async(executor=executor)
+        )
+        events = [event async for event in progress]
+        return events, await task, await other_task
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        events, async_result, other_result = asyncio.run(main(executor))
+    assert async_result.params == fit_result.params
+    assert other_result.objective_value > 0
+    assert async_result.instrumentation.counts['objective'] == async_result.minimizer_output['nfev']
+    # Only the newest event is kept for a slow consumer.
+    assert 0 < len(events) <= sum(async_result.instrumentation.counts.values())
+    assert events[-1]['kind'] in async_result.instrumentation.counts
+
+    async def unobserved():
+        progress = Progress()
+        await fit.execute_async(progress=progress)
+        return progress
+
+    # Without a consumer, nothing but the end of the stream is queued.
+    progress = asyncio.run(unobserved())
+    assert progress.counts['objective'] > 0
+    assert progress._queue.qsize() == 1
+
+
+def test_execute_async_cancel():
+    """
+    Cancelling the task awaiting a fit, or its progress, stops the
+    minimization.
+    """
+    fit = _exponential_fit(DifferentialEvolution)
+    for param in fit.model.params:
+        param.min, param.max = -10, 10
+
+    async def main(progress, cancel_task, executor=None):
+        task = asyncio.ensure_future(
+            fit.execute_async(executor=executor, progress=progress,
+                              maxiter=10**6, tol=0)
+        )
+        async for event in progress:
+            if progress.counts['objective'] > 100:
+                break
+        if cancel_task:
+            task.cancel()
+        else:
+            progress.cancel()
+        await task
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        progress = Progress()
+        with pytest.raises(asyncio.CancelledError):
+            asyncio.run(main(progress, cancel_task=True, executor=executor))
+    # Shutting down the executor waited for the minimization to stop.
+    assert progress.cancelled
+    nfev = progress.counts['objective']
+    assert nfev < 1000
+
+    progress = Progress()
+    with pytest.raises(Cancelled):
+        asyncio.run(main(progress, cancel_task=False))
+    assert pickle.loads(pickle.dumps(progress)).cancelled
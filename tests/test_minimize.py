@@ -1,6 +1,8 @@
 from __future__ import division, print_function
 import pytest
 
+from concurrent.futures import ProcessPoolExecutor
+
 import numpy as np
 from scipy.optimize import minimize, basinhopping
 
@@ -257,3 +259,35 @@ def test_basinhopping_2d():
     fit_result = fit.execute()
     assert fit_result.value(x1) >= x1.min
     assert isinstance(fit.minimizer.local_minimizer, LBFGSB)
+
+
+def test_basinhopping_walkers():
+    """
+    Several walkers find the global minimum, and the total number of
+    iterations and evaluations is summed over the walkers. The results do not
+    depend on whether the walkers run in parallel.
+    """
+    x1, x2 = parameters('x1, x2', value=[1.0, 1.0])
+    model = cos(14.5 * x1 - 0.3) + (x2 + 0.2) * x2 + (x1 + 0.2) * x1
+    fit = Fit(model, minimizer=BasinHopping)
+
+    single_result = fit.execute(niter=20, seed=3)
+    fit_result = fit.execute(niter=20, walkers=4, exchange_interval=5, seed=3)
+    assert fit_result.value(x1) == pytest.approx(-0.195, abs=1e-3)
+    assert fit_result.value(x2) == pytest.approx(-0.1, abs=1e-3)
+    assert fit_result.iterations == 4 * 20
+    assert fit_result.minimizer_output['nfev'] > 3 * single_result.minimizer_output['nfev']
+
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        parallel_result = fit.execute(niter=20, walkers=4, exchange_interval=5,
+                                      seed=3, executor=executor)
+        assert parallel_result.params == fit_result.params
+        assert parallel_result.minimizer_output['nfev'] == fit_result.minimizer_output['nfev']
+
+        exchange_result = fit.execute(niter=20, walkers=4, exchange_interval=5,
+                                      temperatures=[0.5, 1, 2, 4], seed=3,
+                                      executor=executor)
+        assert exchange_result.objective_value == pytest.approx(fit_result.objective_value)
+
+    with pytest.raises(ValueError):
+        fit.execute(niter=20, walkers=4, temperatures=[1, 2])
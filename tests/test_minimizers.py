@@ -5,10 +5,11 @@ import warnings
 import numpy as np
 import pickle
 import multiprocessing as mp
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
 
 from symfit import (
     Variable, Parameter, Eq, Ge, parameters, Fit,
-    Model, FitResults, variables, CallableNumericalModel
+    Model, FitResults, variables, CallableNumericalModel, exp, cos
 )
 from symfit.core.minimizers import *
 from symfit.core.objectives import LeastSquares, MinimizeModel, VectorLeastSquares
@@ -389,3 +390,189 @@ def test_minimizer_constraint_compatibility():
         fit = SLSQP(MinimizeModel(model, data=data_dict),
                     parameters=[a, b, c],
                     constraints=[{'type': 'eq', 'fun': lambda a, b, c: a - c}])
+
+
+def test_linear_least_squares():
+    """
+    Models which are linear in their parameters are solved in one step, and
+    give the same answer as an iterative minimizer.
+    """
+    x, y = variables('x, y')
+    a, b, c = parameters('a, b, c')
+    model = Model({y: a * x**2 + b * x + c})
+
+    xdata = np.linspace(-5, 5, 50)
+    ydata = model(x=xdata, a=1.5, b=-2.0, c=4.0).y
+    ydata = ydata + np.random.normal(0, 0.5, size=xdata.shape)
+    sigma_y = np.random.uniform(0.4, 0.6, size=xdata.shape)
+
+    fit = Fit(model, x=xdata, y=ydata, sigma_y=sigma_y)
+    assert isinstance(fit.minimizer, LinearLeastSquares)
+    fit_result = fit.execute()
+    assert fit_result.iterations == 1
+
+    bfgs_result = Fit(model, x=xdata, y=ydata, sigma_y=sigma_y,
+                      minimizer=BFGS).execute()
+    for param in model.params:
+        assert fit_result.value(param) == pytest.approx(bfgs_result.value(param), 1e-5)
+        assert fit_result.stdev(param) == pytest.approx(bfgs_result.stdev(param), 1e-5)
+
+    # Compare with numpy's weighted polyfit
+    popt, pcov = np.polyfit(xdata, ydata, 2, w=1 / sigma_y, cov='unscaled')
+    assert [fit_result.value(p) for p in [a, b, c]] == pytest.approx(popt)
+    assert fit_result.covariance_matrix == pytest.approx(pcov)
+    assert fit_result.minimizer_output['hess_inv'] == pytest.approx(pcov)
+
+    # Fixed parameters are respected
+    c.value = 4.0
+    c.fixed = True
+    fit = Fit(model, x=xdata, y=ydata, sigma_y=sigma_y,
+              minimizer=LinearLeastSquares)
+    fit_result = fit.execute()
+    assert fit_result.value(c) == 4.0
+    assert fit_result.value(a) == pytest.approx(1.5, 1e-1)
+
+    with pytest.raises(TypeError):
+        LinearLeastSquares(MinimizeModel(model, data={x: xdata}), model.params)
+
+
+def test_variable_projection():
+    """
+    Separable models are minimized over their nonlinear parameters only, and
+    give the same answer as minimizing over all parameters.
+    """
+    x, y = variables('x, y')
+    a, b, k = parameters('a, b, k')
+    k.value = 0.5
+    model = Model({y: a * exp(-k * x) + b})
+
+    np.random.seed(2)
+    xdata = np.linspace(0, 10, 100)
+    ydata = model(x=xdata, a=3.0, b=1.0, k=0.8).y
+    ydata = ydata + np.random.normal(0, 0.05, size=xdata.shape)
+
+    fit = Fit(model, x=xdata, y=ydata, minimizer=VariableProjection)
+    assert fit.minimizer.linear_params == [a, b]
+    assert fit.minimizer.nonlinear_params == [k]
+    fit_result = fit.execute()
+
+    bfgs_result = Fit(model, x=xdata, y=ydata, minimizer=BFGS).execute()
+    assert fit_result.objective_value == pytest.approx(bfgs_result.objective_value, 1e-6)
+    for param in model.params:
+        assert fit_result.value(param) == pytest.approx(bfgs_result.value(param), 1e-4)
+        assert fit_result.stdev(param) == pytest.approx(bfgs_result.stdev(param), 1e-3)
+
+    minimizer = pickle.loads(pickle.dumps(fit.minimizer))
+    assert isinstance(minimizer.local_minimizer, BFGS)
+    assert minimizer.nonlinear_params == [k]
+
+    with pytest.raises(TypeError):
+        VariableProjection(MinimizeModel(model, data={x: xdata}), model.params)
+
+
+def test_hessian_product_minimizers():
+    """
+    Minimizers using Hessian-vector products find the same minimum as BFGS.
+    The product itself should match the full Hessian times the vector.
+    """
+    x, y = variables('x, y')
+    a, b, k = parameters('a, b, k')
+    k.value = 0.5
+    model = Model({y: a * exp(-k * x) + b})
+
+    np.random.seed(2)
+    xdata = np.linspace(0, 10, 100)
+    ydata = model(x=xdata, a=3.0, b=1.0, k=0.8).y
+    ydata = ydata + np.random.normal(0, 0.05, size=xdata.shape)
+
+    bfgs_result = Fit(model, x=xdata, y=ydata, minimizer=BFGS).execute()
+    for minimizer in [NewtonCG, TrustNCG, TrustKrylov]:
+        fit = Fit(model, x=xdata, y=ydata, minimizer=minimizer)
+        assert isinstance(fit.minimizer.hessp.__self__, LeastSquares)
+        fit_result = fit.execute()
+        assert fit_result.objective_value == pytest.approx(bfgs_result.objective_value, 1e-8)
+        for param in model.params:
+            assert fit_result.value(param) == pytest.approx(bfgs_result.value(param), 1e-5)
+
+    objective = fit.objective
+    values, vector = [2.0, 1.5, 0.6], np.array([0.3, -1.0, 2.0])
+    hess = np.squeeze(objective.eval_hessian(values))
+    assert objective.eval_hessp(values, vector) == pytest.approx(hess.dot(vector), 1e-6)
+
+    # Fixed parameters are not part of the vector.
+    b.fixed = True
+    fit_result = Fit(model, x=xdata, y=ydata, minimizer=TrustKrylov).execute()
+    assert fit_result.value(b) == 1.0
+    assert fit_result.value(k) == pytest.approx(0.8, 1e-1)
+
+
+def test_multistart():
+    """
+    MultiStart finds the global minimum of a function with many local minima,
+    also when the local minimizations are done in parallel.
+    """
+    x1, x2 = parameters('x1, x2', value=[1.0, 1.0], min=[-2, -2], max=[2, 2])
+    model = cos(14.5 * x1 - 0.3) + (x2 + 0.2) * x2 + (x1 + 0.2) * x1
+
+    fit = Fit(model, minimizer=MultiStart)
+    assert isinstance(fit.minimizer.local_minimizer, LBFGSB)
+    fit_result = fit.execute(n_starts=30, seed=1)
+    assert fit_result.value(x1) == pytest.approx(-0.195, abs=1e-3)
+    assert fit_result.value(x2) == pytest.approx(-0.1, abs=1e-3)
+    assert isinstance(fit_result.minimizer, MultiStart)
+
+    minima = fit_result.minimizer_output['minima']
+    assert 1 < len(minima) <= 30
+    values = [minimum.objective_value for minimum in minima]
+    assert values == sorted(values)
+    assert values[0] == fit_result.objective_value
+    assert fit_result.minimizer_output['nfev'] > minima[0].minimizer_output['nfev']
+
+    for executor in [ThreadPoolExecutor(4), ProcessPoolExecutor(2)]:
+        with executor:
+            parallel_result = fit.execute(n_starts=30, seed=1,
+                                          executor=executor)
+        assert parallel_result.objective_value == fit_result.objective_value
+        assert len(parallel_result.minimizer_output['minima']) == len(minima)
+
+    sobol_result = fit.execute(n_starts=32, sampling='sobol', seed=1)
+    assert sobol_result.objective_value == pytest.approx(fit_result.objective_value)
+
+    x1.min = None
+    with pytest.raises(ValueError):
+        Fit(model, minimizer=MultiStart).execute()
+
+    # The closed-form solution of linear problems is the same from any start.
+    a, b = parameters('a, b')
+    x, y = variables('x, y')
+    linear_fit = Fit({y: a * x + b}, x=np.arange(5.0), y=np.arange(5.0),
+                     minimizer=MultiStart)
+    assert isinstance(linear_fit.minimizer.local_minimizer, BFGS)
+
+
+def test_leastsqbound_transforms():
+    """
+    The transforms between the internal and external parameters of
+    leastsqbound are each other's inverse, map into the bounds, and have the
+    right gradient, for all kinds of bounds at once.
+    """
+    from symfit.core.leastsqbound import (
+        _internal2external_func, _external2internal_func,
+        _internal2external_grad_func
+    )
+    bounds = [(None, None), (0, None), (None, 5), (-1, 3), (2, None)]
+    external = np.array([0.3, 1.2, 4.0, 0.5, 2.5])
+    i2e = _internal2external_func(bounds)
+    e2i = _external2internal_func(bounds)
+    assert i2e(e2i(external)) == pytest.approx(external)
+
+    internal = np.linspace(-10, 10, 5)
+    converted = i2e(internal)
+    for value, (lower, upper) in zip(converted, bounds):
+        assert lower is None or value >= lower
+        assert upper is None or value <= upper
+
+    step = 1e-6
+    numerical = (i2e(internal + step) - i2e(internal - step)) / (2 * step)
+    i2e_grad = _internal2external_grad_func(bounds)
+    assert i2e_grad(internal) == pytest.approx(numerical)
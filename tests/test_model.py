@@ -1,6 +1,7 @@
 from __future__ import division, print_function
 import pytest
 from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
 import pickle
 try:
     from itertools import zip_longest
@@ -8,15 +9,18 @@ except ImportError:
     from itertools import izip_longest as zip_longest
 
 import numpy as np
+import sympy
 
 from symfit import (
     Fit, parameters, variables, Model, ODEModel, D, Eq,
     CallableModel, CallableNumericalModel, Inverse, MatrixSymbol, Symbol, sqrt,
-    Function, diff
+    Function, diff, sin, cos, exp
 )
 from symfit.core.models import (
-    jacobian_from_model, hessian_from_model, ModelError, ModelOutput
+    jacobian_from_model, hessian_from_model, ModelError, ModelOutput,
+    _derivative_srepr
 )
+from symfit.core.support import _from_srepr
 
 
 """
@@ -446,3 +450,148 @@ def test_ModelOutput():
     assert isinstance(output._asdict(), OrderedDict)
     assert output._asdict() is not output.output_dict
     assert output._asdict() == output.output_dict
+
+
+def test_is_linear():
+    """
+    A model is linear when all second derivatives with respect to the
+    parameters vanish, also when the parameters enter through interdependent
+    components.
+    """
+    x, y, z = variables('x, y, z')
+    a, b, w = parameters('a, b, w')
+
+    assert Model({y: a * x**2 + b * sin(x)}).is_linear
+    assert Model({y: a * x, z: b * x + a}).is_linear
+    assert Model({y: a * x, z: 2 * y + b}).is_linear
+    assert not Model({y: a * cos(w * x) + b}).is_linear
+    assert not Model({y: a * x, z: a * y}).is_linear
+    assert not Model({y: a * b * x}).is_linear
+
+
+def test_linear_params():
+    """
+    The parameters which enter a model linearly when all others are kept
+    fixed can be separated from the nonlinear ones.
+    """
+    x, y, z = variables('x, y, z')
+    a, b, k, w = parameters('a, b, k, w')
+
+    assert Model({y: a * exp(-k * x) + b}).linear_params == [a, b]
+    assert Model({y: a * cos(w * x) + b * sin(w * x)}).linear_params == [a, b]
+    assert Model({y: a * x, z: k * y**2}).linear_params == [k]
+    assert Model({y: a * x + b}).linear_params == [a, b]
+    # Products of linear parameters are not linear
+    assert len(Model({y: a * b * x}).linear_params) == 1
+
+
+def test_basis():
+    """
+    Models which are a sum of terms with a parameter as coefficient are
+    decomposed into basis functions, and evaluated through them once there are
+    enough coefficients. The result should be identical to the term by term
+    evaluation.
+    """
+    x, y, z = variables('x, y, z')
+    a, b, w = parameters('a, b, w')
+
+    offset, functions = Model({y: a * cos(w * x) + 2 * b * x + w}).basis[y]
+    assert offset == w
+    assert functions == OrderedDict([(a, cos(w * x)), (b, 2 * x)])
+    assert Model({y: a * b * x}).basis[y][1] == OrderedDict([(a, b * x)])
+    assert Model({y: a * x**2}).basis[y] == (0, OrderedDict([(a, x**2)]))
+    assert Model({y: a ** 2 * x}).basis is None
+    assert Model({y: a * x, z: 2 * y}).basis is None
+
+    coeffs = parameters(','.join('c{}'.format(i) for i in range(12)))
+    series = sum(c * cos(i * w * x) for i, c in enumerate(coeffs)) + a * w
+    model = Model({y: series, z: coeffs[0] * x + b})
+    reference = Model({y: series, z: coeffs[0] * x + b})
+    reference.basis_threshold = len(reference.params) + 1
+    assert len(model._basis_params) == 14
+    assert not reference._basis_params
+
+    xdata = np.linspace(-3, 3, 11)
+    np.random.seed(3)
+    values = {p.name: np.random.random() for p in model.params}
+    for model_func, reference_func in [
+        (model, reference),
+        (model.eval_jacobian, reference.eval_jacobian),
+        (model.eval_hessian, reference.eval_hessian)
+    ]:
+        result = model_func(x=xdata, **values)
+        expected = reference_func(x=xdata, **values)
+        for component, expected_component in zip(result, expected):
+            assert component.shape == expected_component.shape
+            assert component == pytest.approx(expected_component)
+
+
+def test_hessian_structure():
+    """
+    The Hessian model of a model is only built for one of each pair of mixed
+    derivatives, and derivatives which vanish identically are not computed.
+    The result should still be the full, symmetric Hessian.
+    """
+    x, y = variables('x, y')
+    a1, a2, k1, k2 = parameters('a1, a2, k1, k2')
+    model = Model({y: a1 * exp(-k1 * x) + a2 * exp(-k2 * x)})
+
+    hess_model = model.hessian_model
+    assert D(y, a1, k1) in hess_model
+    assert D(y, k1, a1) not in hess_model
+    assert hess_model[D(y, a1, a2)] == 0
+    assert hess_model[D(y, (a1, 2))] == 0
+    full_hess_model = hessian_from_model(model)
+    assert full_hess_model[D(y, k1, a1)] == hess_model[D(y, a1, k1)]
+    assert set(full_hess_model).issuperset(hess_model)
+    assert model.hessian is model.hessian
+
+    xdata = np.linspace(0, 5, 7)
+    values = dict(a1=2.0, a2=1.5, k1=0.5, k2=1.3)
+    hess = model.eval_hessian(x=xdata, **values).y
+    assert hess.shape == (4, 4, 7)
+    for i, row in enumerate(model.hessian[0]):
+        for j, expr in enumerate(row):
+            expected = sympy.lambdify([x], expr.subs(
+                {p: values[p.name] for p in model.params}
+            ))(xdata)
+            assert hess[i, j] == pytest.approx(np.broadcast_to(expected, (7,)))
+    assert np.all(hess == np.swapaxes(hess, 0, 1))
+
+
+def test_executor():
+    """
+    Models built with an executor should be the same as those built serially,
+    also for interdependent models, and remain picklable.
+    """
+    x, y, z = variables('x, y, z')
+    a, b, w = parameters('a, b, w')
+    model_dict = {y: a * cos(w * x) + b, z: a * exp(-b * y)}
+    serial = Model(model_dict)
+    xdata = np.linspace(0, 1, 5)
+
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        model = Model(model_dict)
+        model.executor = executor
+        assert model.jacobian_model == serial.jacobian_model
+        assert dict(model.hessian_model) == dict(serial.hessian_model)
+        for method in ['__call__', 'eval_jacobian', 'eval_hessian']:
+            result = getattr(model, method)(x=xdata, a=1.0, b=2.0, w=3.0)
+            expected = getattr(serial, method)(x=xdata, a=1.0, b=2.0, w=3.0)
+            for comp, exp_comp in zip(result, expected):
+                assert comp == pytest.approx(exp_comp)
+        # The code was generated by the executor, not by lambdify here.
+        func = model.numerical_components[0]
+        assert func.__code__.co_filename == '<lambdifygenerated>'
+
+        unpickled = pickle.loads(pickle.dumps(model))
+        assert unpickled.executor is None
+        assert unpickled == model
+
+    # Expressions are sent to the executor as strings, also those with the
+    # undefined functions of interdependent models.
+    jac_model = jacobian_from_model(serial, as_functions=True)
+    for expr in jac_model.function_dict.values():
+        derivative = _derivative_srepr(sympy.srepr(expr), sympy.srepr(a))
+        assert derivative is not None
+        assert _from_srepr(derivative, serial.params + serial.vars) == expr.diff(a)
@@ -1,6 +1,7 @@
 from __future__ import division, print_function
 import pytest
 import pickle
+import threading
 
 import numpy as np
 
@@ -13,6 +14,7 @@ from symfit.core.objectives import (
     VectorLeastSquares, LeastSquares, LogLikelihood, MinimizeModel,
     BaseIndependentObjective
 )
+from symfit.core.minimizers import BFGS
 from symfit.distributions import Exp
 
 # Overwrite the way Sum is printed by numpy just while testing. Is not
@@ -110,14 +112,60 @@ def test_LeastSquares():
 
     fit = Fit(chi2_exact, x=xdata, y=ydata, objective=MinimizeModel)
     fit_exact_result = fit.execute()
-    fit = Fit(model, x=xdata, y=ydata, absolute_sigma=True)
+    # Use the same minimizer for both, since the model is linear and would
+    # otherwise be solved in closed form.
+    fit = Fit(model, x=xdata, y=ydata, absolute_sigma=True, minimizer=BFGS)
     fit_num_result = fit.execute()
-    assert fit_exact_result.value(a) == fit_num_result.value(a)
-    assert fit_exact_result.value(b) == fit_num_result.value(b)
+    # Both sum the same terms, but in a different order.
+    assert fit_exact_result.value(a) == pytest.approx(fit_num_result.value(a))
+    assert fit_exact_result.value(b) == pytest.approx(fit_num_result.value(b))
     assert fit_exact_result.stdev(a) == pytest.approx(fit_num_result.stdev(a))
     assert fit_exact_result.stdev(b) == pytest.approx(fit_num_result.stdev(b))
 
 
+def test_LeastSquares_weights():
+    """
+    The weights are computed once, and the residuals are written into reused
+    buffers, without changing the result.
+    """
+    x, y = variables('x, y')
+    a, b = parameters('a, b')
+    model = Model({y: a * x ** 2 + b})
+    xdata = np.linspace(1, 10, 10)
+    ydata = 3 * xdata ** 2 + np.random.normal(0, 1, xdata.shape)
+    sigma = np.random.uniform(0.5, 1.5, xdata.shape)
+    ls = LeastSquares(model, data={x: xdata, y: ydata, model.sigmas[y]: sigma})
+
+    assert ls.weights[y] == pytest.approx(1 / sigma ** 2)
+    assert ls.weights[y].dtype == np.float64
+    assert ls.weights[y].flags['C_CONTIGUOUS']
+
+    f = model(x=xdata, a=2.5, b=1.0).y
+    chi2 = np.sum((f - ydata) ** 2 / sigma ** 2) / 2
+    jac = - np.sum(np.array([xdata ** 2, np.ones_like(xdata)])
+                   * (ydata - f) / sigma ** 2, axis=1)
+    assert ls(a=2.5, b=1.0) == pytest.approx(chi2)
+    assert ls.eval_jacobian(a=2.5, b=1.0) == pytest.approx(jac)
+    buffers = dict(ls._residual_buffers.buffers)
+    assert list(buffers) == [y]
+    # Repeated evaluations reuse the same buffers and give the same answer.
+    assert ls(a=2.5, b=1.0) == pytest.approx(chi2)
+    assert ls.eval_jacobian(a=2.5, b=1.0) == pytest.approx(jac)
+    for key, buffer in ls._residual_buffers.buffers.items():
+        assert buffers[key] is buffer
+    # Buffers are per thread, and not pickled.
+    thread = threading.Thread(target=ls, kwargs=dict(a=2.5, b=1.0))
+    thread.start()
+    thread.join()
+    assert ls._residual_buffers.buffers[y] is buffers[y]
+    assert pickle.loads(pickle.dumps(ls))(a=2.5, b=1.0) == pytest.approx(chi2)
+
+    # Complex evaluations, as used for complex step derivatives, still work.
+    assert ls(a=2.5 + 1e-20j, b=1.0).imag == pytest.approx(
+        1e-20 * np.sum(xdata ** 2 * (f - ydata) / sigma ** 2)
+    )
+
+
 def test_LogLikelihood():
     """
     Tests if the LeastSquares objective gives the right shapes of output by
@@ -182,6 +230,49 @@ def test_LogLikelihood():
     assert fit_exact_result.stdev(b) == pytest.approx(fit_num_result.stdev(b))
 
 
+def test_vectorized_jacobians():
+    """
+    The Jacobians of LogLikelihood and VectorLeastSquares reduce over all
+    parameters at once, and should agree with the per-parameter definition.
+    """
+    x, y, z = variables('x, y, z')
+    a, b, c = parameters('a, b, c')
+    np.random.seed(4)
+    xdata = np.random.uniform(0.5, 2, 20)
+    values = dict(a=1.2, b=0.7, c=0.3)
+
+    model = Model({y: exp(-a * x) * (b + c * x ** 2)})
+    ll = LogLikelihood(model, data={x: xdata, y: None})
+    f = model(x=xdata, **values).y
+    jac = model.eval_jacobian(x=xdata, **values).y
+    expected = [- np.nansum(df / f) for df in jac]
+    assert ll.eval_jacobian(**values) == pytest.approx(expected)
+    expected = [- np.nanmean(df / f) for df in jac]
+    assert ll.eval_jacobian(apply_func=np.nanmean, **values) == pytest.approx(expected)
+    # Custom functions are called once per parameter, with one argument.
+    expected = [- np.max(df / f) for df in jac]
+    assert ll.eval_jacobian(apply_func=lambda df: np.max(df),
+                            **values) == pytest.approx(expected)
+
+    model = Model({y: a * x ** 2 + b, z: c * x + a})
+    ydata, zdata = 3 * xdata ** 2 + 1, 2 * xdata + 3
+    sigma_y, sigma_z = np.full_like(xdata, 0.5), np.full_like(xdata, 2.0)
+    vls = VectorLeastSquares(model, data={
+        x: xdata, y: ydata, z: zdata,
+        model.sigmas[y]: sigma_y, model.sigmas[z]: sigma_z
+    })
+    ans = model(x=xdata, **values)
+    jac = model.eval_jacobian(x=xdata, **values)
+    chi = np.sqrt(((ydata - ans.y) / sigma_y) ** 2 + ((zdata - ans.z) / sigma_z) ** 2)
+    expected = - np.array([
+        (jac.y[i] * (ydata - ans.y) / sigma_y ** 2
+         + jac.z[i] * (zdata - ans.z) / sigma_z ** 2) / chi
+        for i in range(3)
+    ]).T
+    assert vls.eval_jacobian(**values).shape == (len(xdata), 3)
+    assert vls.eval_jacobian(**values) == pytest.approx(expected)
+
+
 def test_data_sanity():
     """
     Tests very basicly the data sanity for different objective types.
@@ -262,3 +353,121 @@ def test_LogLikelihood_global():
     assert eval_numerical.shape == tuple()  # Empty tuple -> scalar
     assert jac_numerical.shape == (3,)
     assert hess_numerical.shape == (3, 3,)
+
+
+def test_scan():
+    """
+    Scanning an objective over a grid gives the same values as evaluating it
+    point by point, also when evaluated in chunks.
+    """
+    a, b = parameters('a, b')
+    x, y = variables('x, y')
+    xdata = np.linspace(0, 10, 50)
+    random_state = np.random.RandomState(0)
+    ydata = 3 * xdata + 2 + random_state.normal(size=xdata.shape)
+    model = Model({y: a * x + b})
+    objective = LeastSquares(
+        model, {x: xdata, y: ydata, model.sigmas[y]: 0.5 * np.ones_like(xdata)}
+    )
+    a_values = np.linspace(2, 4, 7)
+    b_values = np.linspace(0, 4, 5)
+    expected = [[objective(a=a_value, b=b_value) for b_value in b_values]
+                for a_value in a_values]
+
+    scan = objective.scan({a: a_values, b: b_values})
+    assert scan.shape == (7, 5)
+    assert scan == pytest.approx(np.array(expected))
+    scan = objective.scan({a: a_values, b: b_values}, chunk_size=4)
+    assert scan == pytest.approx(np.array(expected))
+    scan = objective.scan({b: b_values}, a=3)
+    assert scan == pytest.approx([objective(a=3, b=b_value)
+                                  for b_value in b_values])
+
+    l = Parameter('l')
+    t = Variable('t')
+    likelihood = LogLikelihood(Model({y: Exp(t, l)}),
+                               {t: random_state.exponential(2, 20), y: None})
+    l_values = np.linspace(0.5, 4, 8)
+    assert likelihood.scan({l: l_values}) == pytest.approx(
+        [likelihood(l=l_value) for l_value in l_values]
+    )
+
+    with pytest.raises(ValueError):
+        objective.scan({Parameter('c'): a_values})
+
+
+def test_sample_weights():
+    """
+    Integer sample weights are equivalent to repeating data points.
+    """
+    a, b = parameters('a, b')
+    x, y = variables('x, y')
+    xdata = np.linspace(1, 10, 20)
+    random_state = np.random.RandomState(1)
+    ydata = 3 * xdata + 2 + random_state.normal(size=xdata.shape)
+    counts = random_state.randint(0, 3, size=xdata.shape)
+    repeated = np.repeat(np.arange(len(xdata)), counts)
+    model = Model({y: a * x + b})
+    values = dict(a=2.5, b=1.5)
+
+    for objective_type in [LeastSquares, VectorLeastSquares]:
+        objective = objective_type(model, {x: xdata, y: ydata,
+                                           model.sigmas[y]: np.ones(20)})
+        unweighted = objective(**values)
+        objective.sample_weights = counts
+        expected = objective_type(model, {x: xdata[repeated], y: ydata[repeated],
+                                          model.sigmas[y]: np.ones(len(repeated))})
+        assert np.sum(np.square(objective(**values))) == pytest.approx(
+            np.sum(np.square(expected(**values)))
+        )
+        if objective_type is LeastSquares:
+            assert objective.eval_jacobian(**values) == pytest.approx(
+                expected.eval_jacobian(**values)
+            )
+            assert objective.eval_hessian(**values) == pytest.approx(
+                expected.eval_hessian(**values)
+            )
+        objective.sample_weights = None
+        assert objective(**values) == pytest.approx(unweighted)
+
+    l = Parameter('l')
+    likelihood = LogLikelihood(Model({y: Exp(x, l)}), {x: xdata, y: None})
+    likelihood.sample_weights = counts
+    expected = LogLikelihood(Model({y: Exp(x, l)}), {x: xdata[repeated], y: None})
+    assert likelihood(l=0.5) == pytest.approx(expected(l=0.5))
+    assert likelihood.eval_jacobian(l=0.5) == pytest.approx(expected.eval_jacobian(l=0.5))
+    assert likelihood.eval_hessian(l=0.5) == pytest.approx(expected.eval_hessian(l=0.5))
+
+
+def test_ordered_parameters():
+    """
+    Evaluating an objective with the ordered parameters from a minimizer gives
+    the same as evaluating it by name, also with fixed parameters.
+    """
+    from symfit.core.argument import ParameterState
+
+    a, b, c = parameters('a, b, c')
+    x, y, z = variables('x, y, z')
+    xdata = np.linspace(0, 10, 50)
+    zdata = (3 * xdata + 2 + np.sin(xdata)) ** 2 + 1
+    model = Model({y: a * x + b, z: y ** 2 + c})
+    objective = LeastSquares(model, {x: xdata, z: zdata,
+                                     model.sigmas[z]: np.ones_like(xdata)})
+    values = dict(a=2.5, b=1.5, c=0.5)
+    assert objective([2.5, 1.5, 0.5]) == pytest.approx(objective(**values))
+    assert objective.eval_jacobian([2.5, 1.5, 0.5]) == pytest.approx(
+        objective.eval_jacobian(**values)
+    )
+    assert objective.eval_hessian([2.5, 1.5, 0.5]) == pytest.approx(
+        objective.eval_hessian(**values)
+    )
+    with pytest.raises(TypeError):
+        objective([2.5, 1.5])
+
+    objective.parameter_state = ParameterState(model.params).replace(
+        c, value=0.5, fixed=True
+    )
+    assert objective([2.5, 1.5]) == pytest.approx(objective(**values))
+    assert objective.eval_jacobian([2.5, 1.5]) == pytest.approx(
+        objective.eval_jacobian(a=2.5, b=1.5)
+    )
@@ -229,3 +229,57 @@ def test_cached_property():
         a.f
     # Should be returning from cache, so a.f is not actually called
     assert a.counter == 2
+
+
+def test_cached_property_threads():
+    """
+    When several threads ask for a cached property at once, it is computed
+    only once.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+    import time
+
+    class A(object):
+        def __init__(self):
+            self.counter = 0
+
+        @cached_property
+        def f(self):
+            self.counter += 1
+            time.sleep(0.01)
+            return object()
+
+    a = A()
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        values = list(executor.map(lambda _: a.f, range(16)))
+    assert a.counter == 1
+    assert all(value is values[0] for value in values)
+
+
+def test_cached_property_concurrent():
+    """
+    Different cached properties, or the same property of different
+    instances, are computed concurrently.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+    import threading
+
+    fast_done = threading.Event()
+
+    class A(object):
+        @cached_property
+        def slow(self):
+            # Only finishes in time if fast is not blocked by this.
+            return fast_done.wait(timeout=5)
+
+        @cached_property
+        def fast(self):
+            fast_done.set()
+            return True
+
+    a, b = A(), A()
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        slow = executor.submit(lambda: a.slow)
+        fast = executor.submit(lambda: b.fast)
+        assert fast.result() and slow.result()
+    assert a.slow and not cached_property._locks